@@ -0,0 +1,191 @@
+"""Run the benchmarks and compare them to a baseline, failing on regressions.
+
+Usage: python benchmarks/compare.py [--baseline FILE] [--results FILE]
+       [--tolerance T] [--repeat N] [--warmup N] [--processes N]
+       [--confirm N] [--write]
+
+The benchmarks run with the project spec, repetitions, processes and jobs of
+the baseline, benchmarks/baseline.json by default, unless --results points to
+the output of benchmarks/run.py to compare instead.
+
+Timings vary between processes, e.g. with hash randomization, and not only
+within them, so the benchmarks run in --processes new processes, 3 by default,
+one after the other, and the results of each benchmark are those of the
+process with its median throughput.
+
+A benchmark regresses if its throughput, that of its median time, is lower
+than that of the baseline by more than the tolerance, a fraction, 0.2 by
+default. Benchmarks that regress are run again in new processes, up to
+--confirm times, once by default, unless --results is used, and are only
+reported if they regress every time, so that noisy runs do not fail the
+comparison. Peak memory usage regresses if it is higher by more than the
+tolerance. The exit code is 1 if any regression is found.
+
+With --write, the results are written to the baseline file instead.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from generate import ProjectSpec
+from run import REPEAT, RunOptions, report, write_report
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+#: Default number of processes to run the benchmarks in.
+PROCESSES = 3
+
+
+def read_report(path: Path) -> dict[str, Any]:
+    with path.open(encoding="utf-8") as f:
+        data: dict[str, Any] = json.load(f)
+    return data
+
+
+def report_in_processes(
+    spec: ProjectSpec,
+    options: RunOptions,
+    processes: int,
+    *,
+    names: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Return the report of the benchmarks in *names*, all by default, run
+    in *processes* new processes, with the results of each benchmark from
+    the process with its median throughput."""
+    # Forked processes would share the hash seed of this process.
+    context = get_context("spawn")
+    reports = []
+    for _ in range(max(1, processes)):
+        with ProcessPoolExecutor(1, mp_context=context) as executor:
+            future = executor.submit(report, spec, options, names)
+            reports.append(future.result())
+    merged = {**reports[0], "processes": processes, "benchmarks": {}}
+    for name in reports[0]["benchmarks"]:
+        results = sorted(
+            (data["benchmarks"][name] for data in reports),
+            key=lambda result: result["rate"],
+        )
+        merged["benchmarks"][name] = results[(len(results) - 1) // 2]
+    peak_rss = [data["peak_rss"] for data in reports if data["peak_rss"]]
+    merged["peak_rss"] = statistics.median_low(peak_rss) if peak_rss else None
+    return merged
+
+
+def find_regressions(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> dict[str, str]:
+    """Print a comparison of *current* against *baseline* and return the
+    descriptions of the regressions found by benchmark name."""
+    regressions = {}
+    print(f"{'benchmark':<24} {'baseline':>14} {'current':>14}")
+    for name, old in baseline["benchmarks"].items():
+        new = current["benchmarks"].get(name)
+        if new is None:
+            continue
+        change = new["rate"] / old["rate"] - 1 if old["rate"] else 0.0
+        print(
+            f"{name:<24} {old['rate']:>14,.1f} {new['rate']:>14,.1f} "
+            f"{new['unit']:<8} {change:+7.1%}"
+        )
+        if change < -tolerance:
+            regressions[name] = f"{name}: {change:+.1%} {new['unit']}"
+    old_rss, new_rss = baseline.get("peak_rss"), current.get("peak_rss")
+    if old_rss and new_rss:
+        change = new_rss / old_rss - 1
+        print(
+            f"{'peak_rss':<24} {old_rss / 2**20:>14,.1f} {new_rss / 2**20:>14,.1f} "
+            f"{'MiB':<8} {change:+7.1%}"
+        )
+        if change > tolerance:
+            regressions["peak_rss"] = f"peak_rss: {change:+.1%}"
+    return regressions
+
+
+def confirm_regressions(
+    regressions: dict[str, str],
+    baseline: dict[str, Any],
+    rerun: Callable[[list[str]], dict[str, Any]],
+    tolerance: float,
+    rounds: int,
+) -> None:
+    """Run the benchmarks of *regressions* again with *rerun*, up to
+    *rounds* times, and remove those that do not regress every time."""
+    for _ in range(rounds):
+        names = [name for name in regressions if name in baseline["benchmarks"]]
+        if not names:
+            break
+        print(f"\nRunning {', '.join(names)} again to confirm the regressions:")
+        confirmation = rerun(names)
+        # Peak memory usage is only compared for all benchmarks.
+        confirmation["peak_rss"] = None
+        confirmed = find_regressions(baseline, confirmation, tolerance)
+        for name in names:
+            if name in confirmed:
+                regressions[name] = confirmed[name]
+            else:
+                del regressions[name]
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--results", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int)
+    parser.add_argument("--warmup", type=int)
+    parser.add_argument("--processes", type=int)
+    parser.add_argument("--confirm", type=int, default=1)
+    parser.add_argument("--write", action="store_true")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline.exists():
+        baseline = read_report(args.baseline)
+    elif not args.write:
+        sys.exit(f"{args.baseline}: Error: No such file or directory")
+    spec = ProjectSpec(**baseline["spec"]) if baseline else ProjectSpec()
+    options = RunOptions(
+        repeat=args.repeat or (baseline["repeat"] if baseline else REPEAT),
+        warmup=args.warmup or (baseline["warmup"] if baseline else 1),
+        jobs=baseline["jobs"] if baseline else 1,
+    )
+    processes = args.processes or (
+        baseline.get("processes", PROCESSES) if baseline else PROCESSES
+    )
+    if args.results is not None:
+        current = read_report(args.results)
+    else:
+        current = report_in_processes(spec, options, processes)
+    if args.write:
+        write_report(current, args.baseline)
+        return
+    assert baseline is not None
+    if baseline["spec"] != current["spec"]:
+        sys.exit("Error: the results and the baseline use different project specs")
+    regressions = find_regressions(baseline, current, args.tolerance)
+    if args.results is None:
+
+        def rerun(names: list[str]) -> dict[str, Any]:
+            return report_in_processes(spec, options, processes, names=names)
+
+        confirm_regressions(regressions, baseline, rerun, args.tolerance, args.confirm)
+    if regressions:
+        print(f"\nRegressions beyond a {args.tolerance:.0%} tolerance:")
+        for regression in regressions.values():
+            print(f"  {regression}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
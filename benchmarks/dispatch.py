@@ -0,0 +1,42 @@
+"""Measure how many AST nodes per second PythonIssueFinder walks.
+
+Usage: python benchmarks/dispatch.py [--spiders N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import ast
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+from generate import spider_module
+
+from scrapy_lint.context import InMemoryProject
+from scrapy_lint.linter import Linter, PythonIssueFinder
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("--spiders", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    source = spider_module(range(args.spiders))
+    tree = ast.parse(source)
+    nodes = sum(1 for _ in ast.walk(tree))
+    linter = Linter(project=InMemoryProject(Path("/project"), files={}))
+    best = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        finder = PythonIssueFinder(
+            linter.setting_checker, dispatcher=linter.node_dispatcher(linter.codes)
+        )
+        for _ in finder.iter_issues(tree):
+            pass
+        best = min(best, time.perf_counter() - start)
+    print(f"{nodes} nodes, {nodes / best:,.0f} nodes/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Generate a synthetic Scrapy project to benchmark scrapy-lint with.
+
+Usage: python benchmarks/generate.py DIRECTORY [--spiders N] [--settings K]
+       [--dict-size M] [--requirements R] [--scrapinghub VARIANT]
+
+The same options always generate the same files.
+"""
+
+from __future__ import annotations
+
+import random
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from pathlib import Path
+
+from scrapy_lint.data.settings import SETTINGS
+
+SPIDER = """
+class Spider{i}(Spider):
+    name = "spider{i}"
+    allowed_domains = ["example{i}.com"]
+    start_urls = ["https://example{i}.com/"]
+    custom_settings = {{"DOWNLOAD_DELAY": {i}, "CONCURRENT_REQUESTS": 8}}
+
+    def parse(self, response):
+        for item in response.css("div.item"):
+            title = item.css("h2::text").get()
+            if self.settings.getint("CLOSESPIDER_ITEMCOUNT") > {i}:
+                return
+            url = response.urljoin(item.attrib["href"])
+            yield {{"title": title, "url": url, "n": [x * 2 for x in range(3)]}}
+        yield Request(response.url, callback=self.parse, meta={{"page": {i}}})
+"""
+
+SCRAPINGHUB_YML = {
+    "stack": "stack: scrapy:2.13-20250721\nrequirements:\n  file: requirements.txt\n",
+    "stacks": (
+        "stacks:\n"
+        "  default: scrapy:2.13\n"
+        "  prod: scrapy:2.13-20250721\n"
+        "projects:\n"
+        "  default: 12345\n"
+        "  prod: 67890\n"
+        "requirements:\n"
+        "  file: requirements.txt\n"
+    ),
+    "image": "image: true\nrequirements:\n  file: requirements.txt\n",
+    "invalid": "stack: [scrapy:2.13\n",
+}
+
+VALUE_KINDS = ("int", "str", "bool", "typo", "lambda")
+
+# Requirements of real packages, to exercise checks that depend on them.
+KNOWN_REQUIREMENTS = [
+    "scrapy==2.13.3",
+    "scrapy-zyte-api==0.30.0",
+    "scrapy-poet==0.26.0",
+    "scrapy-playwright==0.0.43",
+    "scrapy-splash==0.11.1",
+    "scrapy-crawlera==1.7.2",
+    "itemadapter==0.11.0",
+    "parsel==1.10.0",
+]
+
+
+@dataclass(frozen=True)
+class ProjectSpec:
+    spiders: int = 100
+    #: Setting assignments in the settings module, besides FEEDS and
+    #: DOWNLOADER_MIDDLEWARES.
+    settings: int = 100
+    #: Keys of the FEEDS and DOWNLOADER_MIDDLEWARES dicts.
+    dict_size: int = 100
+    #: Lines in the requirements file.
+    requirements: int = 100
+    #: Key of SCRAPINGHUB_YML.
+    scrapinghub: str = "stack"
+    seed: int = 0
+
+
+def spider_module(spiders: range) -> str:
+    header = "from scrapy import Request, Spider\n"
+    return header + "".join(SPIDER.format(i=i) for i in spiders)
+
+
+def settings_module(spec: ProjectSpec) -> str:
+    rng = random.Random(spec.seed)  # noqa: S311
+    names = sorted(SETTINGS)
+    lines = ['BOT_NAME = "benchmark"', 'SPIDER_MODULES = ["benchmark.spiders"]']
+    for i in range(spec.settings):
+        name = rng.choice(names)
+        kind = VALUE_KINDS[i % len(VALUE_KINDS)]
+        if kind == "int":
+            value = repr(i)
+        elif kind == "str":
+            value = repr(f"value{i}")
+        elif kind == "bool":
+            value = repr(bool(i % 2))
+        elif kind == "typo":
+            # Unknown setting names, close to known ones, to exercise
+            # suggestions.
+            name = f"{name[:-1]}X"
+            value = repr(i)
+        else:
+            value = f"lambda: {i}"
+        lines.append(f"{name} = {value}")
+    feeds = ",\n".join(
+        f'    "s3://bucket/{i}/%(name)s.jsonl": {{"format": "jsonlines", '
+        f'"encoding": "utf8", "overwrite": {i % 2 == 0}}}'
+        for i in range(spec.dict_size)
+    )
+    lines.append(f"FEEDS = {{\n{feeds},\n}}")
+    middlewares = ",\n".join(
+        f'    "benchmark.middlewares.Middleware{i}": {i * 10}'
+        for i in range(spec.dict_size)
+    )
+    lines.append(f"DOWNLOADER_MIDDLEWARES = {{\n{middlewares},\n}}")
+    return "\n".join(lines) + "\n"
+
+
+def requirements_file(spec: ProjectSpec) -> str:
+    lines = KNOWN_REQUIREMENTS[: spec.requirements]
+    for i in range(spec.requirements - len(lines)):
+        if i % 10:
+            lines.append(f"package{i}==1.{i}.0")
+        else:
+            lines.append(f"package{i}>=1.{i}")
+    return "\n".join(lines) + "\n"
+
+
+def project_files(spec: ProjectSpec) -> dict[str, str]:
+    """Return the content of the files of the project of *spec* by path,
+    with a module per spider."""
+    files = {
+        "scrapy.cfg": "[settings]\ndefault = benchmark.settings\n",
+        "scrapinghub.yml": SCRAPINGHUB_YML[spec.scrapinghub],
+        "requirements.txt": requirements_file(spec),
+        "benchmark/__init__.py": "",
+        "benchmark/settings.py": settings_module(spec),
+        "benchmark/spiders/__init__.py": "",
+    }
+    for i in range(spec.spiders):
+        files[f"benchmark/spiders/spider{i}.py"] = spider_module(range(i, i + 1))
+    return files
+
+
+def generate_project(path: Path, spec: ProjectSpec) -> None:
+    for relative_path, content in project_files(spec).items():
+        file = path / relative_path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content, encoding="utf-8")
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("directory", type=Path)
+    defaults = ProjectSpec()
+    parser.add_argument("--spiders", type=int, default=defaults.spiders)
+    parser.add_argument("--settings", type=int, default=defaults.settings)
+    parser.add_argument("--dict-size", type=int, default=defaults.dict_size)
+    parser.add_argument("--requirements", type=int, default=defaults.requirements)
+    parser.add_argument(
+        "--scrapinghub", choices=SCRAPINGHUB_YML, default=defaults.scrapinghub
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+    spec = ProjectSpec(
+        spiders=args.spiders,
+        settings=args.settings,
+        dict_size=args.dict_size,
+        requirements=args.requirements,
+        scrapinghub=args.scrapinghub,
+        seed=args.seed,
+    )
+    generate_project(args.directory, spec)
+
+
+if __name__ == "__main__":
+    main()
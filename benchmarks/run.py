@@ -0,0 +1,298 @@
+"""Benchmark scrapy-lint on a synthetic Scrapy project.
+
+Usage: python benchmarks/run.py [--spiders N] [--settings K] [--dict-size M]
+       [--requirements R] [--repeat N] [--warmup N] [--jobs N] [--output FILE]
+
+Benchmarks:
+
+-   cold: lint the whole project without cache.
+-   warm: lint the whole project again with a primed cache.
+-   dispatch, settings, requirements, scrapinghub-*: lint a single file of
+    the project, in memory, with a new linter each time.
+-   suggestions: suggest setting names for unknown setting names, with a new
+    setting checker each time.
+
+Each benchmark runs --warmup times untimed, at least once, then --repeat
+times timed.
+Results are written as JSON, to standard output by default, with the best
+(min) and median times in seconds, the throughput of the median time, which
+varies less between runs than the best time, and the peak memory usage, so
+that they can be compared between commits, e.g. with benchmarks/compare.py.
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from generate import (
+    SCRAPINGHUB_YML,
+    ProjectSpec,
+    generate_project,
+    project_files,
+    spider_module,
+)
+
+from scrapy_lint.context import Context, InMemoryProject
+from scrapy_lint.finders.settings import SettingChecker
+from scrapy_lint.linter import Linter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection
+
+#: Minimum duration in seconds of each timing.
+MIN_SAMPLE_TIME = 0.05
+
+#: Default number of timings of each benchmark.
+REPEAT = 20
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    #: Number of timings of each benchmark.
+    repeat: int = REPEAT
+    #: Number of untimed runs of each benchmark before its timings, at least
+    #: one.
+    warmup: int = 1
+    #: Number of parallel jobs to lint whole projects with.
+    jobs: int = 1
+
+
+def measure(
+    function: Callable[[], object],
+    options: RunOptions,
+    count: int,
+    unit: str,
+) -> dict[str, Any]:
+    """Run *function* as many times as the warmup of *options*, then time
+    it as many times as their repeat.
+
+    Fast functions are called in a loop for each timing, enough times for it
+    to take at least :data:`MIN_SAMPLE_TIME`, and the time of a single call
+    is reported.
+
+    *count* is the number of *unit* items, e.g. files, that each call
+    processes, to report throughput.
+    """
+    elapsed = 0.0
+    for _ in range(max(1, options.warmup)):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+    loops = max(1, math.ceil(MIN_SAMPLE_TIME / elapsed)) if elapsed else 1
+    times = []
+    for _ in range(options.repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        times.append((time.perf_counter() - start) / loops)
+    median = statistics.median(times)
+    return {
+        "times": times,
+        "loops": loops,
+        "min": min(times),
+        "median": median,
+        "rate": count / median if median else 0.0,
+        "unit": f"{unit}/s",
+    }
+
+
+def lint_project(jobs: int, *, cache: bool) -> None:
+    for _ in Linter([Path()], jobs=jobs, cache=cache).lint():
+        pass
+
+
+def lint_in_memory(files: dict[str, str], path: str) -> Callable[[], None]:
+    def run() -> None:
+        project = InMemoryProject(Path("/project"), files={**files})
+        linter = Linter(project=project)
+        for _ in linter.lint_source(files[path], path):
+            pass
+
+    return run
+
+
+def suggest(names: list[str]) -> None:
+    checker = SettingChecker(Context(InMemoryProject(Path("/project"))))
+    for name in names:
+        checker.suggest_names(name)
+
+
+def count_nodes(source: str) -> int:
+    return sum(1 for _ in ast.walk(ast.parse(source)))
+
+
+def peak_rss() -> int | None:
+    """Return the peak resident set size in bytes of this process and its
+    children, or ``None`` if unknown."""
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # Windows
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Kilobytes on Linux, bytes on macOS.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_project_benchmarks(
+    spec: ProjectSpec, options: RunOptions, selected: Callable[[str], bool]
+) -> dict[str, Any]:
+    """Return the results of the selected benchmarks that lint a whole
+    project generated from *spec*."""
+    results: dict[str, Any] = {}
+    cwd = Path.cwd()
+    with tempfile.TemporaryDirectory() as directory:
+        generate_project(Path(directory), spec)
+        os.chdir(directory)
+        try:
+            files = len(Linter([Path()], cache=False).files)
+            if selected("cold"):
+                results["cold"] = measure(
+                    lambda: lint_project(options.jobs, cache=False),
+                    options,
+                    files,
+                    "files",
+                )
+            if selected("warm"):
+                # The warmup primes the cache.
+                results["warm"] = measure(
+                    lambda: lint_project(options.jobs, cache=True),
+                    options,
+                    files,
+                    "files",
+                )
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def run_file_benchmarks(
+    spec: ProjectSpec, options: RunOptions, selected: Callable[[str], bool]
+) -> dict[str, Any]:
+    """Return the results of the selected benchmarks that lint a single file
+    of a project generated from *spec*."""
+    results: dict[str, Any] = {}
+    project = project_files(replace(spec, spiders=0))
+    project["benchmark/spiders/all.py"] = spider_module(range(spec.spiders))
+    micro = {
+        "dispatch": "benchmark/spiders/all.py",
+        "settings": "benchmark/settings.py",
+    }
+    for name, path in micro.items():
+        if not selected(name):
+            continue
+        results[name] = measure(
+            lint_in_memory(project, path),
+            options,
+            count_nodes(project[path]),
+            "nodes",
+        )
+    if selected("requirements"):
+        results["requirements"] = measure(
+            lint_in_memory(project, "requirements.txt"),
+            options,
+            project["requirements.txt"].count("\n"),
+            "lines",
+        )
+    for variant, content in SCRAPINGHUB_YML.items():
+        if not selected(f"scrapinghub-{variant}"):
+            continue
+        variant_files = {**project, "scrapinghub.yml": content}
+        results[f"scrapinghub-{variant}"] = measure(
+            lint_in_memory(variant_files, "scrapinghub.yml"), options, 1, "files"
+        )
+    return results
+
+
+def run_benchmarks(
+    spec: ProjectSpec,
+    options: RunOptions,
+    names: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Return the results of the benchmarks in *names*, all by default."""
+
+    def selected(name: str) -> bool:
+        return names is None or name in names
+
+    results: dict[str, Any] = {}
+    if selected("cold") or selected("warm"):
+        results.update(run_project_benchmarks(spec, options, selected))
+    results.update(run_file_benchmarks(spec, options, selected))
+
+    unknown = [f"{name}X" for name in ("DOWNLOAD_DELAY", "FEEDS", "ITEM_PIPELINES")]
+    unknown *= max(1, spec.settings // len(unknown))
+    unknown = [f"{name}{index}" for index, name in enumerate(unknown)]
+    if selected("suggestions"):
+        results["suggestions"] = measure(
+            lambda: suggest(unknown), options, len(unknown), "names"
+        )
+    return results
+
+
+def report(
+    spec: ProjectSpec,
+    options: RunOptions,
+    names: Collection[str] | None = None,
+) -> dict[str, Any]:
+    """Return the results of the benchmarks in *names* of *spec*, all by
+    default, with the details needed to compare them to other results."""
+    benchmarks = run_benchmarks(spec, options, names)
+    return {
+        "python": platform.python_version(),
+        "spec": asdict(spec),
+        "repeat": options.repeat,
+        "warmup": options.warmup,
+        "jobs": options.jobs,
+        "peak_rss": peak_rss(),
+        "benchmarks": benchmarks,
+    }
+
+
+def write_report(data: dict[str, Any], path: Path | None) -> None:
+    if path is None:
+        json.dump(data, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    defaults = ProjectSpec()
+    parser.add_argument("--spiders", type=int, default=defaults.spiders)
+    parser.add_argument("--settings", type=int, default=defaults.settings)
+    parser.add_argument("--dict-size", type=int, default=defaults.dict_size)
+    parser.add_argument("--requirements", type=int, default=defaults.requirements)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--jobs", type=int, default=1)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    spec = ProjectSpec(
+        spiders=args.spiders,
+        settings=args.settings,
+        dict_size=args.dict_size,
+        requirements=args.requirements,
+    )
+    options = RunOptions(repeat=args.repeat, warmup=args.warmup, jobs=args.jobs)
+    write_report(report(spec, options), args.output)
+
+
+if __name__ == "__main__":
+    main()
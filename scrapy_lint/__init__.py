@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import re
 import sys
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from .linter import InputFileError, Linter
+from .errors import DaemonError, GitError, InputFileError
+from .output import ISSUE_WRITERS
 
 if TYPE_CHECKING:
     from collections.abc import Generator, Sequence
 
     from .issues import Issue
+    from .linter import Linter as Linter  # pylint: disable=useless-import-alias
+    from .profiling import Profiler
+
+#: The path that stands for standard input in the FILES argument.
+STDIN = Path("-")
+
+
+def __getattr__(name: str) -> Any:
+    # The linter is imported on demand, so that commands that do not lint in
+    # the current process, like daemon clients, start fast.
+    if name == "Linter":
+        from .linter import Linter  # noqa: PLC0415
+
+        return Linter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def issue_codes(value: str) -> list[int]:
+    """Parse a comma-separated list of rule codes, e.g. ``SCP27,SCP36``."""
+    codes = []
+    for code in value.split(","):
+        if not re.fullmatch(r"SCP\d+", code.strip()):
+            raise ArgumentTypeError(f"invalid rule code: {code!r}")
+        codes.append(int(code.strip()[3:]))
+    return codes
 
 
 def get_parser() -> ArgumentParser:
@@ -21,27 +48,268 @@ def get_parser() -> ArgumentParser:
         nargs="*",
         default=[Path().cwd()],
         metavar="FILES",
+        help="files or directories to lint, or - to lint standard input",
+    )
+    parser.add_argument(
+        "--stdin-filename",
+        type=Path,
+        default=Path("stdin.py"),
+        metavar="PATH",
+        help=(
+            "path of the file read from standard input, to find its project "
+            "data and ignored rules (default: stdin.py)"
+        ),
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="number of processes to use to lint files (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="do not read or write the issue cache",
+    )
+    parser.add_argument(
+        "--format",
+        choices=ISSUE_WRITERS,
+        default="text",
+        help="output format of the issues (default: text)",
+    )
+    parser.add_argument(
+        "--select",
+        type=issue_codes,
+        action="extend",
+        metavar="CODES",
+        help="only report issues of these comma-separated rules, e.g. SCP27,SCP36",
+    )
+    parser.add_argument(
+        "--ignore",
+        type=issue_codes,
+        action="extend",
+        metavar="CODES",
+        help="do not report issues of these comma-separated rules",
+    )
+    baseline = parser.add_mutually_exclusive_group()
+    baseline.add_argument(
+        "--baseline",
+        type=Path,
+        metavar="FILE",
+        help="do not report issues found in this baseline file",
+    )
+    baseline.add_argument(
+        "--write-baseline",
+        type=Path,
+        metavar="FILE",
+        help="write the issues found to this baseline file instead of reporting them",
+    )
+    changes = parser.add_mutually_exclusive_group()
+    changes.add_argument(
+        "--diff",
+        action="store_true",
+        help="only lint files with staged changes",
+    )
+    changes.add_argument(
+        "--since",
+        metavar="REF",
+        help="only lint files that changed since the REF git revision",
+    )
+    changes.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "lint files again whenever they change, reporting the issues that "
+            "appear and disappear, until interrupted"
+        ),
+    )
+    parser.add_argument(
+        "--monorepo",
+        action="store_true",
+        help=(
+            "lint the files of every Scrapy project found, each with the "
+            "project data of its nearest scrapy.cfg"
+        ),
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help=(
+            "lint through a running scrapy-lint daemon, started with "
+            "'scrapy-lint --start-daemon', or in this process if none is running"
+        ),
+    )
+    parser.add_argument(
+        "--start-daemon",
+        action="store_true",
+        help="run a daemon that lints files for --daemon calls, until stopped",
+    )
+    parser.add_argument(
+        "--lsp",
+        action="store_true",
+        help="run a language server on standard input and output, for editors",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="path of the Unix socket of the daemon",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print how long each phase and rule takes to standard error",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        metavar="FILE",
+        help="write how long each phase and rule takes to FILE, as JSON",
+    )
+    parser.add_argument(
+        "--trace",
+        type=Path,
+        metavar="FILE",
+        help="write a Chrome trace of the linting phases of each file to FILE",
     )
     return parser
 
 
-def lint(args: Sequence[str]) -> Generator[Issue]:
+def lint(args: Sequence[str], profiler: Profiler | None = None) -> Generator[Issue]:
+    from .linter import Linter  # noqa: PLC0415
+
     parser = get_parser()
     parsed_args = parser.parse_args(args)
-    linter = Linter.from_args(parsed_args)
+    stdin = reads_stdin(parsed_args)
+    if stdin:
+        if len(parsed_args.paths) > 1:
+            parser.error("- cannot be combined with other FILES")
+        if parsed_args.write_baseline:
+            parser.error("--write-baseline cannot be used with standard input")
+        # Only the project data is read from disk.
+        parsed_args.paths = []
+        parsed_args.cache = False
+    try:
+        linter = Linter.from_args(parsed_args, profiler=profiler)
+    except GitError as e:
+        parser.error(str(e))
+    if stdin:
+        source = sys.stdin.buffer.read()
+        yield from linter.lint_source(source, parsed_args.stdin_filename)
+        return
     yield from linter.lint()
 
 
+def reads_stdin(args: Namespace) -> bool:
+    return STDIN in args.paths
+
+
 def main(args: Sequence[str] | None = None) -> None:
     args = args if args is not None else sys.argv[1:]
+    issues = None
+    parser = get_parser()
+    parsed_args = parser.parse_args(args)
+    if parsed_args.start_daemon:
+        start_daemon(parser, parsed_args)
+        return
+    if parsed_args.lsp:
+        start_language_server(parser, parsed_args)
+        return
+    if parsed_args.watch:
+        start_watching(parser, parsed_args)
+        return
+    profiler = None
+    if parsed_args.profile or parsed_args.profile_json or parsed_args.trace:
+        from .profiling import Profiler  # noqa: PLC0415
+
+        profiler = Profiler(trace=parsed_args.trace is not None)
+    # The daemon cannot read the standard input of this process.
+    if parsed_args.daemon and profiler is None and not reads_stdin(parsed_args):
+        issues = lint_in_daemon(parsed_args, args)
+    if issues is None:
+        issues = lint(args, profiler)
+    writer = ISSUE_WRITERS[parsed_args.format](sys.stdout)
+    writer.start()
+    errors = ["linting was interrupted"]
     try:
         found_issues = False
-        for issue in lint(args):
+        for issue in issues:
             found_issues = True
-            print(issue)
-    except InputFileError as e:
+            writer.write(issue)
+    except (DaemonError, InputFileError) as e:
+        errors = [str(e)]
         print(e, file=sys.stderr)
         sys.exit(2)
     else:
+        errors = []
         if found_issues:
             sys.exit(1)
+    finally:
+        writer.finish(errors)
+        if profiler is not None:
+            write_profile(profiler, parsed_args)
+
+
+def lint_in_daemon(args: Namespace, raw_args: Sequence[str]) -> Generator[Issue] | None:
+    """Return the issues found by the daemon for *raw_args*, parsed into
+    *args*, or ``None`` if no daemon can be reached."""
+    from .daemon import default_socket_path, request_lint  # noqa: PLC0415
+
+    try:
+        socket_path = args.socket or default_socket_path()
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        return None
+    return request_lint(socket_path, raw_args)
+
+
+def set_options(parser: ArgumentParser, args: Namespace) -> set[str]:
+    """Return the destinations of the options of *args* that are not set to
+    their default values."""
+    defaults = vars(parser.parse_args([]))
+    return {name for name, value in vars(args).items() if value != defaults[name]}
+
+
+def start_daemon(parser: ArgumentParser, args: Namespace) -> None:
+    from .daemon import default_socket_path, serve  # noqa: PLC0415
+
+    if not set_options(parser, args) <= {"start_daemon", "socket"}:
+        parser.error("--start-daemon can only be combined with --socket")
+    try:
+        serve(args.socket or default_socket_path(), get_parser)
+    except DaemonError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
+
+def start_language_server(parser: ArgumentParser, args: Namespace) -> None:
+    from .lsp import LanguageServer  # noqa: PLC0415
+
+    if set_options(parser, args) != {"lsp"}:
+        parser.error("--lsp cannot be combined with other arguments")
+    LanguageServer(sys.stdout.buffer).run(sys.stdin.buffer)
+
+
+def start_watching(parser: ArgumentParser, args: Namespace) -> None:
+    from .watch import watch  # noqa: PLC0415
+
+    if reads_stdin(args) or args.write_baseline:
+        parser.error("--watch cannot be used with standard input or --write-baseline")
+    if args.format != "text":
+        parser.error("--watch only supports the text format")
+    try:
+        watch(args)
+    except InputFileError as e:
+        print(e, file=sys.stderr)
+        sys.exit(2)
+
+
+def write_profile(profiler: Profiler, args: Namespace) -> None:
+    if args.profile:
+        profiler.write_table(sys.stderr)
+    if args.profile_json:
+        with args.profile_json.open("w", encoding="utf-8") as stream:
+            profiler.write_json(stream)
+    if args.trace:
+        with args.trace.open("w", encoding="utf-8") as stream:
+            profiler.write_trace(stream)
@@ -0,0 +1,124 @@
+"""Linting from asyncio code without blocking the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections import deque
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+from scrapy_lint.baseline import write_baseline
+from scrapy_lint.linter import BaseLinter, Linter
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Iterable, Sequence
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from scrapy_lint.issues import Issue
+
+
+def _prepare(linter: BaseLinter) -> list[tuple[Linter, Path]]:
+    for project_linter in linter.project_linters():
+        project_linter.project.load()
+    return linter.linted_files()
+
+
+def _lint_file(linter: Linter, file: Path) -> tuple[list[Issue], list[str]]:
+    """Return the reported issues of *file*, read from the cache if possible,
+    and their baseline fingerprints if writing a baseline."""
+    cache_keys, cached_issues = linter.get_cached_issues([file])
+    issues: Iterable[Issue]
+    if file in cached_issues:
+        issues = cached_issues[file]
+    else:
+        issues = linter.lint_file(file)
+        if file in cache_keys:
+            issues = linter.iter_caching(cache_keys[file], issues)
+    fingerprints: list[str] = []
+    return list(linter.iter_reported(issues, file, fingerprints)), fingerprints
+
+
+def _save_caches(linter: BaseLinter) -> None:
+    for project_linter in linter.project_linters():
+        if project_linter.cache is not None:
+            project_linter.cache.save()
+
+
+async def alint_linter(
+    linter: BaseLinter,
+    *,
+    executor: Executor | None = None,
+    max_in_flight: int | None = None,
+) -> AsyncGenerator[Issue]:
+    """Yield the issues that :meth:`Linter.lint() <scrapy_lint.linter.Linter.lint>`
+    of *linter* yields, in the same order, running all disk access and
+    linting in *executor*.
+
+    *executor* defaults to the default executor of the event loop, a thread
+    pool. Threads share *linter* and its project data. Files are submitted
+    to it in linting order, with at most *max_in_flight* files, the number of
+    CPUs by default, submitted and not yet yielded at a time.
+
+    With a :class:`~concurrent.futures.ProcessPoolExecutor`, *linter* is
+    pickled once per file, which disables the issue cache and rebuilds the
+    compiled rule data for every file, so a thread pool is usually faster
+    unless files are large.
+
+    Closing or cancelling the generator cancels the files not yet started.
+    The issue cache and the baseline to write, if any, are only written once
+    all files are linted.
+    """
+    max_in_flight = max(1, max_in_flight or os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    linted_files = iter(await loop.run_in_executor(executor, _prepare, linter))
+    pending: deque[asyncio.Future[tuple[list[Issue], list[str]]]] = deque()
+    fingerprints: list[str] = []
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                item = next(linted_files, None)
+                if item is None:
+                    break
+                job = partial(_lint_file, *item)
+                pending.append(loop.run_in_executor(executor, job))
+            if not pending:
+                break
+            issues, file_fingerprints = await pending.popleft()
+            fingerprints.extend(file_fingerprints)
+            for issue in issues:
+                yield issue
+    finally:
+        for future in pending:
+            future.cancel()
+    if linter.options.baseline_output is not None:
+        save = partial(write_baseline, linter.options.baseline_output, fingerprints)
+        await loop.run_in_executor(executor, save)
+    await loop.run_in_executor(executor, _save_caches, linter)
+
+
+async def alint(
+    paths: Sequence[Path] = (),
+    *,
+    executor: Executor | None = None,
+    max_in_flight: int | None = None,
+    **kwargs: Any,
+) -> AsyncGenerator[Issue]:
+    """Yield the issues of the files in *paths*, like :meth:`Linter.lint()
+    <scrapy_lint.linter.Linter.lint>`, without blocking the event loop.
+
+    The :class:`~scrapy_lint.linter.Linter` is created in *executor* with
+    *paths* and *kwargs*, except *jobs*, since files are linted in parallel
+    by *executor* instead. See :func:`alint_linter` for the other
+    parameters.
+    """
+    loop = asyncio.get_running_loop()
+    create = partial(Linter, paths, jobs=1, **kwargs)
+    linter = await loop.run_in_executor(executor, create)
+    issues = alint_linter(linter, executor=executor, max_in_flight=max_in_flight)
+    try:
+        async for issue in issues:
+            yield issue
+    finally:
+        await issues.aclose()
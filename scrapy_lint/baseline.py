@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import TYPE_CHECKING
+
+from .errors import InputFileError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from .issues import Issue
+
+
+@dataclass
+class FingerprintState:
+    """State to compute the fingerprints of the issues of *file* with
+    :func:`issue_fingerprint`, in the order in which they are reported.
+
+    *content* is the content of *file*, read from disk by default.
+    """
+
+    file: Path
+    content: str | bytes | None = None
+    lines: list[str] | None = field(default=None, init=False)
+    occurrences: Counter[str] = field(default_factory=Counter, init=False)
+
+
+def issue_fingerprint(issue: Issue, state: FingerprintState) -> str:
+    """Return the fingerprint of *issue*, reported after the issues already
+    fingerprinted with *state*.
+
+    Fingerprints depend on the issue code, the path of the file relative to
+    the project root, the content of the issue line without whitespace, and
+    the number of issues with those same values reported before, but not on
+    line numbers, so that they survive unrelated changes to the file.
+    """
+    assert issue.file is not None
+    if state.lines is None:
+        # Issues may have been read from the cache, so the file content is
+        # only read once an issue needs it.
+        content = state.content
+        if content is None:
+            content = state.file.read_bytes()
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+        state.lines = content.splitlines()
+    line = ""
+    if 0 < issue.line <= len(state.lines):
+        line = "".join(state.lines[issue.line - 1].split())
+    key = f"{issue.code}\0{issue.file.as_posix()}\0{line}"
+    occurrence = state.occurrences[key]
+    state.occurrences[key] += 1
+    return sha256(f"{key}\0{occurrence}".encode()).hexdigest()[:16]
+
+
+def read_baseline(path: Path) -> frozenset[str]:
+    """Return the issue fingerprints of the baseline file at *path*."""
+    try:
+        content = path.read_text(encoding="utf-8")
+    except OSError as e:
+        raise InputFileError(e.strerror or str(e), path) from None
+    except UnicodeDecodeError as e:
+        raise InputFileError(str(e), path) from None
+    return frozenset(content.split())
+
+
+def write_baseline(path: Path, fingerprints: Iterable[str]) -> None:
+    """Write a baseline file with *fingerprints* to *path*, one per line,
+    sorted, so that changes to the file are easy to review."""
+    path.write_text("".join(f"{fingerprint}\n" for fingerprint in sorted(fingerprints)))
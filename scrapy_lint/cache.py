@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import TYPE_CHECKING, Any
+
+from scrapy_lint.issues import Issue, Pos
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from scrapy_lint.context import Project
+
+CACHE_DIR_NAME = ".scrapy_lint_cache"
+# Entries not used for this long are evicted.
+MAX_CACHE_AGE = 30 * 24 * 60 * 60
+# Size of the cache directory above which the least recently used cache files
+# and entries are evicted.
+MAX_CACHE_SIZE = 64 * 1024 * 1024
+# Cache hits only refresh the last-use time of an entry, forcing a write of the
+# cache file, if the entry was last used longer ago than this.
+CACHE_TOUCH_INTERVAL = 24 * 60 * 60
+
+CacheEntry = tuple[float, list[list[Any]]]
+
+
+def serialize_issue(issue: Issue) -> list[Any]:
+    return [issue.code, issue.summary, issue.detail, issue.line, issue.column]
+
+
+def deserialize_issue(data: list[Any]) -> Issue:
+    code, summary, detail, line, column = data
+    return Issue((code, summary), Pos(line, column), detail=detail)
+
+
+def project_key(project: Project, codes: Iterable[int]) -> str | None:
+    """Return a hash of everything outside a Python file that may affect the
+    issues reported for it, including the *codes* of the issues to report, or
+    None if the linter version is unknown."""
+    from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+    try:
+        linter_version = version("scrapy-lint")
+    except PackageNotFoundError:
+        return None
+    data = {
+        "linter": linter_version,
+        "python": list(sys.version_info[:2]),
+        "options": project.scrapy_lint_options,
+        "requirements_file": str(project.requirements_file),
+        "requirements": project.requirements_text,
+        "setting_modules": sorted(str(path) for path in project.setting_module_paths),
+        "scrapinghub": project.scrapy_cloud_config,
+        "codes": sorted(codes),
+    }
+    encoded = json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+    return sha256(encoded).hexdigest()
+
+
+class IssueCache:
+    """On-disk cache of the issues found in Python files.
+
+    Issues are stored per file, keyed by the relative path and the content of
+    the file, in a cache file specific to the project inputs that rules depend
+    on (see :func:`project_key`).
+    """
+
+    def __init__(self, project: Project, key: str):
+        self.project = project
+        self.dir = project.path / CACHE_DIR_NAME
+        self.file = self.dir / f"{key}.json"
+        self.entries: dict[str, CacheEntry] = {}
+        self.dirty = False
+        try:
+            data = json.loads(self.file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self.entries = {k: (v[0], v[1]) for k, v in data.items()}
+
+    @classmethod
+    def from_project(cls, project: Project, codes: Iterable[int]) -> IssueCache | None:
+        key = project_key(project, codes)
+        if key is None:
+            return None
+        return cls(project, key)
+
+    def file_key(self, file: Path) -> str:
+        content = file.read_bytes()
+        digest = sha256(str(file.relative_to(self.project.path)).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> list[Issue] | None:
+        if key not in self.entries:
+            return None
+        last_used, issues = self.entries[key]
+        now = time.time()
+        if now - last_used > CACHE_TOUCH_INTERVAL:
+            self.entries[key] = (now, issues)
+            self.dirty = True
+        return [deserialize_issue(issue) for issue in issues]
+
+    def set(self, key: str, issues: Iterable[Issue]) -> None:
+        self.entries[key] = (time.time(), [serialize_issue(i) for i in issues])
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache file if it changed, and evict old or excess
+        entries and cache files."""
+        if not self.dirty:
+            return
+        now = time.time()
+        size = 2
+        entries = {}
+        for key, entry in sorted(
+            self.entries.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            if now - entry[0] > MAX_CACHE_AGE:
+                break
+            entry_size = len(json.dumps(entry)) + len(key) + 5
+            if size + entry_size > MAX_CACHE_SIZE:
+                break
+            size += entry_size
+            entries[key] = entry
+        try:
+            self.dir.mkdir(exist_ok=True)
+            gitignore = self.dir / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("*\n", encoding="utf-8")
+            with NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.dir,
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                json.dump(entries, f, separators=(",", ":"))
+            Path(f.name).replace(self.file)
+        except OSError:
+            return
+        self.dirty = False
+        self.evict_files(size)
+
+    def evict_files(self, size: int) -> None:
+        """Remove other cache files of the cache directory that have not been
+        used for too long or that exceed the cache size limit, least recently
+        used first."""
+        now = time.time()
+        stats = []
+        for entry in os.scandir(self.dir):
+            if not entry.name.endswith(".json") or entry.path == str(self.file):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            stats.append((stat.st_mtime, stat.st_size, entry.path))
+        for mtime, file_size, path in sorted(stats, reverse=True):
+            if now - mtime <= MAX_CACHE_AGE and size + file_size <= MAX_CACHE_SIZE:
+                size += file_size
+                continue
+            with suppress(OSError):
+                Path(path).unlink()
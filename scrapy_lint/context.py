@@ -1,15 +1,13 @@
 from __future__ import annotations
 
+import os
 from collections import defaultdict
 from configparser import ConfigParser
-from dataclasses import dataclass
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
-
-from packaging.version import Version
-from ruamel.yaml import YAML
-from ruamel.yaml.error import YAMLError
+from typing import TYPE_CHECKING, Any, Optional
 
 try:
     import tomllib  # type: ignore[import-not-found]
@@ -17,18 +15,127 @@ except ImportError:  # Python < 3.11
     import tomli as tomllib
 
 from scrapy_lint.errors import InputFileError
-from scrapy_lint.requirements import iter_requirement_lines
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from packaging.requirements import Requirement
+    from packaging.version import Version
+
+    from scrapy_lint.settings import ResolvedSettings
+
+#: Names of the files of a project root whose changes may change the issues
+#: of any file of the project, besides the requirements file.
+PROJECT_INPUTS = ("pyproject.toml", "requirements.txt", "scrapinghub.yml", "scrapy.cfg")
+
+#: Modification time and size of a file, or ``None`` if it does not exist.
+FileState = Optional[tuple[int, int]]
+
+
+def file_state(path: Path) -> FileState:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass
+class YAMLDocument:
+    """YAML *text* parsed in round-trip mode, which keeps the position of
+    each key and value, or the parsing *error*."""
+
+    text: str
+    data: Any = None
+    error: str | None = None
+
+    @classmethod
+    def parse(cls, text: str) -> YAMLDocument:
+        from ruamel.yaml import YAML  # noqa: PLC0415
+        from ruamel.yaml.error import YAMLError  # noqa: PLC0415
+
+        try:
+            data = YAML(typ="rt").load(text)
+        except YAMLError as e:
+            return cls(text, error=str(e))
+        return cls(text, data)
+
+
+@dataclass
+class RequirementsDocument:
+    """Requirements file *text* parsed into the line number, canonical name
+    and requirement of each valid requirement line."""
+
+    text: str
+    lines: list[tuple[int, str, Requirement]]
+
+    @classmethod
+    def parse(cls, text: str) -> RequirementsDocument:
+        from scrapy_lint.requirements import iter_requirement_lines  # noqa: PLC0415
+
+        return cls(text, list(iter_requirement_lines(text.splitlines())))
 
 
 @dataclass
 class Project:
     path: Path
 
+    #: All cached properties, in dependency order: each only uses those
+    #: before it.
+    LOAD_ORDER = (
+        "scrapy_lint_options",
+        "scrapy_cloud_document",
+        "scrapy_cloud_config",
+        "requirements_file",
+        "requirements_text",
+        "requirements_document",
+        "_requirements",
+        "packages",
+        "frozen_requirements",
+        "resolved_settings",
+        "setting_module_paths",
+    )
+
+    def load(
+        self, measure: Callable[[str], AbstractContextManager[Any]] | None = None
+    ) -> None:
+        """Compute all cached properties of the project.
+
+        Used before sending the project to worker processes, so that project
+        files are read and parsed only once.
+
+        *measure*, if set, is called with the name of each property, and the
+        property is computed within the returned context manager. Properties
+        are computed in :data:`LOAD_ORDER`, so that the time of each only
+        includes its own work, not that of the properties it uses.
+        """
+        for name in self.LOAD_ORDER:
+            with measure(name) if measure else nullcontext():
+                getattr(self, name)
+
+    def input_files(self) -> list[Path]:
+        """Return the paths of the project inputs, i.e. the
+        :data:`PROJECT_INPUTS` of the project root and the requirements file,
+        whose changes may change the issues of any file of the project."""
+        paths = [self.path / name for name in PROJECT_INPUTS]
+        if self.requirements_file is not None:
+            paths.append(self.requirements_file)
+        return paths
+
+    def resolve(self, path: str | Path) -> Path:
+        """Return the absolute path of *path*, relative to the project root."""
+        return (self.path / path).resolve()
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def read_text(self, path: Path) -> str:
+        return path.read_text(encoding="utf-8")
+
     @cached_property
     def frozen_requirements(self) -> dict[str, Version]:
+        from packaging.version import Version  # noqa: PLC0415
+
         result = {}
         for name, requirements in self._requirements.items():
             for requirement in requirements:
@@ -43,10 +150,10 @@ class Project:
     @cached_property
     def scrapy_lint_options(self) -> dict[str, Any]:
         pyproject_path = self.path / "pyproject.toml"
-        if not pyproject_path.exists():
+        if not self.exists(pyproject_path):
             return {}
         try:
-            pyproject = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+            pyproject = tomllib.loads(self.read_text(pyproject_path))
         except (tomllib.TOMLDecodeError, UnicodeDecodeError) as e:
             raise InputFileError(str(e), pyproject_path) from None
         return pyproject.get("tool", {}).get("scrapy-lint", {})
@@ -60,8 +167,8 @@ class Project:
         requirements_file: Path | None
         path_str = self.scrapy_lint_options.get("requirements_file")
         if path_str is not None:
-            requirements_file = Path(path_str).resolve()
-            if requirements_file.exists():
+            requirements_file = self.resolve(path_str)
+            if self.exists(requirements_file):
                 return requirements_file
 
         # Check scrapinghub.yml for requirements file
@@ -80,69 +187,149 @@ class Project:
                     requirements_file_name,
                     str,
                 ):
-                    scrapinghub_requirements_file = Path(requirements_file_name)
-                    if scrapinghub_requirements_file.exists():
-                        return scrapinghub_requirements_file.resolve()
+                    scrapinghub_requirements_file = self.resolve(requirements_file_name)
+                    if self.exists(scrapinghub_requirements_file):
+                        return scrapinghub_requirements_file
 
         # Fall back to requirements.txt
-        requirements_file = Path("requirements.txt")
-        if requirements_file.exists():
-            return requirements_file.resolve()
+        requirements_file = self.resolve("requirements.txt")
+        if self.exists(requirements_file):
+            return requirements_file
 
         return None
 
     @cached_property
     def requirements_text(self) -> str | None:
-        if not self.requirements_file or not self.requirements_file.exists():
+        if not self.requirements_file or not self.exists(self.requirements_file):
             return None
 
         try:
-            return self.requirements_file.read_text(encoding="utf-8")
+            return self.read_text(self.requirements_file)
         except (OSError, UnicodeDecodeError):
             return None
 
     @cached_property
-    def scrapy_cloud_config(self) -> dict[str, Any] | None:
+    def scrapy_cloud_document(self) -> YAMLDocument | None:
         config_file = self.path / "scrapinghub.yml"
-        if not config_file.exists():
+        if not self.exists(config_file):
             return None
-        yaml_parser = YAML(typ="safe")
         try:
-            with config_file.open(encoding="utf-8") as f:
-                return yaml_parser.load(f)
-        except (UnicodeDecodeError, YAMLError):
+            return YAMLDocument.parse(self.read_text(config_file))
+        except UnicodeDecodeError:
+            return None
+
+    @cached_property
+    def scrapy_cloud_config(self) -> dict[str, Any] | None:
+        document = self.scrapy_cloud_document
+        if document is None or document.error is not None:
             return None
+        return document.data
+
+    def parse_scrapy_cloud_config(self, text: str) -> YAMLDocument:
+        """Return *text*, the content of ``scrapinghub.yml``, parsed.
+
+        If *text* is the content of the ``scrapinghub.yml`` file of the
+        project, the document parsed for the project is reused.
+        """
+        document = self.scrapy_cloud_document
+        if document is not None and document.text == text:
+            return document
+        return YAMLDocument.parse(text)
+
+    @cached_property
+    def requirements_document(self) -> RequirementsDocument | None:
+        if self.requirements_text is None:
+            return None
+        return RequirementsDocument.parse(self.requirements_text)
+
+    def parse_requirements(self, text: str) -> RequirementsDocument:
+        """Return *text*, the content of the requirements file, parsed.
+
+        If *text* is the content of the requirements file of the project, the
+        document parsed for the project is reused.
+        """
+        document = self.requirements_document
+        if document is not None and document.text == text:
+            return document
+        return RequirementsDocument.parse(text)
+
+    @cached_property
+    def resolved_settings(self) -> ResolvedSettings:
+        from scrapy_lint.settings import ResolvedSettings  # noqa: PLC0415
+
+        return ResolvedSettings.from_project(self)
 
     @cached_property
     def setting_module_paths(self) -> set[Path]:
         config_file = self.path / "scrapy.cfg"
         config = ConfigParser()
-        config.read(config_file)
+        if self.exists(config_file):
+            config.read_string(self.read_text(config_file))
         if "settings" not in config:
             return set()
         result = set()
         for module_path in config["settings"].values():
             parts = module_path.split(".")
             pkg_path = self.path.joinpath(*parts, "__init__.py")
-            if pkg_path.exists():
+            if self.exists(pkg_path):
                 result.add(pkg_path)
                 continue
             mod_path = self.path.joinpath(*parts[:-1], f"{parts[-1]}.py")
-            if mod_path.exists():
+            if self.exists(mod_path):
                 result.add(mod_path)
         return result
 
     @cached_property
     def _requirements(self) -> dict[str, list[Requirement]]:
-        content = self.requirements_text
-        if content is None:
+        if self.requirements_document is None:
             return {}
         result = defaultdict(list)
-        for _, name, requirement in iter_requirement_lines(content.splitlines()):
+        for _, name, requirement in self.requirements_document.lines:
             result[name].append(requirement)
         return result
 
 
+@dataclass
+class InMemoryProject(Project):
+    """Project whose files are given in memory instead of read from disk.
+
+    *files* maps paths relative to the project root, e.g. ``"scrapy.cfg"``, to
+    their content. *options* overrides the ``[tool.scrapy-lint]`` table of
+    ``pyproject.toml``.
+    """
+
+    files: dict[str, str | bytes] = field(default_factory=dict)
+    options: dict[str, Any] | None = None
+
+    @cached_property
+    def scrapy_lint_options(self) -> dict[str, Any]:
+        if self.options is not None:
+            return self.options
+        return super().scrapy_lint_options
+
+    def resolve(self, path: str | Path) -> Path:
+        return Path(os.path.normpath(self.path / path))
+
+    def exists(self, path: Path) -> bool:
+        return self._relative_path(path) in self._files
+
+    def read_text(self, path: Path) -> str:
+        content = self._files[self._relative_path(path)]
+        if isinstance(content, bytes):
+            return content.decode("utf-8")
+        return content
+
+    @cached_property
+    def _files(self) -> dict[str, str | bytes]:
+        return {
+            self._relative_path(self.resolve(path)): content
+            for path, content in self.files.items()
+        }
+
+    def _relative_path(self, path: Path) -> str:
+        return os.path.relpath(path, self.path)
+
+
 @dataclass
 class Context:
     project: Project
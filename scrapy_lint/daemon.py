@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from socketserver import StreamRequestHandler, UnixStreamServer
+from stat import S_ISDIR
+from tempfile import gettempdir
+from typing import TYPE_CHECKING, Any
+
+from scrapy_lint.context import FileState, file_state
+from scrapy_lint.errors import DaemonError, GitError, InputFileError
+from scrapy_lint.issues import Issue, Pos
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+    from collections.abc import Callable, Generator, Sequence
+
+    from scrapy_lint.finders.settings import SettingChecker
+
+
+def default_socket_path() -> Path:
+    """Return the path of the socket of the daemon of the current user.
+
+    It is in ``$XDG_RUNTIME_DIR``, or else in a ``scrapy-lint-<user ID>``
+    directory of the temporary directory, created if missing. Since the
+    temporary directory is shared with other users, that directory must only
+    be accessible by the current user, or :exc:`DaemonError` is raised.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "scrapy-lint.sock"
+    uid = os.getuid()
+    directory = Path(gettempdir()) / f"scrapy-lint-{uid}"
+    try:
+        directory.mkdir(mode=0o700, exist_ok=True)
+        stat = directory.lstat()
+    except OSError as e:
+        raise DaemonError(f"{directory}: {e.strerror or e}") from None
+    if not S_ISDIR(stat.st_mode) or stat.st_uid != uid or stat.st_mode & 0o077:
+        raise DaemonError(f"{directory} is not a private directory of the current user")
+    return directory / "daemon.sock"
+
+
+def serialize_issue(issue: Issue) -> dict[str, Any]:
+    return {
+        "code": issue.code,
+        "summary": issue.summary,
+        "detail": issue.detail,
+        "file": str(issue.file),
+        "line": issue.line,
+        "column": issue.column,
+    }
+
+
+def deserialize_issue(data: dict[str, Any]) -> Issue:
+    issue = Issue(
+        (data["code"], data["summary"]),
+        Pos(data["line"], data["column"]),
+        detail=data["detail"],
+    )
+    issue.file = Path(data["file"])
+    return issue
+
+
+@dataclass
+class ProjectState:
+    setting_checker: SettingChecker
+    inputs: tuple[FileState, ...]
+
+
+class LintRequestHandler(StreamRequestHandler):
+    server: LintServer
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:  # e.g. a check for a running daemon
+            return
+        request = json.loads(line)
+        old_cwd = Path.cwd()
+        try:
+            os.chdir(request["cwd"])
+            error = self.lint(request["args"])
+        finally:
+            os.chdir(old_cwd)
+        self.send({"error": error})
+
+    def lint(self, args: Sequence[str]) -> str | None:
+        """Send the issues found and return an error message, if any."""
+        from scrapy_lint.linter import Linter  # noqa: PLC0415
+
+        try:
+            parsed_args = self.server.get_parser().parse_args(args)
+            setting_checker = self.server.get_setting_checker(Path.cwd())
+            linter = Linter.from_args(parsed_args, setting_checker)
+            for issue in linter.lint():
+                self.send({"issue": serialize_issue(issue)})
+        except (GitError, InputFileError) as e:
+            return str(e)
+        except SystemExit:
+            return f"invalid arguments: {' '.join(args)}"
+        return None
+
+    def send(self, data: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(data).encode("utf-8") + b"\n")
+
+
+class LintServer(UnixStreamServer):
+    """Unix socket server that lints files on request.
+
+    Each connection sends a single JSON line with the working directory and
+    the command-line arguments of a scrapy-lint call, and gets back one JSON
+    line per issue followed by a JSON line with an error message, if any.
+
+    Requests are handled one at a time, their arguments parsed with a parser
+    from *get_parser*, built for each request since argument defaults depend
+    on the working directory. The project data of each project root is kept between requests
+    until one of the project inputs changes.
+    """
+
+    def __init__(
+        self, socket_path: Path, get_parser: Callable[[], ArgumentParser]
+    ) -> None:
+        self.get_parser = get_parser
+        self.projects: dict[Path, ProjectState] = {}
+        super().__init__(str(socket_path), LintRequestHandler)
+
+    def get_setting_checker(self, path: Path) -> SettingChecker:
+        state = self.projects.get(path)
+        if state is not None and state.inputs == self.project_inputs(
+            state.setting_checker
+        ):
+            return state.setting_checker
+        from scrapy_lint.context import Context, Project  # noqa: PLC0415
+        from scrapy_lint.finders.settings import SettingChecker  # noqa: PLC0415
+
+        setting_checker = SettingChecker(Context(Project(path)))
+        setting_checker.project.load()
+        inputs = self.project_inputs(setting_checker)
+        self.projects[path] = ProjectState(setting_checker, inputs)
+        return setting_checker
+
+    @staticmethod
+    def project_inputs(setting_checker: SettingChecker) -> tuple[FileState, ...]:
+        paths = setting_checker.project.input_files()
+        return tuple(file_state(path) for path in paths)
+
+
+def serve(socket_path: Path, get_parser: Callable[[], ArgumentParser]) -> None:
+    try:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(socket_path))
+    except OSError:
+        socket_path.unlink(missing_ok=True)
+    else:
+        raise DaemonError(f"a daemon is already listening on {socket_path}")
+
+    # Warm up imports and data.
+    importlib.import_module("scrapy_lint.linter")
+
+    def stop(*_: Any) -> None:
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        with LintServer(socket_path, get_parser) as server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        socket_path.unlink(missing_ok=True)
+
+
+def request_lint(socket_path: Path, args: Sequence[str]) -> Generator[Issue] | None:
+    """Send a lint request to the daemon listening on *socket_path* and return
+    a generator of the issues it finds, or None if no daemon is listening."""
+    client = socket.socket(socket.AF_UNIX)
+    request = {"cwd": str(Path.cwd()), "args": list(args)}
+    try:
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+    except OSError:
+        client.close()
+        return None
+    return iter_responses(client)
+
+
+def iter_responses(client: socket.socket) -> Generator[Issue]:
+    with client, client.makefile("rb") as responses:
+        while True:
+            try:
+                line = responses.readline()
+            except OSError:
+                line = b""
+            if not line:
+                raise DaemonError("the daemon closed the connection unexpectedly")
+            response = json.loads(line)
+            if "issue" not in response:
+                break
+            yield deserialize_issue(response["issue"])
+    if response["error"] is not None:
+        raise DaemonError(response["error"])
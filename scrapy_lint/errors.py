@@ -5,5 +5,21 @@ from pathlib import Path
 
 class InputFileError(ValueError):
     def __init__(self, message: str, file: Path):
-        message = f"{file.relative_to(Path.cwd())}: Error: {message}"
+        self.file = file
+        self.error = message
+        if file.is_relative_to(Path.cwd()):
+            file = file.relative_to(Path.cwd())
+        message = f"{file}: Error: {message}"
         super().__init__(message)
+
+    def __reduce__(self):
+        # Allow raising the exception from worker processes.
+        return type(self), (self.error, self.file)
+
+
+class GitError(RuntimeError):
+    pass
+
+
+class DaemonError(RuntimeError):
+    pass
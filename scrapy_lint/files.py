@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+    from pathlib import Path
+
+    from pathspec import GitIgnoreSpec
+
+    # Gitignore specs that apply to a directory, with the path, relative to
+    # the root of the walk, of the directory that each spec is relative to.
+    IgnoreSpecs = tuple[tuple[str, GitIgnoreSpec], ...]
+
+
+def find_git_root(path: Path) -> Path | None:
+    for directory in (path, *path.parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+def read_ignore_file(path: Path) -> GitIgnoreSpec | None:
+    # pathspec is only imported when walking directories, so that linting
+    # single files starts fast.
+    from pathspec import GitIgnoreSpec  # noqa: PLC0415
+
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    return GitIgnoreSpec.from_lines(lines)
+
+
+def is_ignored(path: str, specs: IgnoreSpecs, *, is_dir: bool) -> bool:
+    """Return whether *path*, relative to the root of the walk, is ignored by
+    *specs*.
+
+    As in git, the innermost spec with a pattern that matches *path* decides,
+    so a ``!`` pattern in a deeper .gitignore file re-includes a path that an
+    outer one ignores.
+    """
+    for base, spec in reversed(specs):
+        sub_path = path[len(base) + 1 :] if base else path
+        if is_dir:
+            sub_path += "/"
+        if spec.match_file(sub_path):
+            return True
+        if any(
+            pattern.include is False and pattern.match_file(sub_path) is not None
+            for pattern in spec.patterns
+        ):
+            return False
+    return False
+
+
+def ancestor_specs(top: Path, parts: Sequence[str]) -> IgnoreSpecs | None:
+    """Return the specs of .git/info/exclude and of the .gitignore files from
+    *top* down to the parent of the directory at *parts*, relative to *top*,
+    or None if that directory is ignored."""
+    specs: IgnoreSpecs = ()
+    exclude = read_ignore_file(top / ".git" / "info" / "exclude")
+    if exclude is not None:
+        specs += (("", exclude),)
+    directory = top
+    for index, part in enumerate(parts):
+        spec = read_ignore_file(directory / ".gitignore")
+        if spec is not None:
+            specs += (("/".join(parts[:index]), spec),)
+        if is_ignored("/".join(parts[: index + 1]), specs, is_dir=True):
+            return None
+        directory /= part
+    return specs
+
+
+def iter_python_files(path: Path, project_path: Path) -> Generator[Path]:
+    """Yield the Python files in the *path* directory, recursively.
+
+    Files and directories ignored by .gitignore files or by
+    .git/info/exclude are skipped, and ignored directories are not entered.
+    """
+    top = find_git_root(project_path) or project_path
+    try:
+        parts = path.resolve().relative_to(top).parts
+    except ValueError:
+        yield from _walk(path, "", ())
+        return
+    specs = ancestor_specs(top, parts)
+    if specs is None:
+        return
+    yield from _walk(path, "/".join(parts), specs)
+
+
+def _walk(directory: Path, rel_dir: str, specs: IgnoreSpecs) -> Generator[Path]:
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return
+    prefix = f"{rel_dir}/" if rel_dir else ""
+    if any(entry.name == ".gitignore" for entry in entries):
+        spec = read_ignore_file(directory / ".gitignore")
+        if spec is not None:
+            specs += ((rel_dir, spec),)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name == ".git":
+                continue
+            rel_path = f"{prefix}{entry.name}"
+            if not is_ignored(rel_path, specs, is_dir=True):
+                yield from _walk(directory / entry.name, rel_path, specs)
+        elif (
+            entry.name.endswith(".py")
+            and entry.is_file()
+            and not is_ignored(f"{prefix}{entry.name}", specs, is_dir=False)
+        ):
+            yield directory / entry.name
@@ -13,12 +13,11 @@ from scrapy_lint.issues import (
     UNSUPPORTED_REQUIREMENT,
     Issue,
     Pos,
+    finder_codes,
 )
-from scrapy_lint.requirements import iter_requirement_lines
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    from pathlib import Path
 
     from packaging.requirements import Requirement
 
@@ -26,6 +25,7 @@ if TYPE_CHECKING:
 
 
 class RequirementsIssueFinder:
+    CODES = finder_codes("RequirementsIssueFinder")
     REQUIRED_DEPENDENCIES = frozenset(
         {
             "cryptography",
@@ -69,15 +69,10 @@ class RequirementsIssueFinder:
     def __init__(self, context: Context):
         self.context = context
 
-    def lint(self, file: Path) -> Generator[Issue]:
+    def lint(self, requirements_text: str) -> Generator[Issue]:
+        document = self.context.project.parse_requirements(requirements_text)
         packages: set[str] = set()
-        try:
-            requirements_text = file.read_text(encoding="utf-8")
-        except UnicodeDecodeError:
-            return
-        for line_number, name, requirement in iter_requirement_lines(
-            requirements_text.splitlines(),
-        ):
+        for line_number, name, requirement in document.lines:
             packages.add(name)
             if name not in PACKAGES:
                 continue
@@ -18,22 +18,22 @@ from ast import (
     In,
     Lambda,
     Load,
-    Module,
     Name,
-    NodeVisitor,
     NotIn,
     Store,
     Subscript,
     alias,
     expr,
     keyword,
+    stmt,
 )
+from collections import Counter, defaultdict
 from contextlib import suppress
+from dataclasses import InitVar, dataclass, field
 from difflib import SequenceMatcher
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Union
 
-from packaging.version import Version
-
 from scrapy_lint.ast import (
     definition_column,
     extract_literal_value,
@@ -42,7 +42,6 @@ from scrapy_lint.ast import (
     iter_dict,
 )
 from scrapy_lint.data.addons import ADDONS
-from scrapy_lint.data.packages import PACKAGES
 from scrapy_lint.data.settings import (
     MAX_AUTOMATIC_SUGGESTIONS,
     MIN_AUTOMATIC_SUGGESTION_SCORE,
@@ -51,7 +50,6 @@ from scrapy_lint.data.settings import (
 )
 from scrapy_lint.issues import (
     BASE_SETTING_USE,
-    DEPRECATED_SETTING,
     IMPORTED_SETTING,
     IMPROPER_SETTING_DEFINITION,
     INCOMPLETE_PROJECT_THROTTLING,
@@ -63,18 +61,16 @@ from scrapy_lint.issues import (
     NON_PICKLABLE_SETTING,
     REDEFINED_SETTING,
     REDUNDANT_SETTING_VALUE,
-    REMOVED_SETTING,
     ROBOTS_TXT_IGNORED_BY_DEFAULT,
-    SETTING_NEEDS_UPGRADE,
     UNKNOWN_SETTING,
     UNNEEDED_SETTING_GET,
     WRONG_SETTING_METHOD,
     ZYTE_RAW_PARAMS,
     Issue,
     Pos,
+    finder_codes,
 )
 from scrapy_lint.settings import (
-    MAX_DEFAULT_VALUE_HISTORY,
     SETTING_GETTERS,
     SETTING_METHODS,
     SETTING_SETTERS,
@@ -83,21 +79,14 @@ from scrapy_lint.settings import (
     SETTING_UPDATERS,
     UNKNOWN_SETTING_VALUE,
     Setting,
-    UnknownSettingValue,
     getbool,
 )
-from scrapy_lint.versions import (
-    UNKNOWN_FUTURE_VERSION,
-    UNKNOWN_UNSUPPORTED_VERSION,
-    UnknownUnsupportedVersion,
-)
 
 from .types import TYPE_CHECKERS
 from .values import VALUE_CHECKERS
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-    from pathlib import Path
+    from collections.abc import Container, Generator, Iterable
 
     from scrapy_lint.context import Context
 
@@ -105,51 +94,102 @@ LineNumber = int
 IssueNode = Union[Constant, Name, keyword, ClassDef, FunctionDef, Import, ImportFrom]
 
 
+@dataclass
+class SettingScope:
+    """Per-file state of the code being visited that affects setting checks."""
+
+    in_update_pre_crawler_settings: bool = False
+    in_update_settings: bool = False
+
+
+@dataclass
+class SettingNameIndex:
+    """Setting *names* indexed to quickly find those similar to a given name.
+
+    :meth:`matches` returns the same result as computing the
+    :class:`~difflib.SequenceMatcher` ratio of the given name against every
+    setting name, but skips names whose length or characters make the minimum
+    ratio unreachable.
+    """
+
+    names: InitVar[Iterable[str]]
+    #: Names and their characters by name length. Read-only once built, so
+    #: that an index can be shared by threads.
+    by_length: dict[int, list[tuple[str, Counter[str]]]] = field(
+        default_factory=lambda: defaultdict(list), init=False
+    )
+
+    def __post_init__(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.by_length[len(name)].append((name, Counter(name)))
+
+    def matches(self, name: str, min_ratio: float) -> list[tuple[str, float]]:
+        """Return the indexed names whose ratio against *name* is at least
+        *min_ratio*, with that ratio."""
+        chars = Counter(name)
+        result = []
+        for length, candidates in self.by_length.items():
+            total = len(name) + length
+            # The ratio is 2.0 * matches / total, and the number of matches
+            # cannot exceed the length of either name or their number of
+            # common characters.
+            if 2.0 * min(len(name), length) / total < min_ratio:
+                continue
+            for candidate, candidate_chars in candidates:
+                common = sum((chars & candidate_chars).values())
+                if 2.0 * common / total < min_ratio:
+                    continue
+                ratio = SequenceMatcher(None, name, candidate).ratio()
+                if ratio >= min_ratio:
+                    result.append((candidate, ratio))
+        return result
+
+
 class SettingChecker:
+    CODES = finder_codes("SettingChecker")
+
     def __init__(self, context: Context) -> None:
         self.context = context
         self.project = context.project
         self.additional_known_settings = set(context.options.get("known-settings", []))
-        self.in_update_pre_crawler_settings = False
-        self.in_update_settings = False
+        self.suggestions: dict[str, list[str]] = {}
 
     def is_known_setting(self, name: str) -> bool:
         return name in SETTINGS or name in self.additional_known_settings
 
     def is_supported_setting(self, name: str) -> bool:
-        if not self.project.packages or name not in SETTINGS:
-            return True
-        setting = SETTINGS[name]
-        if setting.package not in self.project.frozen_requirements or (
-            not setting.versioning.added_in and not setting.versioning.deprecated_in
-        ):
-            return setting.package in self.project.packages
-        deprecated_in = setting.versioning.deprecated_in
-        if isinstance(deprecated_in, UnknownUnsupportedVersion):
-            deprecated_in = PACKAGES[setting.package].lowest_supported_version
-            assert deprecated_in
-        package_version = self.project.frozen_requirements[setting.package]
+        return self.project.resolved_settings.supported.get(name, True)
+
+    @cached_property
+    def suggestion_indexes(self) -> tuple[SettingNameIndex, SettingNameIndex]:
+        """Return indexes of supported setting names without and with a
+        ``_BASE`` suffix."""
+        candidates = [
+            candidate
+            for candidate in self.additional_known_settings | set(SETTINGS)
+            if self.is_supported_setting(candidate)
+        ]
         return (
-            not setting.versioning.added_in
-            or package_version >= setting.versioning.added_in
-        ) and (not deprecated_in or package_version < deprecated_in)
+            SettingNameIndex(c for c in candidates if not c.endswith("_BASE")),
+            SettingNameIndex(c for c in candidates if c.endswith("_BASE")),
+        )
 
     def suggest_names(self, unknown_name: str) -> list[str]:
+        if unknown_name not in self.suggestions:
+            self.suggestions[unknown_name] = self._suggest_names(unknown_name)
+        return self.suggestions[unknown_name]
+
+    def _suggest_names(self, unknown_name: str) -> list[str]:
         if unknown_name in PREDEFINED_SUGGESTIONS:
             return [
                 setting
                 for setting in PREDEFINED_SUGGESTIONS[unknown_name]
                 if self.is_supported_setting(setting)
             ]
-        matches = []
-        for candidate in self.additional_known_settings | set(SETTINGS):
-            if (
-                candidate.endswith("_BASE") and not unknown_name.endswith("_BASE")
-            ) or not self.is_supported_setting(candidate):
-                continue
-            ratio = SequenceMatcher(None, unknown_name, candidate).ratio()
-            if ratio >= MIN_AUTOMATIC_SUGGESTION_SCORE:
-                matches.append((candidate, ratio))
+        index, base_index = self.suggestion_indexes
+        matches = index.matches(unknown_name, MIN_AUTOMATIC_SUGGESTION_SCORE)
+        if unknown_name.endswith("_BASE"):
+            matches += base_index.matches(unknown_name, MIN_AUTOMATIC_SUGGESTION_SCORE)
         matches.sort(key=lambda x: (-x[1], x[0]))
         return [m[0] for m in matches[:MAX_AUTOMATIC_SUGGESTIONS]]
 
@@ -180,46 +220,22 @@ class SettingChecker:
             yield Issue(MISSING_SETTING_REQUIREMENT, pos, package)
 
     def check_setting_versioning(self, setting, pos: Pos) -> Generator[Issue]:
-        package = setting.package
-        added_in = setting.versioning.added_in
-        deprecated_in = setting.versioning.deprecated_in
-        removed_in = setting.versioning.removed_in
-        if not deprecated_in and not added_in:
-            return
-        version = self.project.frozen_requirements[package]
-        if added_in and version < added_in:
-            yield Issue(SETTING_NEEDS_UPGRADE, pos, f"added in {package} {added_in}")
-            return
-        if not deprecated_in:
-            return
-        if isinstance(deprecated_in, UnknownUnsupportedVersion):
-            deprecated_in = PACKAGES[package].lowest_supported_version
-            assert deprecated_in
-            if version < deprecated_in:
-                return
-            detail = f"deprecated in {package} {deprecated_in} or lower"
-        else:
-            if version < deprecated_in:
-                return
-            detail = f"deprecated in {package} {deprecated_in}"
-        if removed_in and version >= removed_in:
-            detail += f", removed in {removed_in}"
-            issue = REMOVED_SETTING
-        else:
-            issue = DEPRECATED_SETTING
-        if setting.versioning.sunset_guidance:
-            detail += f"; {setting.versioning.sunset_guidance}"
-        yield Issue(issue, pos, detail)
+        versioning_issues = self.project.resolved_settings.versioning_issues
+        if setting.name in versioning_issues:
+            issue_id, detail = versioning_issues[setting.name]
+            yield Issue(issue_id, pos, detail)
 
-    def check_dict(self, node: expr) -> Generator[Issue]:
+    def check_dict(
+        self, node: expr, scope: SettingScope, *, suggest: bool = True
+    ) -> Generator[Issue]:
         if not is_dict(node):
             return
         assert isinstance(node, (Call, Dict))
         for key, value in iter_dict(node):
             if not isinstance(key, Constant):
                 continue
-            yield from self.check_name(key)
-            yield from self.check_update(key)
+            yield from self.check_name(key, suggest=suggest)
+            yield from self.check_update(key, scope)
             if isinstance(key.value, str):
                 yield from self.check_value(key.value, value)
 
@@ -231,7 +247,13 @@ class SettingChecker:
         | ClassDef
         | FunctionDef
         | tuple[Import | ImportFrom, alias],
+        *,
+        suggest: bool = True,
     ) -> Generator[Issue]:
+        """Yield issues about the setting name of *node*.
+
+        If *suggest* is False, SCP27 issues do not suggest setting names.
+        """
         resolved_node: IssueNode
         name: Any
         if isinstance(node, tuple):
@@ -261,21 +283,30 @@ class SettingChecker:
         pos = Pos.from_node(resolved_node, column)
         if not self.is_known_setting(name):
             detail = None
-            if suggestions := self.suggest_names(name):
+            if suggest and (suggestions := self.suggest_names(name)):
                 detail = f"did you mean: {', '.join(suggestions)}?"
             yield Issue(UNKNOWN_SETTING, pos, detail)
             return
         yield from self.check_known_name(name, pos)
 
-    def check_update(self, node: keyword | Constant) -> Generator[Issue]:
+    def check_update(
+        self,
+        node: keyword | Constant,
+        scope: SettingScope,
+    ) -> Generator[Issue]:
         name = node.value if isinstance(node, Constant) else node.arg
         if not isinstance(name, str) or name not in SETTINGS:
             return
         setting = SETTINGS[name]
-        if setting.is_pre_crawler and not self.in_update_pre_crawler_settings:
+        if setting.is_pre_crawler and not scope.in_update_pre_crawler_settings:
             yield Issue(NO_OP_SETTING_UPDATE, Pos.from_node(node))
 
-    def check_method(self, name_node: Constant, call: Call) -> Generator[Issue]:
+    def check_method(
+        self,
+        name_node: Constant,
+        call: Call,
+        scope: SettingScope,
+    ) -> Generator[Issue]:
         func = call.func
         assert isinstance(func, Attribute)
         name = name_node.value
@@ -287,16 +318,17 @@ class SettingChecker:
         if (
             func.attr in SETTING_UPDATERS
             and setting.is_pre_crawler
-            and not self.in_update_pre_crawler_settings
+            and not scope.in_update_pre_crawler_settings
         ):
             yield Issue(NO_OP_SETTING_UPDATE, name_pos)
-        yield from self.check_wrong_setting_method(setting, call, name_pos)
+        yield from self.check_wrong_setting_method(setting, call, name_pos, scope)
 
     def check_wrong_setting_method(
         self,
         setting: Setting,
         call: Call,
         name_pos: Pos,
+        scope: SettingScope,
     ) -> Generator[Issue]:
         func = call.func
         assert isinstance(func, Attribute)
@@ -314,7 +346,7 @@ class SettingChecker:
         if setting.type in SETTING_TYPE_GETTERS:
             expected = SETTING_TYPE_GETTERS[setting.type]
             if func.attr != expected and (
-                expected != "getwithbase" or not self.in_update_settings
+                expected != "getwithbase" or not scope.in_update_settings
             ):
                 yield Issue(WRONG_SETTING_METHOD, pos, f"use {expected}()")
         elif func.attr not in {"get", "__getitem__"}:
@@ -331,7 +363,12 @@ class SettingChecker:
             else:
                 yield Issue(WRONG_SETTING_METHOD, pos, "use []")
 
-    def check_subscript(self, name: str, node: Subscript) -> Generator[Issue]:
+    def check_subscript(
+        self,
+        name: str,
+        node: Subscript,
+        scope: SettingScope,
+    ) -> Generator[Issue]:
         if name not in SETTINGS:
             return
         setting = SETTINGS[name]
@@ -341,7 +378,7 @@ class SettingChecker:
             and setting.type in SETTING_TYPE_GETTERS
             and (
                 SETTING_TYPE_GETTERS[setting.type] != "getwithbase"
-                or not self.in_update_settings
+                or not scope.in_update_settings
             )
         ):
             if isinstance(node.value, Name):
@@ -356,7 +393,7 @@ class SettingChecker:
         if (
             isinstance(node.ctx, (Store, Del))
             and setting.is_pre_crawler
-            and not self.in_update_pre_crawler_settings
+            and not scope.in_update_pre_crawler_settings
         ):
             column = getattr(node.slice, "col_offset", node.col_offset + 1)
             yield Issue(NO_OP_SETTING_UPDATE, Pos.from_node(node, column))
@@ -393,10 +430,15 @@ class SettingChecker:
 
 
 class SettingIssueFinder:
+    CODES = finder_codes("SettingChecker", "SettingIssueFinder")
     NON_METHOD_SETTINGS_CALLABLES = ("BaseSettings", "Settings", "overridden_settings")
 
-    def __init__(self, setting_checker: SettingChecker):
+    def __init__(self, setting_checker: SettingChecker, codes: Container[int]):
+        """Find setting issues, only suggesting names for unknown settings if
+        SCP27 is in *codes*."""
         self.setting_checker = setting_checker
+        self.scope = SettingScope()
+        self.suggest = UNKNOWN_SETTING[0] in codes
 
     def __call__(
         self,
@@ -416,17 +458,17 @@ class SettingIssueFinder:
             return
         if isinstance(node, FunctionDef):
             if node.name == "update_pre_crawler_settings":
-                self.setting_checker.in_update_pre_crawler_settings = True
+                self.scope.in_update_pre_crawler_settings = True
             elif node.name == "update_settings":
-                self.setting_checker.in_update_settings = True
+                self.scope.in_update_settings = True
             return
 
     def post_visit(self, node: Call | Compare | FunctionDef | Subscript) -> None:
         if isinstance(node, FunctionDef):
             if node.name == "update_pre_crawler_settings":
-                self.setting_checker.in_update_pre_crawler_settings = False
+                self.scope.in_update_pre_crawler_settings = False
             elif node.name == "update_settings":
-                self.setting_checker.in_update_settings = False
+                self.scope.in_update_settings = False
 
     def find_call_issues(self, node: Call) -> Generator[Issue]:
         if self.looks_like_setting_method(node.func):
@@ -457,8 +499,8 @@ class SettingIssueFinder:
                     value_or_default = kw.value
         if not name:
             return
-        yield from self.setting_checker.check_name(name)
-        yield from self.setting_checker.check_method(name, node)
+        yield from self.setting_checker.check_name(name, suggest=self.suggest)
+        yield from self.setting_checker.check_method(name, node, self.scope)
         if node.func.attr in SETTING_SETTERS:
             if isinstance(name.value, str) and value_or_default:
                 yield from self.setting_checker.check_value(
@@ -483,11 +525,15 @@ class SettingIssueFinder:
     def check_settings_callable(self, node: Call) -> Generator[Issue]:
         """Handle issues for calls that look like settings callables."""
         if node.args:
-            yield from self.setting_checker.check_dict(node.args[0])
+            yield from self.setting_checker.check_dict(
+                node.args[0], self.scope, suggest=self.suggest
+            )
             return
         for kw in node.keywords:
             if kw.arg in ("values", "settings"):
-                yield from self.setting_checker.check_dict(kw.value)
+                yield from self.setting_checker.check_dict(
+                    kw.value, self.scope, suggest=self.suggest
+                )
                 return
 
     def find_assign_issues(self, node: Assign) -> Generator[Issue]:
@@ -529,7 +575,7 @@ class SettingIssueFinder:
             and isinstance(node.left, Constant)
             and self.looks_like_settings_variable(node.comparators[0])
         ):
-            yield from self.setting_checker.check_name(node.left)
+            yield from self.setting_checker.check_name(node.left, suggest=self.suggest)
 
     def find_subscript_issues(self, node: Subscript) -> Generator[Issue]:
         if not self.looks_like_settings_variable(
@@ -537,8 +583,12 @@ class SettingIssueFinder:
         ) or not self.looks_like_setting_constant(node.slice):
             return
         if isinstance(node.slice, Constant) and isinstance(node.slice.value, str):
-            yield from self.setting_checker.check_name(node.slice)
-            yield from self.setting_checker.check_subscript(node.slice.value, node)
+            yield from self.setting_checker.check_name(node.slice, suggest=self.suggest)
+            yield from self.setting_checker.check_subscript(
+                node.slice.value,
+                node,
+                self.scope,
+            )
 
     def looks_like_settings_variable(self, value: expr) -> bool:
         while isinstance(value, Attribute):
@@ -551,95 +601,88 @@ class SettingIssueFinder:
         return isinstance(value, Constant) and isinstance(value.value, str)
 
 
-class SettingModuleIssueFinder(NodeVisitor):
-    def __init__(self, context: Context, file: Path, setting_checker: SettingChecker):
-        super().__init__()
-        self.context = context
-        self.file = file.absolute()
-        self.issues: list[Issue] = []
-        self.setting_checker = setting_checker
+class SettingModuleIssueFinder:
+    """Find issues specific to setting modules.
 
-    def check(self, tree: Module) -> Generator[Issue]:
-        self.visit(tree)
-        yield from self.issues
+    Instead of walking the module tree, it inspects the statements that
+    :class:`~scrapy_lint.linter.PythonIssueFinder` passes to
+    :meth:`visit_statement` during its walk: those of the module body and,
+    recursively, of the bodies of compound statements other than class and
+    function definitions.
+    """
 
-    def visit_Module(self, node: Module) -> None:  # pylint: disable=invalid-name
-        self.check_body_level_issues(node)
-        self.check_all_nodes_issues(node)
+    CODES = finder_codes("SettingChecker", "SettingModuleIssueFinder")
 
-    def check_body_level_issues(self, node: Module) -> None:
-        seen: dict[str, LineNumber] = {}
-        for child in node.body:
-            if isinstance(child, Assign):
-                seen = self.check_assignment_redefinition(child, seen)
-            elif isinstance(child, (ImportFrom, Import)):
-                self.check_import_statement(child)
+    def __init__(
+        self, context: Context, setting_checker: SettingChecker, codes: Container[int]
+    ):
+        """Find setting module issues, skipping checks that can only report
+        issues with codes missing from *codes*."""
+        self.context = context
+        self.setting_checker = setting_checker
+        self.suggest = UNKNOWN_SETTING[0] in codes
+        self.processor = SettingsModuleSettingsProcessor(setting_checker, codes)
+        self.seen: dict[str, LineNumber] = {}
+        self.held_issues: list[Issue] = []
+
+    def visit_statement(self, node: stmt, *, top_level: bool) -> Generator[Issue]:
+        """Yield the issues of *node* that only depend on the module body,
+        e.g. redefined or imported settings, and hold back its other issues
+        until :meth:`finish`, so that the former come first."""
+        if top_level:
+            yield from self.check_body_level_issues(node)
+        self.held_issues.extend(self.check_statement(node))
+
+    def finish(self) -> Generator[Issue]:
+        yield from self.held_issues
+        self.held_issues = []
+        yield from self.processor.iter_issues()
+
+    def check_statement(self, node: stmt) -> Generator[Issue]:
+        if isinstance(node, (ClassDef, FunctionDef)):
+            if not node.name.isupper():
+                return
+            pos = Pos.from_node(node, definition_column(node))
+            yield Issue(IMPROPER_SETTING_DEFINITION, pos)
+            yield from self.setting_checker.check_name(node, suggest=self.suggest)
+        elif isinstance(node, (Import, ImportFrom)):
+            self.processor.process_import(node)
+        elif isinstance(node, Assign):
+            yield from self.processor.process_assignment(node)
+
+    def check_body_level_issues(self, node: stmt) -> Generator[Issue]:
+        if isinstance(node, Assign):
+            yield from self.check_assignment_redefinition(node)
+        elif isinstance(node, (ImportFrom, Import)):
+            yield from self.check_import_statement(node)
 
-    def check_assignment_redefinition(
-        self,
-        node: Assign,
-        seen: dict[str, LineNumber],
-    ) -> dict[str, LineNumber]:
+    def check_assignment_redefinition(self, node: Assign) -> Generator[Issue]:
         for target in node.targets:
             if not (isinstance(target, Name) and target.id.isupper()):
                 continue
             name = target.id
             pos = Pos.from_node(node)
-            if name in seen:
-                detail = f"seen first at line {seen[name]}"
-                self.issues.append(Issue(REDEFINED_SETTING, pos, detail))
+            if name in self.seen:
+                detail = f"seen first at line {self.seen[name]}"
+                yield Issue(REDEFINED_SETTING, pos, detail)
                 continue
-            seen[name] = pos.line
-        return seen
+            self.seen[name] = pos.line
 
-    def check_import_statement(self, node: Import | ImportFrom) -> None:
+    def check_import_statement(self, node: Import | ImportFrom) -> Generator[Issue]:
         for import_alias in node.names:
             name = import_alias.asname if import_alias.asname else import_alias.name
             if not (name and name.isupper()):
                 continue
             pos = Pos.from_node(node, import_column(node, import_alias))
-            self.issues.append(Issue(IMPORTED_SETTING, pos))
-            for issue in self.setting_checker.check_name((node, import_alias)):
-                self.issues.append(issue)
-
-    def check_all_nodes_issues(self, node: Module) -> None:
-        processor = SettingsModuleSettingsProcessor(self.context, self.setting_checker)
-
-        def visit_nested_body(child) -> None:
-            visit_body(child.body)
-            for attr in ("orelse", "finalbody", "handlers"):
-                sub = getattr(child, attr, None)
-                if sub:
-                    if attr == "handlers":
-                        for handler in sub:
-                            visit_body(getattr(handler, "body", []))
-                    else:
-                        visit_body(sub)
-
-        def visit_body(body):
-            for child in body:
-                if isinstance(child, (ClassDef, FunctionDef)):
-                    if not child.name.isupper():
-                        continue
-                    pos = Pos.from_node(child, definition_column(child))
-                    self.issues.append(Issue(IMPROPER_SETTING_DEFINITION, pos))
-                    issue_generator = self.setting_checker.check_name(child)
-                    self.issues.extend(issue_generator)
-                elif isinstance(child, (Import, ImportFrom)):
-                    processor.process_import(child)
-                elif isinstance(child, Assign):
-                    issue_generator = processor.process_assignment(child)
-                    self.issues.extend(issue_generator)
-                elif hasattr(child, "body"):
-                    visit_nested_body(child)
-
-        visit_body(node.body)
-        self.issues.extend(processor.iter_issues())
+            yield Issue(IMPORTED_SETTING, pos)
+            yield from self.setting_checker.check_name(
+                (node, import_alias), suggest=self.suggest
+            )
 
 
 class SettingsModuleSettingsProcessor:
-    def __init__(self, context: Context, setting_checker: SettingChecker):
-        self.context = context
+    def __init__(self, setting_checker: SettingChecker, codes: Container[int]):
+        self.codes = codes
         self.seen_settings: set[str] = set()
         self.robotstxt_obey_values: list[tuple[bool, int, int]] = []
         self.redundant_values: list[tuple[str, int, int]] = []
@@ -648,13 +691,15 @@ class SettingsModuleSettingsProcessor:
         self.addon_settings: set[str] = set()
 
     def process_assignment(self, assignment: Assign) -> Generator[Issue]:
+        suggest = UNKNOWN_SETTING[0] in self.codes
         for target in assignment.targets:
             if not (isinstance(target, Name) and target.id.isupper()):
                 continue
-            yield from self.setting_checker.check_name(target)
+            yield from self.setting_checker.check_name(target, suggest=suggest)
             name = target.id
             self.seen_settings.add(name)
-            if name == "ADDONS":
+            # Add-on settings only matter for SCP34.
+            if name == "ADDONS" and MISSING_CHANGING_SETTING[0] in self.codes:
                 self.process_addons(assignment)
             yield from self.process_setting(name, assignment)
 
@@ -684,13 +729,14 @@ class SettingsModuleSettingsProcessor:
                 import_path = self.resolve_import_path(key)
             if import_path not in ADDONS:
                 continue
-            addon_settings = ADDONS[import_path].get_settings(self.context.project)
-            self.addon_settings |= addon_settings
+            resolved_settings = self.setting_checker.project.resolved_settings
+            self.addon_settings |= resolved_settings.addon_settings[import_path]
 
     def process_setting(self, name: str, assignment: Assign) -> Generator[Issue]:
         if name == "ROBOTSTXT_OBEY":
             self.process_robotstxt(assignment)
-        self.check_redundant_values(name, assignment)
+        if REDUNDANT_SETTING_VALUE[0] in self.codes:
+            self.check_redundant_values(name, assignment)
         yield from self.check_throttling(name, assignment)
         yield from self.setting_checker.check_value(name, assignment.value)
 
@@ -698,7 +744,7 @@ class SettingsModuleSettingsProcessor:
         if name not in SETTINGS:
             return
         setting_info = SETTINGS[name]
-        default_value = setting_info.get_default_value(self.context.project)
+        default_value = setting_info.get_default_value(self.setting_checker.project)
         if default_value is UNKNOWN_SETTING_VALUE:
             return
         setting_value, is_literal = extract_literal_value(assignment.value)
@@ -741,11 +787,16 @@ class SettingsModuleSettingsProcessor:
         self.robotstxt_obey_values.append((value, child.lineno, col_offset))
 
     def iter_issues(self) -> Generator[Issue]:
-        yield from self.validate_user_agent()
-        yield from self.validate_robotstxt()
-        yield from self.validate_throttling()
-        yield from self.validate_missing_changing_settings()
-        yield from self.validate_redundant_values()
+        validators = (
+            (NO_PROJECT_USER_AGENT, self.validate_user_agent),
+            (ROBOTS_TXT_IGNORED_BY_DEFAULT, self.validate_robotstxt),
+            (INCOMPLETE_PROJECT_THROTTLING, self.validate_throttling),
+            (MISSING_CHANGING_SETTING, self.validate_missing_changing_settings),
+            (REDUNDANT_SETTING_VALUE, self.validate_redundant_values),
+        )
+        for (code, _), validate in validators:
+            if code in self.codes:
+                yield from validate()
 
     def validate_user_agent(self) -> Generator[Issue]:
         if "USER_AGENT" not in self.seen_settings:
@@ -769,45 +820,11 @@ class SettingsModuleSettingsProcessor:
             yield Issue(INCOMPLETE_PROJECT_THROTTLING)
 
     def validate_missing_changing_settings(self) -> Generator[Issue]:
-        for name, setting in SETTINGS.items():
-            if (
-                name in self.seen_settings
-                or name.endswith("_BASE")
-                or name in self.addon_settings
-            ):
-                continue
-            default = setting.default_value
-            if isinstance(default, UnknownSettingValue):
-                continue
-            if not default or not default.history:
-                continue
-            history = default.history
-            assert len(history) == MAX_DEFAULT_VALUE_HISTORY
-            assert UNKNOWN_UNSUPPORTED_VERSION in history
-            old_value = history[UNKNOWN_UNSUPPORTED_VERSION]
-            if UNKNOWN_FUTURE_VERSION in history:
-                new_value = history[UNKNOWN_FUTURE_VERSION]
-                detail = (
-                    f"{name} changes from {old_value!r} to {new_value!r} in a "
-                    f"future version of {setting.package}"
-                )
-                issue = Issue(MISSING_CHANGING_SETTING, detail=detail)
-                yield issue
+        changes = self.setting_checker.project.resolved_settings.changes
+        for name, detail in changes.items():
+            if name in self.seen_settings or name in self.addon_settings:
                 continue
-            requirements = self.context.project.frozen_requirements
-            if not requirements or setting.package not in requirements:
-                continue
-            project_version = requirements[setting.package]
-            change_version, new_value = next(iter(history.items()))  # pylint: disable=stop-iteration-return
-            assert isinstance(change_version, Version)
-            if project_version >= change_version:
-                continue
-            detail = (
-                f"{name} changes from {old_value!r} to {new_value!r} in "
-                f"{setting.package} {change_version}"
-            )
-            issue = Issue(MISSING_CHANGING_SETTING, detail=detail)
-            yield issue
+            yield Issue(MISSING_CHANGING_SETTING, detail=detail)
 
     def validate_redundant_values(self) -> Generator[Issue]:
         for name, line, column in self.redundant_values:
@@ -816,24 +833,7 @@ class SettingsModuleSettingsProcessor:
             yield Issue(REDUNDANT_SETTING_VALUE, Pos(line, column))
 
     def is_changing_setting(self, name: str) -> bool:
-        assert name in SETTINGS
-        setting = SETTINGS[name]
-        default = setting.default_value
-        assert not isinstance(default, UnknownSettingValue)
-        if not default or not default.history:
-            return False
-        history = default.history
-        assert len(history) == MAX_DEFAULT_VALUE_HISTORY
-        assert UNKNOWN_UNSUPPORTED_VERSION in history
-        assert UNKNOWN_FUTURE_VERSION not in history
-        requirements = self.context.project.frozen_requirements
-        assert setting.package in requirements
-        project_version = requirements[setting.package]
-        change_version = next(
-            iter(k for k in history if k != UNKNOWN_UNSUPPORTED_VERSION),
-        )
-        assert isinstance(change_version, Version)
-        return project_version < change_version
+        return name in self.setting_checker.project.resolved_settings.changes
 
     def process_import(self, node: Import | ImportFrom) -> None:
         if isinstance(node, Import):
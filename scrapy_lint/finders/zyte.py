@@ -3,9 +3,6 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING, Any
 
-from ruamel.yaml import YAML, CommentedMap
-from ruamel.yaml.error import YAMLError
-
 from scrapy_lint.issues import (
     INVALID_SCRAPINGHUB_YML,
     NO_ROOT_REQUIREMENTS,
@@ -17,27 +14,37 @@ from scrapy_lint.issues import (
     UNEXISTING_REQUIREMENTS_FILE,
     Issue,
     Pos,
+    finder_codes,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Generator
-    from pathlib import Path
+
+    from ruamel.yaml import CommentedMap
+    from typing_extensions import TypeGuard
 
     from scrapy_lint.context import Context
 
 
+def is_mapping(value: Any) -> TypeGuard[CommentedMap]:
+    # Round-trip loading turns all mappings into CommentedMap objects, so
+    # checking for dict avoids importing ruamel.yaml before parsing.
+    return isinstance(value, dict)
+
+
 class ZyteCloudConfigIssueFinder:
+    CODES = finder_codes("ZyteCloudConfigIssueFinder")
+
     def __init__(self, context: Context):
         self.context = context
 
-    def lint(self, file: Path) -> Generator[Issue]:
-        yaml_parser = YAML(typ="rt")
-        try:
-            data = yaml_parser.load(file.read_text(encoding="utf-8"))
-        except YAMLError as e:
-            yield Issue(INVALID_SCRAPINGHUB_YML, detail=str(e))
+    def lint(self, text: str) -> Generator[Issue]:
+        document = self.context.project.parse_scrapy_cloud_config(text)
+        if document.error is not None:
+            yield Issue(INVALID_SCRAPINGHUB_YML, detail=document.error)
             return
-        if not isinstance(data, CommentedMap):
+        data = document.data
+        if not is_mapping(data):
             detail = "non-mapping root data structure"
             yield Issue(INVALID_SCRAPINGHUB_YML, detail=detail)
             return
@@ -62,7 +69,7 @@ class ZyteCloudConfigIssueFinder:
                 pos = self._get_value_position(data, key)
                 yield from self._check_requirements_value(value, pos)
             elif key == "stacks" and is_root:
-                if not isinstance(value, CommentedMap):
+                if not is_mapping(value):
                     pos = self._get_value_position(data, key)
                     yield Issue(INVALID_SCRAPINGHUB_YML, pos, "non-mapping stacks")
                 else:
@@ -70,7 +77,7 @@ class ZyteCloudConfigIssueFinder:
                         pos = self._get_key_position(value, stack_key)
                         yield Issue(NON_ROOT_STACK, pos)
                         yield from self._check_stack_value(value, stack_key)
-            if isinstance(value, CommentedMap):
+            if is_mapping(value):
                 yield from self.check_keys(value, is_root=False)
 
     def _get_key_position(self, data: CommentedMap, key: str) -> Pos:
@@ -95,7 +102,7 @@ class ZyteCloudConfigIssueFinder:
         requirements_value: Any,
         pos: Pos,
     ) -> Generator[Issue]:
-        if not isinstance(requirements_value, CommentedMap):
+        if not is_mapping(requirements_value):
             yield Issue(INVALID_SCRAPINGHUB_YML, pos, "non-mapping requirements")
             return
 
@@ -114,7 +121,7 @@ class ZyteCloudConfigIssueFinder:
 
         if self.context.project.path:
             requirements_path = self.context.project.path / file_value
-            if not requirements_path.exists():
+            if not self.context.project.exists(requirements_path):
                 yield Issue(UNEXISTING_REQUIREMENTS_FILE, pos)
             elif (
                 self.context.project.requirements_file
@@ -126,13 +133,13 @@ class ZyteCloudConfigIssueFinder:
         for key, value in data.items():
             if key == "image":
                 return True
-            if isinstance(value, CommentedMap) and self._has_image_key(value):
+            if is_mapping(value) and self._has_image_key(value):
                 return True
         return False
 
     def _has_stacks_default(self, data: CommentedMap) -> bool:
         return (
             "stacks" in data
-            and isinstance(data["stacks"], CommentedMap)
+            and is_mapping(data["stacks"])
             and "default" in data["stacks"]
         )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+from scrapy_lint.errors import GitError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def run_git(path: Path, *args: str) -> list[str]:
+    """Run a git command in *path* and return its NUL-separated output."""
+    try:
+        result = subprocess.run(  # noqa: S603
+            ["git", *args],  # noqa: S607
+            cwd=path,
+            capture_output=True,
+            check=True,
+            encoding="utf-8",
+        )
+    except FileNotFoundError:
+        raise GitError("git is not installed") from None
+    except subprocess.CalledProcessError as e:
+        message = e.stderr.strip().splitlines()[-1] if e.stderr.strip() else str(e)
+        raise GitError(message) from None
+    return [name for name in result.stdout.split("\0") if name]
+
+
+def changed_files(path: Path, ref: str | None = None) -> set[Path]:
+    """Return the absolute paths of the files under *path* that differ from
+    the *ref* git revision, including untracked files, or, if *ref* is None,
+    of the files with staged changes.
+
+    Deleted files are included.
+    """
+    # Outside a repository, git diff would compare paths instead of failing.
+    run_git(path, "rev-parse", "--git-dir")
+    diff_args = ["diff", "--name-only", "--relative", "-z"]
+    if ref is None:
+        names = run_git(path, *diff_args, "--cached", "--")
+    else:
+        names = run_git(path, *diff_args, ref, "--")
+        names += run_git(path, "ls-files", "--others", "--exclude-standard", "-z")
+    return {(path / name).resolve() for name in names}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -56,48 +57,116 @@ class Issue:
         return f"{self.file}:{self.line}:{self.column}: {self.message}"
 
 
-DISALLOWED_DOMAIN = (1, "disallowed domain")
-URL_IN_ALLOWED_DOMAINS = (2, "URL in allowed_domains")
-IMPROPER_RESPONSE_URL_JOIN = (3, "improper response URL join")
-IMPROPER_RESPONSE_SELECTOR = (4, "improper response selector")
-LAMBDA_CALLBACK = (5, "lambda callback")
-IMPROPER_FIRST_MATCH_EXTRACTION = (6, "improper first match extraction")
-REDEFINED_SETTING = (7, "redefined setting")
-NO_PROJECT_USER_AGENT = (8, "no project USER_AGENT")
-ROBOTS_TXT_IGNORED_BY_DEFAULT = (9, "robots.txt ignored by default")
-INCOMPLETE_PROJECT_THROTTLING = (10, "incomplete project throttling")
-IMPROPER_SETTING_DEFINITION = (11, "improper setting definition")
-IMPORTED_SETTING = (12, "imported setting")
-PARTIAL_FREEZE = (13, "incomplete requirements freeze")
-UNSUPPORTED_REQUIREMENT = (14, "unsupported requirement")
-INSECURE_REQUIREMENT = (15, "insecure requirement")
-UNMAINTAINED_REQUIREMENT = (16, "unmaintained requirement")
-REDUNDANT_SETTING_VALUE = (17, "redundant setting value")
-NO_ROOT_STACK = (18, "no root stack")
-NON_ROOT_STACK = (19, "non-root stack")
-STACK_NOT_FROZEN = (20, "stack not frozen")
-NO_ROOT_REQUIREMENTS = (21, "no root requirements")
-NON_ROOT_REQUIREMENTS = (22, "non-root requirements")
-INVALID_SCRAPINGHUB_YML = (23, "invalid scrapinghub.yml")
-MISSING_STACK_REQUIREMENTS = (24, "missing stack requirements")
-UNEXISTING_REQUIREMENTS_FILE = (25, "unexisting requirements.file")
-REQUIREMENTS_FILE_MISMATCH = (26, "requirements.file mismatch")
-UNKNOWN_SETTING = (27, "unknown setting")
-DEPRECATED_SETTING = (28, "deprecated setting")
-SETTING_NEEDS_UPGRADE = (29, "setting needs upgrade")
-REMOVED_SETTING = (30, "removed setting")
-MISSING_SETTING_REQUIREMENT = (31, "missing setting requirement")
-WRONG_SETTING_METHOD = (32, "wrong setting method")
-BASE_SETTING_USE = (33, "base setting use")
-MISSING_CHANGING_SETTING = (34, "missing changing setting")
-NO_OP_SETTING_UPDATE = (35, "no-op setting update")
-INVALID_SETTING_VALUE = (36, "invalid setting value")
-NON_PICKLABLE_SETTING = (37, "unpicklable setting value")
-LOW_PROJECT_THROTTLING = (38, "low project throttling")
-NO_CONTACT_INFO = (39, "no contact info")
-UNNEEDED_SETTING_GET = (40, "unneeded setting get")
-UNNEEDED_IMPORT_PATH = (41, "unneeded import path")
-UNNEEDED_PATH_STRING = (42, "unneeded path string")
-UNSUPPORTED_PATH_OBJECT = (43, "unsupported Path object")
-UNSAFE_META_COPY = (45, "unsafe meta copy")
-ZYTE_RAW_PARAMS = (46, "raw Zyte API params")
+#: Codes of the issues that each issue finder may report, by finder name.
+_FINDER_CODES: defaultdict[str, set[int]] = defaultdict(set)
+
+
+def issue_id(code: int, summary: str, *finders: str) -> tuple[int, str]:
+    """Return the ID of the issue with *code* and *summary*, recording that
+    the issue finders named *finders* may report it."""
+    for finder in finders:
+        _FINDER_CODES[finder].add(code)
+    return code, summary
+
+
+DISALLOWED_DOMAIN = issue_id(1, "disallowed domain", "UnreachableDomainIssueFinder")
+URL_IN_ALLOWED_DOMAINS = issue_id(
+    2, "URL in allowed_domains", "UrlInAllowedDomainsIssueFinder"
+)
+IMPROPER_RESPONSE_URL_JOIN = issue_id(
+    3, "improper response URL join", "find_url_join_issues"
+)
+IMPROPER_RESPONSE_SELECTOR = issue_id(
+    4, "improper response selector", "OldSelectorIssueFinder"
+)
+LAMBDA_CALLBACK = issue_id(5, "lambda callback", "LambdaCallbackIssueFinder")
+IMPROPER_FIRST_MATCH_EXTRACTION = issue_id(
+    6,
+    "improper first match extraction",
+    "find_get_first_by_index_issues",
+    "find_extract_then_index_issues",
+)
+REDEFINED_SETTING = issue_id(7, "redefined setting", "SettingModuleIssueFinder")
+NO_PROJECT_USER_AGENT = issue_id(8, "no project USER_AGENT", "SettingModuleIssueFinder")
+ROBOTS_TXT_IGNORED_BY_DEFAULT = issue_id(
+    9, "robots.txt ignored by default", "SettingModuleIssueFinder"
+)
+INCOMPLETE_PROJECT_THROTTLING = issue_id(
+    10, "incomplete project throttling", "SettingModuleIssueFinder"
+)
+IMPROPER_SETTING_DEFINITION = issue_id(
+    11, "improper setting definition", "SettingModuleIssueFinder"
+)
+IMPORTED_SETTING = issue_id(12, "imported setting", "SettingModuleIssueFinder")
+PARTIAL_FREEZE = issue_id(
+    13, "incomplete requirements freeze", "RequirementsIssueFinder"
+)
+UNSUPPORTED_REQUIREMENT = issue_id(
+    14, "unsupported requirement", "RequirementsIssueFinder"
+)
+INSECURE_REQUIREMENT = issue_id(15, "insecure requirement", "RequirementsIssueFinder")
+UNMAINTAINED_REQUIREMENT = issue_id(
+    16, "unmaintained requirement", "RequirementsIssueFinder"
+)
+REDUNDANT_SETTING_VALUE = issue_id(
+    17, "redundant setting value", "SettingModuleIssueFinder"
+)
+NO_ROOT_STACK = issue_id(18, "no root stack", "ZyteCloudConfigIssueFinder")
+NON_ROOT_STACK = issue_id(19, "non-root stack", "ZyteCloudConfigIssueFinder")
+STACK_NOT_FROZEN = issue_id(20, "stack not frozen", "ZyteCloudConfigIssueFinder")
+NO_ROOT_REQUIREMENTS = issue_id(
+    21, "no root requirements", "ZyteCloudConfigIssueFinder"
+)
+NON_ROOT_REQUIREMENTS = issue_id(
+    22, "non-root requirements", "ZyteCloudConfigIssueFinder"
+)
+INVALID_SCRAPINGHUB_YML = issue_id(
+    23, "invalid scrapinghub.yml", "ZyteCloudConfigIssueFinder"
+)
+MISSING_STACK_REQUIREMENTS = issue_id(
+    24, "missing stack requirements", "RequirementsIssueFinder"
+)
+UNEXISTING_REQUIREMENTS_FILE = issue_id(
+    25, "unexisting requirements.file", "ZyteCloudConfigIssueFinder"
+)
+REQUIREMENTS_FILE_MISMATCH = issue_id(
+    26, "requirements.file mismatch", "ZyteCloudConfigIssueFinder"
+)
+UNKNOWN_SETTING = issue_id(27, "unknown setting", "SettingChecker")
+DEPRECATED_SETTING = issue_id(28, "deprecated setting", "SettingChecker")
+SETTING_NEEDS_UPGRADE = issue_id(29, "setting needs upgrade", "SettingChecker")
+REMOVED_SETTING = issue_id(30, "removed setting", "SettingChecker")
+MISSING_SETTING_REQUIREMENT = issue_id(
+    31, "missing setting requirement", "SettingChecker"
+)
+WRONG_SETTING_METHOD = issue_id(32, "wrong setting method", "SettingChecker")
+BASE_SETTING_USE = issue_id(33, "base setting use", "SettingChecker")
+MISSING_CHANGING_SETTING = issue_id(
+    34, "missing changing setting", "SettingModuleIssueFinder"
+)
+NO_OP_SETTING_UPDATE = issue_id(35, "no-op setting update", "SettingChecker")
+INVALID_SETTING_VALUE = issue_id(36, "invalid setting value", "SettingChecker")
+NON_PICKLABLE_SETTING = issue_id(37, "unpicklable setting value", "SettingChecker")
+LOW_PROJECT_THROTTLING = issue_id(
+    38, "low project throttling", "SettingModuleIssueFinder"
+)
+NO_CONTACT_INFO = issue_id(39, "no contact info", "SettingChecker")
+UNNEEDED_SETTING_GET = issue_id(40, "unneeded setting get", "SettingIssueFinder")
+UNNEEDED_IMPORT_PATH = issue_id(41, "unneeded import path", "SettingChecker")
+UNNEEDED_PATH_STRING = issue_id(42, "unneeded path string", "SettingChecker")
+UNSUPPORTED_PATH_OBJECT = issue_id(43, "unsupported Path object", "SettingChecker")
+UNSAFE_META_COPY = issue_id(45, "unsafe meta copy", "RequestIssueFinder")
+ZYTE_RAW_PARAMS = issue_id(
+    46, "raw Zyte API params", "RequestIssueFinder", "SettingChecker"
+)
+
+
+def codes_of(*ids: tuple[int, str]) -> frozenset[int]:
+    """Return the codes of the specified issue IDs."""
+    return frozenset(code for code, _ in ids)
+
+
+def finder_codes(*finders: str) -> frozenset[int]:
+    """Return the codes of the issues that the issue finders named *finders*
+    may report."""
+    return frozenset().union(*(_FINDER_CODES[finder] for finder in finders))
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import ast
+import os
 import warnings
-from ast import NodeVisitor
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, replace
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Callable, Protocol
 
-from pathspec import GitIgnoreSpec
+from scrapy_lint.issues import Issue, finder_codes
 
-from scrapy_lint.issues import Issue
-
-from .context import Context, Project
+from .baseline import FingerprintState, issue_fingerprint, read_baseline, write_baseline
+from .cache import IssueCache
+from .context import Context, InMemoryProject, Project
 from .errors import InputFileError
+from .files import iter_python_files
 from .finders.domains import (
     UnreachableDomainIssueFinder,
     UrlInAllowedDomainsIssueFinder,
@@ -31,96 +36,583 @@ from .finders.settings import (
 )
 from .finders.unsupported import LambdaCallbackIssueFinder
 from .finders.zyte import ZyteCloudConfigIssueFinder
+from .profiling import FINDER, PHASE, Measurement, ProfiledModuleIssueFinder, Profiler
 
 if TYPE_CHECKING:
     from argparse import Namespace
-    from collections.abc import Generator, Sequence
+    from collections.abc import Generator, Iterable, Iterator, Sequence
 
     from .issues import Issue
 
 
+#: Minimum number of files to lint per worker process. Starting worker
+#: processes takes longer than linting a few files in the main process, so
+#: fewer files are linted with fewer processes, or in the main process.
+MIN_FILES_PER_JOB = 25
+
+# Linter instance of the current worker process, see Linter.lint_in_parallel.
+_worker_linter: BaseLinter | None = None
+
+
+def _init_worker(linter: BaseLinter) -> None:
+    global _worker_linter  # noqa: PLW0603  # pylint: disable=global-statement
+    _worker_linter = linter
+    if linter.profiler is not None:
+        # Only send back data recorded in the worker.
+        linter.use_profiler(linter.profiler.fresh())
+
+
+def _lint_file_in_worker(file: Path) -> tuple[list[Issue], Profiler | None]:
+    """Return the issues of *file* and, if profiling, the profiler data
+    recorded while linting it."""
+    assert _worker_linter is not None
+    issues = list(_worker_linter.lint_file(file))
+    profiler = _worker_linter.profiler
+    if profiler is not None:
+        _worker_linter.use_profiler(profiler.fresh())
+    return issues, profiler
+
+
 class IssueFinder(Protocol):  # pylint: disable=too-few-public-methods
     def __call__(self, node: ast.AST) -> Generator[Issue]: ...
 
 
-class PythonIssueFinder(NodeVisitor):
-    def __init__(self, setting_checker: SettingChecker):
-        super().__init__()
-        self.issues: list[Issue] = []
-        domain_issue_finder = UnreachableDomainIssueFinder()
-        lambda_callback_issue_finder = LambdaCallbackIssueFinder()
-        setting_issue_finder = SettingIssueFinder(setting_checker)
-
-        self.finders: dict[str, Sequence[IssueFinder]] = {
-            "Assign": [
-                lambda_callback_issue_finder,
-                OldSelectorIssueFinder(),
-                setting_issue_finder,
-                domain_issue_finder,
-                UrlInAllowedDomainsIssueFinder(),
-            ],
-            "Call": [
-                find_get_first_by_index_issues,
-                lambda_callback_issue_finder,
-                RequestIssueFinder(),
-                setting_issue_finder,
-                find_url_join_issues,
-            ],
-            "ClassDef": [
-                domain_issue_finder,
-            ],
-            "Compare": [
-                setting_issue_finder,
-            ],
-            "FunctionDef": [
-                setting_issue_finder,
-            ],
-            "Subscript": [
-                find_extract_then_index_issues,
-                setting_issue_finder,
-            ],
-        }
-        self.post_visitors = {
-            "FunctionDef": (setting_issue_finder,),
-        }
+class ModuleIssueFinder(Protocol):
+    def visit_statement(
+        self, node: ast.stmt, *, top_level: bool
+    ) -> Iterable[Issue]: ...
+
+    def finish(self) -> Iterable[Issue]: ...
+
+
+@dataclass(frozen=True)
+class PythonRule:
+    """Issue finder of Python files, the codes of the issues that it may
+    report, and the AST node types that it checks.
+
+    *create* returns the finder for a file given the setting checker of the
+    project and the issue codes to report. The finder is called with every
+    node of *node_types* before the children of the node are visited, and its
+    ``post_visit`` method is called with every node of *post_visit_node_types*
+    after its children are visited.
+    """
+
+    create: Callable[[SettingChecker, frozenset[int]], Any]
+    codes: frozenset[int]
+    node_types: tuple[type[ast.AST], ...]
+    post_visit_node_types: tuple[type[ast.AST], ...] = ()
+
+
+# For each node, finders are called in this order.
+PYTHON_RULES = (
+    PythonRule(
+        lambda *_: find_get_first_by_index_issues,
+        finder_codes("find_get_first_by_index_issues"),
+        (ast.Call,),
+    ),
+    PythonRule(
+        lambda *_: LambdaCallbackIssueFinder(),
+        finder_codes("LambdaCallbackIssueFinder"),
+        (ast.Assign, ast.Call),
+    ),
+    PythonRule(
+        lambda *_: OldSelectorIssueFinder(),
+        finder_codes("OldSelectorIssueFinder"),
+        (ast.Assign,),
+    ),
+    PythonRule(
+        lambda *_: RequestIssueFinder(),
+        finder_codes("RequestIssueFinder"),
+        (ast.Call,),
+    ),
+    PythonRule(
+        lambda *_: find_extract_then_index_issues,
+        finder_codes("find_extract_then_index_issues"),
+        (ast.Subscript,),
+    ),
+    PythonRule(
+        SettingIssueFinder,
+        SettingIssueFinder.CODES,
+        (ast.Assign, ast.Call, ast.Compare, ast.FunctionDef, ast.Subscript),
+        post_visit_node_types=(ast.FunctionDef,),
+    ),
+    PythonRule(
+        lambda *_: UnreachableDomainIssueFinder(),
+        finder_codes("UnreachableDomainIssueFinder"),
+        (ast.Assign, ast.ClassDef),
+    ),
+    PythonRule(
+        lambda *_: UrlInAllowedDomainsIssueFinder(),
+        finder_codes("UrlInAllowedDomainsIssueFinder"),
+        (ast.Assign,),
+    ),
+    PythonRule(
+        lambda *_: find_url_join_issues,
+        finder_codes("find_url_join_issues"),
+        (ast.Call,),
+    ),
+)
+
+# Codes of all the issues that scrapy-lint may report.
+ALL_CODES = frozenset().union(
+    *(rule.codes for rule in PYTHON_RULES),
+    SettingModuleIssueFinder.CODES,
+    ZyteCloudConfigIssueFinder.CODES,
+    RequirementsIssueFinder.CODES,
+)
+
+
+class NodeDispatcher:
+    """Mapping of AST node classes to the rules that check them, compiled
+    once for the issue *codes* to report and used to create the finders of
+    each file.
+
+    Rules that cannot report any issue with a code in *codes* are left out.
+    """
+
+    def __init__(
+        self,
+        codes: frozenset[int] = ALL_CODES,
+        rules: Sequence[PythonRule] = PYTHON_RULES,
+    ):
+        self.codes = codes
+        self.rules = [rule for rule in rules if rule.codes & codes]
+        rules = self.rules
+        self.node_rules = self.compile(rule.node_types for rule in rules)
+        self.post_visit_rules = self.compile(
+            rule.post_visit_node_types for rule in rules
+        )
+
+    @staticmethod
+    def compile(
+        rule_node_types: Iterable[tuple[type[ast.AST], ...]],
+    ) -> dict[type[ast.AST], tuple[int, ...]]:
+        """Return the indexes of the rules of each node type."""
+        node_rules: dict[type[ast.AST], list[int]] = {}
+        for index, node_types in enumerate(rule_node_types):
+            for node_type in node_types:
+                node_rules.setdefault(node_type, []).append(index)
+        return {node_type: tuple(indexes) for node_type, indexes in node_rules.items()}
+
+    def create_finders(
+        self, setting_checker: SettingChecker
+    ) -> tuple[
+        dict[type[ast.AST], tuple[IssueFinder, ...]],
+        dict[type[ast.AST], tuple[Callable[[Any], None], ...]],
+    ]:
+        """Return the finders and the post-visit hooks of each node type for
+        a new file."""
+        finders = [rule.create(setting_checker, self.codes) for rule in self.rules]
+        return (
+            {
+                node_type: tuple(finders[index] for index in indexes)
+                for node_type, indexes in self.node_rules.items()
+            },
+            {
+                node_type: tuple(finders[index].post_visit for index in indexes)
+                for node_type, indexes in self.post_visit_rules.items()
+            },
+        )
+
+
+# Kinds of nodes in the stack of PythonIssueFinder.iter_issues.
+_NODE = 0
+# Nodes within the statement bodies whose statements module finders inspect.
+_MODULE_BODY_NODE = 1
+_TOP_LEVEL_STATEMENT = 2
+# Nodes whose children have been visited, for post-visit hooks.
+_POST_VISIT = 3
+
+
+def _push_children(
+    push: Callable[[tuple[ast.AST, int]], None], node: ast.AST, kind: int
+) -> None:
+    """Push the child nodes of *node* with *kind* in reverse order, so that
+    they are popped in order."""
+    for field in reversed(node._fields):
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            for item in reversed(value):
+                if isinstance(item, ast.AST):
+                    push((item, kind))
+        elif isinstance(value, ast.AST) and field != "ctx":
+            # Expression contexts, like ast.Load, are never checked.
+            push((value, kind))
+
+
+class PythonIssueFinder:
+    """Find issues in a module tree, walking it once.
+
+    Finders from *dispatcher* are called for nodes of the types they check.
+    *module_finders* are passed the statements of the module body and,
+    recursively, of the bodies of compound statements other than class and
+    function definitions.
+
+    With a *profiler*, all finders record how long they take.
+    """
+
+    def __init__(
+        self,
+        setting_checker: SettingChecker,
+        module_finders: Sequence[ModuleIssueFinder] = (),
+        dispatcher: NodeDispatcher | None = None,
+        profiler: Profiler | None = None,
+    ):
+        self.module_finders = module_finders
+        dispatcher = dispatcher or NodeDispatcher()
+        self.finders, self.post_visitors = dispatcher.create_finders(setting_checker)
+        if profiler is not None:
+            self.finders = {
+                node_type: tuple(profiler.wrap(finder) for finder in finders)
+                for node_type, finders in self.finders.items()
+            }
+            self.post_visitors = {
+                node_type: tuple(profiler.wrap(hook) for hook in hooks)
+                for node_type, hooks in self.post_visitors.items()
+            }
+            self.module_finders = [
+                ProfiledModuleIssueFinder(finder, profiler) for finder in module_finders
+            ]
+
+    def iter_issues(self, tree: ast.Module) -> Generator[Issue]:
+        """Yield the issues of *tree* as they are found.
+
+        Issues of module finders are yielded before those of other finders,
+        so the latter are only yielded once the walk ends if there are module
+        finders.
+
+        Nodes are walked depth-first from an explicit stack, and are not
+        referenced once visited, so that the parts of *tree* already walked
+        can be freed before the walk ends if the caller does not keep a
+        reference to *tree*.
+        """
+        finders = self.finders
+        post_visitors = self.post_visitors
+        module_finders = self.module_finders
+        kind = _TOP_LEVEL_STATEMENT if module_finders else _NODE
+        held_issues: list[Issue] | None = [] if module_finders else None
+        stack: list[tuple[ast.AST, int]] = [
+            (child, kind) for child in reversed(tree.body)
+        ]
+        push = stack.append
+        del tree
+        while stack:
+            node, kind = stack.pop()
+            node_type = type(node)
+            if kind == _POST_VISIT:
+                for post_visit in post_visitors[node_type]:
+                    post_visit(node)
+                continue
+            if kind != _NODE and isinstance(node, ast.stmt):
+                yield from self.visit_module_statement(node, kind)
+                kind = _NODE
+                if hasattr(node, "body") and not isinstance(
+                    node, (ast.ClassDef, ast.FunctionDef)
+                ):
+                    kind = _MODULE_BODY_NODE
+            if node_type in finders:
+                for finder in finders[node_type]:
+                    if held_issues is None:
+                        yield from finder(node)
+                    else:
+                        held_issues.extend(finder(node))
+                if node_type in post_visitors:
+                    stack.append((node, _POST_VISIT))
+            _push_children(push, node, kind)
+        for module_finder in module_finders:
+            yield from module_finder.finish()
+        if held_issues is not None:
+            yield from held_issues
+
+    def visit_module_statement(self, node: ast.stmt, kind: int) -> Generator[Issue]:
+        """Yield the issues that module finders find in *node*, a statement
+        of the module body if *kind* is ``_TOP_LEVEL_STATEMENT``, or of the
+        body of a compound statement otherwise."""
+        top_level = kind == _TOP_LEVEL_STATEMENT
+        for module_finder in self.module_finders:
+            yield from module_finder.visit_statement(node, top_level=top_level)
+
+
+@dataclass
+class LintOptions:
+    """Options of the issues to report, shared by the linters of all
+    projects of a run.
+
+    *select* are the codes of the issues to report, all by default, and
+    *ignore* are codes of issues not to report, besides those of the
+    ``ignore`` and ``per-file-ignores`` options of each project.
+
+    Issues found in the *baseline* file are not reported. If
+    *baseline_output* is set, no issue is reported, and once all files are
+    linted, the fingerprints of the issues that would have been reported are
+    written to that path instead.
+
+    Reported issues have paths relative to *relative_to*, the project root
+    by default.
+    """
+
+    select: Iterable[int] | None = None
+    ignore: Iterable[int] = ()
+    baseline: Path | None = None
+    baseline_output: Path | None = None
+    relative_to: Path | None = None
+
+    @cached_property
+    def baseline_fingerprints(self) -> frozenset[str]:
+        """Return the fingerprints of the issues of the *baseline* file."""
+        if self.baseline is None:
+            return frozenset()
+        return read_baseline(self.baseline)
+
+
+class BaseLinter(ABC):
+    """Base class of linters, which lint the files of one or more projects
+    with a :class:`Linter` per project.
+
+    Subclasses must set :attr:`jobs`, :attr:`profiler` and :attr:`options`,
+    see :class:`Linter`.
+    """
+
+    jobs: int
+    profiler: Profiler | None
+    options: LintOptions
+
+    @abstractmethod
+    def project_linters(self) -> Sequence[Linter]:
+        """Return the linters of the projects whose files are linted, each
+        with its own files, cache and ignores."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def lint_file(self, file: Path) -> Generator[Issue]:
+        """Yield the issues of *file*, an absolute path returned by
+        :meth:`linted_files`, before applying ignores."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def lint_source(self, source: str | bytes, path: str | Path) -> Generator[Issue]:
+        """Yield the issues of *source*, the content of the file at *path*,
+        without reading that file from disk."""
+        raise NotImplementedError
+
+    def use_profiler(self, profiler: Profiler | None) -> None:
+        for linter in (self, *self.project_linters()):
+            linter.profiler = profiler
+
+    def linted_files(
+        self, changed: set[Path] | None = None
+    ) -> list[tuple[Linter, Path]]:
+        """Return the absolute paths of the files to lint, in linting order,
+        each with the linter of its project.
+
+        If *changed* is set, only files that may report different issues
+        because of changes to those files are returned, see
+        :meth:`select_changed_files`.
+        """
+        linted_files: list[tuple[Linter, Path]] = []
+        for linter in self.project_linters():
+            files = linter.files
+            if changed is not None:
+                files = linter.select_changed_files(linter.project, files, changed)
+            linted_files.extend((linter, file.resolve()) for file in files)
+        if len(self.project_linters()) > 1:
+            # Files of different projects are linted in path order.
+            linted_files.sort(key=lambda item: item[1])
+        return linted_files
+
+    def lint(self, changed: set[Path] | None = None) -> Generator[Issue]:
+        """Yield the issues of the files to lint, or only of those that
+        *changed* affects, see :meth:`linted_files`."""
+        linted_files = self.linted_files(changed)
+        cache_keys, cached_issues = self.find_cached_issues(linted_files)
+        file_issues = self.lint_files(
+            [file for _, file in linted_files if file not in cached_issues]
+        )
+        issues: Iterable[Issue] | None
+        fingerprints: list[str] = []
+        try:
+            for linter, file in linted_files:
+                issues = cached_issues.get(file)
+                if issues is None:
+                    issues = next(file_issues, None)
+                    assert issues is not None, f"{file} was not linted"
+                    if file in cache_keys:
+                        issues = linter.iter_caching(cache_keys[file], issues)
+                yield from linter.iter_reported(issues, file, fingerprints)
+            if self.options.baseline_output is not None:
+                write_baseline(self.options.baseline_output, fingerprints)
+        finally:
+            for linter in self.project_linters():
+                if linter.cache is not None:
+                    linter.cache.save()
+
+    def find_cached_issues(
+        self, linted_files: Sequence[tuple[Linter, Path]]
+    ) -> tuple[dict[Path, str], dict[Path, list[Issue]]]:
+        """Return the cache keys of *linted_files*, as returned by
+        :meth:`linted_files`, and the cached issues of those found in the
+        cache of their project."""
+        cache_keys: dict[Path, str] = {}
+        cached_issues: dict[Path, list[Issue]] = {}
+        for linter in self.project_linters():
+            files = [file for owner, file in linted_files if owner is linter]
+            project_cache_keys, project_cached_issues = linter.get_cached_issues(files)
+            cache_keys.update(project_cache_keys)
+            cached_issues.update(project_cached_issues)
+        return cache_keys, cached_issues
+
+    def lint_files(self, files: Sequence[Path]) -> Iterator[Iterable[Issue]]:
+        """Return an iterator of the issues of each of *files*, in order,
+        linted in worker processes if there are enough files."""
+        jobs = min(self.jobs, len(files) // MIN_FILES_PER_JOB)
+        if jobs > 1:
+            return self.lint_in_parallel(files, jobs)
+        return (self.lint_file(file) for file in files)
+
+    def lint_in_parallel(
+        self, files: Sequence[Path], jobs: int
+    ) -> Generator[Iterable[Issue]]:
+        """Yield the issues of each file, in order, linting files in a pool of
+        *jobs* worker processes.
+
+        The project is loaded before the linter is sent to the workers, so that
+        project files are parsed only once.
+        """
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        for linter in self.project_linters():
+            linter.project.load()
+        chunksize = max(1, len(files) // (jobs * 4))
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(self,),
+        )
+        try:
+            for issues, profiler in executor.map(
+                _lint_file_in_worker, files, chunksize=chunksize
+            ):
+                if profiler is not None:
+                    assert self.profiler is not None
+                    self.profiler.merge(profiler)
+                yield issues
+        finally:
+            executor.shutdown(cancel_futures=True)
+
 
-    def find_issues_visitor(self, visitor, node):
-        """Find issues for the provided visitor"""
-        for finder in self.finders[visitor]:
-            issues = finder(node)
-            if issues:
-                self.issues.extend(list(issues))
-        self.generic_visit(node)
-        for finder in self.post_visitors.get(visitor, ()):
-            assert hasattr(finder, "post_visit")
-            finder.post_visit(node)
-
-    def visit(self, node):
-        node_type = type(node).__name__
-        if node_type in self.finders:
-            self.find_issues_visitor(node_type, node)
-        else:
-            super().visit(node)
-
-
-class Linter:
+class Linter(BaseLinter):
     @classmethod
-    def from_args(cls, args: Namespace) -> Linter:
-        return cls(args.paths)
-
-    def __init__(self, paths: Sequence[Path]) -> None:
-        self.project = Project(Path().cwd())
-        self.context = Context(self.project)
-        self.files = self.resolve_files(self.project, paths)
-        self.setting_checker = SettingChecker(self.context)
-        self.ignores: set[int] = {
-            int(code[3:]) for code in self.project.scrapy_lint_options.get("ignore", [])
-        }
-        self.per_file_ignores: dict[Path, set[int]] = {
-            (self.project.path / file).resolve(): {int(code[3:]) for code in codes}
-            for file, codes in self.project.scrapy_lint_options.get(
-                "per-file-ignores", {}
-            ).items()
+    def from_args(
+        cls,
+        args: Namespace,
+        setting_checker: SettingChecker | None = None,
+        profiler: Profiler | None = None,
+    ) -> BaseLinter:
+        changed = None
+        if args.diff or args.since:
+            from .git import changed_files  # noqa: PLC0415
+
+            changed = changed_files(Path().cwd(), args.since)
+        options = LintOptions(
+            select=args.select,
+            ignore=args.ignore or (),
+            baseline=args.baseline,
+            baseline_output=args.write_baseline,
+        )
+        if args.monorepo:
+            return MonorepoLinter(
+                args.paths,
+                jobs=args.jobs,
+                cache=args.cache,
+                changed=changed,
+                options=options,
+                profiler=profiler,
+            )
+        return cls(
+            args.paths,
+            jobs=args.jobs,
+            cache=args.cache,
+            changed=changed,
+            setting_checker=setting_checker,
+            options=options,
+            profiler=profiler,
+        )
+
+    def __init__(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        paths: Sequence[Path] = (),
+        *,
+        jobs: int | None = None,
+        cache: bool = True,
+        changed: set[Path] | None = None,
+        setting_checker: SettingChecker | None = None,
+        project: Project | None = None,
+        options: LintOptions | None = None,
+        profiler: Profiler | None = None,
+    ) -> None:
+        """Prepare linting *paths*.
+
+        Files are linted in up to *jobs* worker processes, the number of CPUs
+        by default, with at least :data:`MIN_FILES_PER_JOB` files each, or
+        in the main process if there are not enough files for 2 processes.
+
+        *setting_checker* may be a setting checker for the current working
+        directory reused from an earlier linter, to reuse its project data.
+
+        *project* defaults to the project in the current working directory.
+        Use an :class:`~scrapy_lint.context.InMemoryProject` and
+        :meth:`lint_source` to lint without disk access.
+
+        *options* are the :class:`LintOptions` of the issues to report. Checks
+        that can only report issues that are not to be reported are skipped.
+
+        With a *profiler*, the linter records how long each phase of linting
+        and each issue finder takes, including those of worker processes.
+        The cache is then not used, so that all the work is measured.
+        """
+        self.profiler = profiler
+        if profiler is not None:
+            cache = False
+        self.jobs = jobs or os.cpu_count() or 1
+        if setting_checker is None:
+            project = project or Project(Path().cwd())
+            setting_checker = SettingChecker(Context(project))
+        self.setting_checker = setting_checker
+        self.options = options or LintOptions()
+        if profiler is not None:
+            with profiler.phase("project"):
+                self.project.load(lambda name: profiler.phase(f"project.{name}"))
+        with self.profile("discovery") as profile:
+            self.files = self.resolve_files(self.project, paths)
+            if changed is not None:
+                self.files = self.select_changed_files(
+                    self.project, self.files, changed
+                )
+            profile.count = len(self.files)
+        self.node_dispatchers: dict[frozenset[int], NodeDispatcher] = {}
+        self.cache = None
+        if cache and not isinstance(self.project, InMemoryProject):
+            self.cache = IssueCache.from_project(self.project, self.codes)
+
+    @property
+    def project(self) -> Project:
+        return self.setting_checker.project
+
+    @cached_property
+    def codes(self) -> frozenset[int]:
+        """Return the codes of the issues to report, before per-file
+        ignores."""
+        project_ignores = self.project.scrapy_lint_options.get("ignore", [])
+        ignores = {*self.options.ignore, *(int(code[3:]) for code in project_ignores)}
+        select = self.options.select
+        return frozenset(ALL_CODES if select is None else select) - ignores
+
+    @cached_property
+    def _per_file_ignores(self) -> dict[Path, set[int]]:
+        per_file_ignores = self.project.scrapy_lint_options.get("per-file-ignores", {})
+        return {
+            self.project.resolve(file): {int(code[3:]) for code in codes}
+            for file, codes in per_file_ignores.items()
         }
 
     @classmethod
@@ -130,12 +622,6 @@ class Linter:
         paths: Sequence[Path],
     ) -> Sequence[Path]:
         files = set()
-        spec = None
-        gitignore = project.path / ".gitignore"
-        if gitignore.exists():
-            spec = GitIgnoreSpec.from_lines(
-                gitignore.read_text(encoding="utf-8").splitlines(),
-            )
         for path in paths:
             if path.is_file():
                 files.add(path)
@@ -146,57 +632,338 @@ class Linter:
                     files.add(zyte_config_path)
                 if project.requirements_file and project.requirements_file.exists():
                     files.add(project.requirements_file)
-            for python_file_path in path.glob("**/*.py"):
-                if spec is None or not spec.match_file(
-                    python_file_path.relative_to(project.path),
-                ):
-                    files.add(python_file_path)
+            files.update(iter_python_files(path, project.path))
         return sorted(files)
 
-    def lint(self) -> Generator[Issue]:
-        for file in self.files:
-            absolute_file = file.resolve()
-            for issue in self.lint_file(absolute_file):
-                if self.is_ignored(issue, absolute_file):
+    @classmethod
+    def select_changed_files(
+        cls,
+        project: Project,
+        files: Sequence[Path],
+        changed: set[Path],
+    ) -> Sequence[Path]:
+        """Return the subset of *files* that may report different issues
+        because of changes to the *changed* files.
+
+        That is the changed files themselves, or all files if a project input
+        changed, i.e. pyproject.toml, scrapy.cfg, scrapinghub.yml or the
+        requirements file, since the issues of any file may depend on project
+        options, setting modules or requirements.
+        """
+        if changed.intersection(project.input_files()):
+            return files
+        return [file for file in files if file.resolve() in changed]
+
+    def profile(self, phase: str, **args: Any) -> AbstractContextManager[Measurement]:
+        """Return a context manager that times *phase* if profiling."""
+        if self.profiler is None:
+            return nullcontext(Measurement())
+        return self.profiler.phase(phase, **args)
+
+    def project_linters(self) -> Sequence[Linter]:
+        return (self,)
+
+    def iter_reported(
+        self,
+        issues: Iterable[Issue],
+        file: Path,
+        fingerprints: list[str],
+        content: str | bytes | None = None,
+    ) -> Generator[Issue]:
+        """Yield the *issues* of *file* that are neither ignored nor in the
+        baseline, or add their fingerprints to *fingerprints* instead if
+        writing a baseline.
+
+        *content* is the content of *file*, read from disk if needed by
+        default."""
+        options = self.options
+        baseline = options.baseline_fingerprints
+        state = None
+        if baseline or options.baseline_output is not None:
+            state = FingerprintState(file, content)
+        relative_to = options.relative_to or self.project.path
+        for issue in issues:
+            if self.is_ignored(issue, file):
+                continue
+            issue.file = Path(os.path.relpath(file, relative_to))
+            if state is not None:
+                fingerprint = issue_fingerprint(issue, state)
+                if options.baseline_output is not None:
+                    fingerprints.append(fingerprint)
                     continue
-                issue.file = absolute_file.relative_to(self.project.path)
-                yield issue
+                if fingerprint in baseline:
+                    continue
+            yield issue
+
+    def iter_caching(self, key: str, issues: Iterable[Issue]) -> Generator[Issue]:
+        """Yield *issues*, and cache them with *key* once all have been
+        yielded."""
+        assert self.cache is not None
+        cached = []
+        for issue in issues:
+            cached.append(issue)
+            yield issue
+        self.cache.set(key, cached)
+
+    def get_cached_issues(
+        self, files: Sequence[Path]
+    ) -> tuple[dict[Path, str], dict[Path, list[Issue]]]:
+        """Return the cache keys of *files* and the cached issues of those
+        found in the cache."""
+        cache_keys: dict[Path, str] = {}
+        cached_issues: dict[Path, list[Issue]] = {}
+        if self.cache is None:
+            return cache_keys, cached_issues
+        for file in files:
+            if file.suffix != ".py":
+                continue
+            key = self.cache.file_key(file)
+            cache_keys[file] = key
+            issues = self.cache.get(key)
+            if issues is not None:
+                cached_issues[file] = issues
+        return cache_keys, cached_issues
+
+    def file_codes(self, file: Path) -> frozenset[int]:
+        """Return the codes of the issues to report for *file*."""
+        if file in self._per_file_ignores:
+            return self.codes - self._per_file_ignores[file]
+        return self.codes
+
+    def node_dispatcher(self, codes: frozenset[int]) -> NodeDispatcher:
+        if codes not in self.node_dispatchers:
+            self.node_dispatchers[codes] = NodeDispatcher(codes)
+        return self.node_dispatchers[codes]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Worker processes do not use the cache, and build their own node
+        # dispatchers, since rules are not picklable.
+        return {**self.__dict__, "cache": None, "node_dispatchers": {}}
 
     def is_ignored(self, issue: Issue, file: Path) -> bool:
-        return issue.code in self.ignores or (
-            file in self.per_file_ignores and issue.code in self.per_file_ignores[file]
+        return issue.code not in self.codes or (
+            file in self._per_file_ignores
+            and issue.code in self._per_file_ignores[file]
         )
 
     def lint_file(self, file: Path) -> Generator[Issue]:
+        if not self.is_lintable(file):
+            return
+        if self.profiler is None:
+            yield from self.lint_content(file.read_bytes(), file)
+            return
+        path = os.path.relpath(file, self.project.path)
+        with self.profiler.phase("read", file=path):
+            content = file.read_bytes()
+        issues = self.lint_content(content, file)
+        yield from self.profiler.iter_timed(PHASE, "lint", issues, file=path)
+
+    def lint_source(self, source: str | bytes, path: str | Path) -> Generator[Issue]:
+        """Yield the issues of *source*, the content of the file at *path*,
+        relative to the project root, without reading that file from disk.
+
+        With an :class:`~scrapy_lint.context.InMemoryProject`, no file is read
+        from disk at all.
+
+        Issues in the baseline are not reported.
+        """
+        file = self.project.resolve(path)
+        issues = self.lint_content(source, file)
+        yield from self.iter_reported(issues, file, [], source)
+
+    def is_lintable(self, file: Path) -> bool:
+        return (
+            file.suffix == ".py"
+            or file.name == "scrapinghub.yml"
+            or file == self.project.requirements_file
+        )
+
+    def lint_content(self, content: str | bytes, file: Path) -> Generator[Issue]:
+        """Yield the issues of *content*, the content of *file*, before
+        applying ignores."""
+        if not self.is_lintable(file):
+            return
+        if isinstance(content, bytes):
+            try:
+                content = content.decode("utf-8")
+            except UnicodeDecodeError as e:
+                if file.suffix != ".py" and file.name != "scrapinghub.yml":
+                    return  # Requirements file.
+                raise InputFileError(str(e), file) from None
+        codes = self.file_codes(file)
         if file.suffix == ".py":
-            yield from self.lint_python_file(file)
+            yield from self.lint_python_source(content, file, codes)
         elif file.name == "scrapinghub.yml":
-            yield from ZyteCloudConfigIssueFinder(self.context).lint(file)
-        elif (
-            self.project.requirements_file is not None
-            and file == self.project.requirements_file
+            if ZyteCloudConfigIssueFinder.CODES & codes:
+                zyte_finder = ZyteCloudConfigIssueFinder(self.setting_checker.context)
+                yield from self.iter_timed(zyte_finder, zyte_finder.lint(content))
+        elif RequirementsIssueFinder.CODES & codes:
+            requirements_finder = RequirementsIssueFinder(self.setting_checker.context)
+            issues = requirements_finder.lint(content)
+            yield from self.iter_timed(requirements_finder, issues)
+
+    def iter_timed(self, finder: object, issues: Iterable[Issue]) -> Iterable[Issue]:
+        """Return *issues*, found by *finder*, timed if profiling."""
+        if self.profiler is None:
+            return issues
+        return self.profiler.iter_timed(FINDER, type(finder).__qualname__, issues)
+
+    def lint_python_source(
+        self, source: str, file: Path, codes: frozenset[int]
+    ) -> Generator[Issue]:
+        module_finders = []
+        if (
+            SettingModuleIssueFinder.CODES & codes
+            and file in self.project.setting_module_paths
         ):
-            yield from RequirementsIssueFinder(self.context).lint(file)
+            module_finders.append(
+                SettingModuleIssueFinder(
+                    self.setting_checker.context, self.setting_checker, codes
+                )
+            )
+        finder = PythonIssueFinder(
+            self.setting_checker,
+            module_finders,
+            self.node_dispatcher(codes),
+            self.profiler,
+        )
+        if self.profiler is not None:
+            path = os.path.relpath(file, self.project.path)
+            with self.profiler.phase("parse", file=path):
+                tree = self.parse_python_source(source, file)
+            nodes = sum(1 for _ in ast.walk(tree))
+            issues = finder.iter_issues(tree)
+            del tree
+            yield from self.profiler.iter_timed(PHASE, "walk", issues, nodes, file=path)
+            return
+        # Not keeping a reference to the tree lets the walk free it as it goes.
+        yield from finder.iter_issues(self.parse_python_source(source, file))
 
-    def lint_python_file(self, file: Path) -> Generator[Issue]:
-        try:
-            with file.open("r", encoding="utf-8") as f:
-                source = f.read()
-        except UnicodeDecodeError as e:
-            raise InputFileError(str(e), file) from None
+    @staticmethod
+    def parse_python_source(source: str, file: Path) -> ast.Module:
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", SyntaxWarning)
             try:
-                tree = ast.parse(source, filename=str(file))
+                return ast.parse(source, filename=str(file))
             except SyntaxError as e:
                 raise InputFileError(str(e), file) from None
-        setting_module_finder = SettingModuleIssueFinder(
-            self.context,
-            file,
-            self.setting_checker,
-        )
-        if file in self.context.project.setting_module_paths:
-            yield from setting_module_finder.check(tree)
-        finder = PythonIssueFinder(self.setting_checker)
-        finder.visit(tree)
-        yield from finder.issues
+
+
+class MonorepoLinter(BaseLinter):
+    """Linter of the files of many Scrapy projects in a single run.
+
+    Each file is linted with a :class:`Linter` of its nearest project root,
+    i.e. its nearest ancestor directory with a ``scrapy.cfg`` file, or of the
+    current working directory if it has none. Project linters share the
+    compiled rule data, and files of all projects are linted in a single
+    pool of worker processes.
+
+    Issue paths are relative to the current working directory.
+
+    See :class:`Linter` for the parameters.
+    """
+
+    def __init__(  # noqa: PLR0913  # pylint: disable=too-many-arguments
+        self,
+        paths: Sequence[Path] = (),
+        *,
+        jobs: int | None = None,
+        cache: bool = True,
+        changed: set[Path] | None = None,
+        options: LintOptions | None = None,
+        profiler: Profiler | None = None,
+    ) -> None:
+        self.profiler = profiler
+        self.jobs = jobs or os.cpu_count() or 1
+        cwd = Path().cwd()
+        self.options = replace(options or LintOptions(), relative_to=cwd)
+        self.node_dispatchers: dict[frozenset[int], NodeDispatcher] = {}
+        self.linter_options: dict[str, Any] = {
+            "jobs": 1,
+            "cache": cache,
+            "changed": changed,
+            "options": self.options,
+            "profiler": profiler,
+        }
+        self.linters: dict[Path, Linter] = {}
+        self.file_linters: dict[Path, Linter] = {}
+        for root, files in self.find_project_files(paths, cwd).items():
+            linter = self.project_linter(root, files)
+            self.linters[root] = linter
+            for file in linter.files:
+                self.file_linters[file.resolve()] = linter
+
+    def project_linter(self, root: Path, files: Sequence[Path]) -> Linter:
+        """Return a linter of *files* of the project at *root* that shares the
+        options and rule data of this linter."""
+        linter = Linter(files, project=Project(root), **self.linter_options)
+        linter.node_dispatchers = self.node_dispatchers
+        return linter
+
+    @classmethod
+    def find_project_files(
+        cls, paths: Sequence[Path], default_root: Path
+    ) -> dict[Path, list[Path]]:
+        """Return the files to lint in *paths* by project root.
+
+        Files outside any project belong to *default_root*. The
+        ``scrapinghub.yml`` and requirements files of projects within linted
+        directories are also linted.
+        """
+        roots: dict[Path, Path | None] = {}
+
+        def find_root(directory: Path) -> Path | None:
+            if directory not in roots:
+                if (directory / "scrapy.cfg").is_file():
+                    roots[directory] = directory
+                elif directory.parent == directory:
+                    roots[directory] = None
+                else:
+                    roots[directory] = find_root(directory.parent)
+            return roots[directory]
+
+        files: dict[Path, set[Path]] = {}
+        directories = []
+        for path in paths:
+            if path.is_file():
+                found: Iterable[Path] = (path,)
+            else:
+                directories.append(path.resolve())
+                found = iter_python_files(path, default_root)
+            for file in found:
+                root = find_root(file.resolve().parent) or default_root
+                files.setdefault(root, set()).add(file)
+        for root, project_files in files.items():
+            if not any(root == d or d in root.parents for d in directories):
+                continue
+            project = Project(root)
+            for input_file in (root / "scrapinghub.yml", project.requirements_file):
+                if input_file is not None and input_file.exists():
+                    project_files.add(input_file)
+        return {root: sorted(files[root]) for root in sorted(files)}
+
+    def project_linters(self) -> Sequence[Linter]:
+        return tuple(self.linters.values())
+
+    def lint_source(self, source: str | bytes, path: str | Path) -> Generator[Issue]:
+        """Yield the issues of *source*, the content of the file at *path*,
+        relative to the current working directory, with the linter of its
+        nearest project root, without reading that file from disk."""
+        cwd = Path().cwd()
+        file = (cwd / path).resolve()
+        root = next((d for d in file.parents if (d / "scrapy.cfg").is_file()), cwd)
+        if root not in self.linters:
+            self.linters[root] = self.project_linter(root, [])
+        return self.linters[root].lint_source(source, file)
+
+    def lint_file(self, file: Path) -> Generator[Issue]:
+        return self.file_linters[file].lint_file(file)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, "node_dispatchers": {}}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # Project linters lost their shared rule data when pickled.
+        for linter in self.linters.values():
+            linter.node_dispatchers = self.node_dispatchers
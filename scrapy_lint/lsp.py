@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from queue import Empty, Queue
+from threading import Thread
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable
+from urllib.parse import unquote, urlparse
+
+from scrapy_lint.context import PROJECT_INPUTS
+from scrapy_lint.errors import InputFileError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from scrapy_lint.issues import Issue
+    from scrapy_lint.linter import Linter
+
+# Seconds to wait after a document change before linting it, so that typing
+# does not trigger a lint per keystroke.
+DEBOUNCE_DELAY = 0.3
+
+# Constants from the Language Server Protocol specification.
+METHOD_NOT_FOUND = -32601
+FULL_TEXT_DOCUMENT_SYNC = 1
+WARNING_SEVERITY = 2
+ERROR_MESSAGE_TYPE = 1
+
+
+def read_message(stream: BinaryIO) -> dict[str, Any] | None:
+    """Read a JSON-RPC message with its base protocol headers from *stream*,
+    or return None at the end of the stream."""
+    content_length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii").partition(":")
+        if name.lower() == "content-length":
+            content_length = int(value)
+    assert content_length is not None
+    return json.loads(stream.read(content_length))
+
+
+def write_message(stream: BinaryIO, message: dict[str, Any]) -> None:
+    body = json.dumps({"jsonrpc": "2.0", **message}).encode("utf-8")
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    stream.flush()
+
+
+def read_messages(stream: BinaryIO, queue: Queue[dict[str, Any] | None]) -> None:
+    while True:
+        message = read_message(stream)
+        queue.put(message)
+        if message is None:
+            return
+
+
+def uri_to_path(uri: str) -> Path:
+    return Path(unquote(urlparse(uri).path)).resolve()
+
+
+def issue_to_diagnostic(issue: Issue) -> dict[str, Any]:
+    position = {"line": issue.line - 1, "character": issue.column}
+    detail = f": {issue.detail}" if issue.detail else ""
+    return {
+        "range": {"start": position, "end": position},
+        "severity": WARNING_SEVERITY,
+        "code": f"SCP{issue.code:02}",
+        "source": "scrapy-lint",
+        "message": f"{issue.summary}{detail}",
+    }
+
+
+class LanguageServer:
+    """Language server that publishes the issues of open Python documents as
+    diagnostics.
+
+    Documents are linted from memory, only after they stop changing for
+    *debounce_delay* seconds. When project files change, open documents that
+    may be affected are linted again.
+    """
+
+    def __init__(self, output: BinaryIO, debounce_delay: float = DEBOUNCE_DELAY):
+        self.output = output
+        self.debounce_delay = debounce_delay
+        self.linter: Linter | None = None
+        self.documents: dict[str, str] = {}
+        # Documents to lint, with the monotonic time at which to lint them.
+        self.pending: dict[str, float] = {}
+        self.running = True
+        self.handlers: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "initialize": self.initialize,
+            "shutdown": lambda _: None,
+            "exit": self.exit,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didSave": self.did_save,
+            "textDocument/didClose": self.did_close,
+            "workspace/didChangeWatchedFiles": self.did_change_watched_files,
+        }
+
+    def run(self, stream: BinaryIO) -> None:
+        queue: Queue[dict[str, Any] | None] = Queue()
+        Thread(target=read_messages, args=(stream, queue), daemon=True).start()
+        while self.running:
+            timeout = None
+            if self.pending:
+                timeout = max(0.0, min(self.pending.values()) - time.monotonic())
+            try:
+                message = queue.get(timeout=timeout)
+            except Empty:
+                self.lint_pending()
+                continue
+            if message is None:
+                self.lint_pending(force=True)
+                return
+            self.handle(message)
+            self.lint_pending()
+
+    def handle(self, message: dict[str, Any]) -> None:
+        method = message.get("method")
+        if method not in self.handlers:
+            if "id" in message:
+                error = {"code": METHOD_NOT_FOUND, "message": f"unknown {method}"}
+                write_message(self.output, {"id": message["id"], "error": error})
+            return
+        result = self.handlers[method](message.get("params") or {})
+        if "id" in message:
+            write_message(self.output, {"id": message["id"], "result": result})
+
+    def initialize(self, params: dict[str, Any]) -> dict[str, Any]:
+        if params.get("rootUri"):
+            os.chdir(uri_to_path(params["rootUri"]))
+        elif params.get("rootPath"):
+            os.chdir(params["rootPath"])
+        self.load_project()
+        return {
+            "capabilities": {
+                "textDocumentSync": {
+                    "openClose": True,
+                    "change": FULL_TEXT_DOCUMENT_SYNC,
+                    "save": True,
+                },
+            },
+            "serverInfo": {"name": "scrapy-lint"},
+        }
+
+    def exit(self, _: dict[str, Any]) -> None:
+        self.running = False
+
+    def did_open(self, params: dict[str, Any]) -> None:
+        document = params["textDocument"]
+        self.documents[document["uri"]] = document["text"]
+        self.schedule([document["uri"]], delay=0)
+
+    def did_change(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        if params["contentChanges"]:
+            self.documents[uri] = params["contentChanges"][-1]["text"]
+        self.schedule([uri])
+
+    def did_save(self, params: dict[str, Any]) -> None:
+        self.file_changed(uri_to_path(params["textDocument"]["uri"]))
+
+    def did_close(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self.pending.pop(uri, None)
+        self.publish(uri, [])
+
+    def did_change_watched_files(self, params: dict[str, Any]) -> None:
+        for change in params["changes"]:
+            self.file_changed(uri_to_path(change["uri"]))
+
+    def file_changed(self, path: Path) -> None:
+        """Reload the project and lint all open documents again if *path* is
+        a project input, since the issues of any document may depend on
+        project options, setting modules or requirements."""
+        if not self.is_project_input(path):
+            return
+        self.load_project()
+        if self.linter is None:
+            return
+        self.schedule(list(self.documents), delay=0)
+
+    def is_project_input(self, path: Path) -> bool:
+        if path.parent == Path.cwd() and path.name in PROJECT_INPUTS:
+            return True
+        return self.linter is not None and path == self.linter.project.requirements_file
+
+    def load_project(self) -> None:
+        from scrapy_lint.linter import Linter  # noqa: PLC0415
+
+        try:
+            self.linter = Linter([], jobs=1, cache=False)
+            self.linter.project.load()
+        except InputFileError as e:
+            message = {"type": ERROR_MESSAGE_TYPE, "message": str(e)}
+            write_message(
+                self.output,
+                {"method": "window/showMessage", "params": message},
+            )
+
+    def schedule(self, uris: Sequence[str], delay: float | None = None) -> None:
+        delay = self.debounce_delay if delay is None else delay
+        deadline = time.monotonic() + delay
+        for uri in uris:
+            self.pending[uri] = deadline
+
+    def lint_pending(self, *, force: bool = False) -> None:
+        now = time.monotonic()
+        for uri, deadline in list(self.pending.items()):
+            if force or deadline <= now:
+                del self.pending[uri]
+                self.lint(uri)
+
+    def lint(self, uri: str) -> None:
+        if self.linter is None:
+            return
+        try:
+            issues = list(
+                self.linter.lint_source(self.documents[uri], uri_to_path(uri))
+            )
+        except InputFileError:
+            # Keep the diagnostics of the last valid version of the document.
+            return
+        self.publish(uri, issues)
+
+    def publish(self, uri: str, issues: Sequence[Issue]) -> None:
+        diagnostics = [issue_to_diagnostic(issue) for issue in issues]
+        write_message(
+            self.output,
+            {
+                "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "diagnostics": diagnostics},
+            },
+        )
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+from . import issues as issue_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from typing import TextIO
+
+    from .issues import Issue
+
+RULE_URL = "https://scrapy-lint.readthedocs.io/en/latest/rules/scp{code:02}.html"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class IssueWriter:
+    """Writes issues to *stream* as they are reported, in the text format
+    by default.
+
+    :meth:`finish` must be called even if linting stops early, so that the
+    output is complete, e.g. with closed JSON arrays.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def start(self) -> None:
+        pass
+
+    def write(self, issue: Issue) -> None:
+        self.stream.write(f"{issue}\n")
+
+    def finish(self, errors: Sequence[str] = ()) -> None:
+        """Complete the output, given the *errors* that stopped linting, if
+        any."""
+
+
+def issue_to_dict(issue: Issue) -> dict[str, Any]:
+    return {
+        "code": f"SCP{issue.code:02}",
+        "summary": issue.summary,
+        "detail": issue.detail,
+        "file": str(issue.file),
+        "line": issue.line,
+        "column": issue.column,
+    }
+
+
+class JSONLinesIssueWriter(IssueWriter):
+    def write(self, issue: Issue) -> None:
+        self.stream.write(json.dumps(issue_to_dict(issue)) + "\n")
+
+
+class JSONIssueWriter(IssueWriter):
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self.separator = "["
+
+    def start(self) -> None:
+        self.separator = "["
+
+    def write(self, issue: Issue) -> None:
+        self.stream.write(f"{self.separator}\n{json.dumps(issue_to_dict(issue))}")
+        self.separator = ","
+
+    def finish(self, errors: Sequence[str] = ()) -> None:
+        end = "[]" if self.separator == "[" else "\n]"
+        self.stream.write(f"{end}\n")
+
+
+def iter_rule_ids() -> list[tuple[int, str]]:
+    return sorted(
+        value for value in vars(issue_ids).values() if isinstance(value, tuple)
+    )
+
+
+class SARIFIssueWriter(IssueWriter):
+    """Writes a `SARIF 2.1.0`_ log with a single run, with results written as
+    issues are reported and a trailing invocation object that reports errors.
+
+    .. _SARIF 2.1.0: https://docs.oasis-open.org/sarif/sarif/v2.1.0/
+    """
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream)
+        self.rule_indexes: dict[int, int] = {}
+        self.separator = ""
+
+    def start(self) -> None:
+        rule_ids = iter_rule_ids()
+        self.rule_indexes = {code: index for index, (code, _) in enumerate(rule_ids)}
+        driver: dict[str, Any] = {
+            "name": "scrapy-lint",
+            "informationUri": "https://scrapy-lint.readthedocs.io/",
+        }
+        from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+        with suppress(PackageNotFoundError):
+            driver["version"] = version("scrapy-lint")
+        driver["rules"] = [
+            {
+                "id": f"SCP{code:02}",
+                "shortDescription": {"text": summary},
+                "helpUri": RULE_URL.format(code=code),
+            }
+            for code, summary in rule_ids
+        ]
+        log = {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [{"tool": {"driver": driver}}],
+        }
+        # Write the log up to the end of the run, to stream its results.
+        self.stream.write(json.dumps(log).removesuffix("}]}") + ', "results": [')
+        self.separator = ""
+
+    def write(self, issue: Issue) -> None:
+        assert issue.file is not None
+        detail = f": {issue.detail}" if issue.detail else ""
+        result = {
+            "ruleId": f"SCP{issue.code:02}",
+            "ruleIndex": self.rule_indexes[issue.code],
+            "level": "warning",
+            "message": {"text": f"{issue.summary}{detail}"},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {
+                            "uri": quote(issue.file.as_posix()),
+                            "uriBaseId": "%SRCROOT%",
+                        },
+                        "region": {
+                            "startLine": issue.line,
+                            "startColumn": issue.column + 1,
+                        },
+                    },
+                },
+            ],
+        }
+        self.stream.write(f"{self.separator}\n{json.dumps(result)}")
+        self.separator = ","
+
+    def finish(self, errors: Sequence[str] = ()) -> None:
+        invocation = {
+            "executionSuccessful": not errors,
+            "toolExecutionNotifications": [
+                {"level": "error", "message": {"text": error}} for error in errors
+            ],
+        }
+        self.stream.write(f'\n], "invocations": {json.dumps([invocation])}}}]}}\n')
+
+
+ISSUE_WRITERS: dict[str, type[IssueWriter]] = {
+    "text": IssueWriter,
+    "jsonl": JSONLinesIssueWriter,
+    "json": JSONIssueWriter,
+    "sarif": SARIFIssueWriter,
+}
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Iterator
+    from typing import TextIO
+
+    from .issues import Issue
+
+PHASE = "phase"
+FINDER = "finder"
+
+
+@dataclass
+class ProfileEntry:
+    kind: str
+    name: str
+    seconds: float = 0.0
+    #: Number of items processed: files for most phases, AST nodes for the
+    #: walk phase and for the finders of Python nodes, and statements for
+    #: module finders.
+    count: int = 0
+
+
+def trace_event(
+    kind: str, name: str, start: float, seconds: float, args: dict[str, Any]
+) -> dict[str, Any]:
+    """Return a complete trace event of *seconds* spent in *name* since
+    *start*, in the current process and thread."""
+    return {
+        "name": name,
+        "cat": kind,
+        "ph": "X",
+        "ts": start * 1e6,
+        "dur": seconds * 1e6,
+        "pid": os.getpid(),
+        "tid": threading.get_native_id(),
+        "args": args,
+    }
+
+
+@dataclass
+class Measurement:
+    count: int = 1
+
+
+class Profiler:
+    """Time spent in each phase of linting and in each issue finder, and
+    number of items that each of them processed.
+
+    If *trace* is ``True``, each phase is also recorded as a `trace event`_,
+    with the process and thread where it happened and, for phases that
+    process a single file, the path of that file.
+
+    Profiling is opt-in: the linter wraps phases and finders with the
+    methods of a profiler only when it has one, so that linting without a
+    profiler does not pay any cost.
+
+    .. _trace event: https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+    """
+
+    def __init__(self, *, trace: bool = False) -> None:
+        self.entries: dict[tuple[str, str], ProfileEntry] = {}
+        self.trace = trace
+        self.events: list[dict[str, Any]] = []
+
+    def fresh(self) -> Profiler:
+        """Return an empty profiler with the same settings."""
+        return Profiler(trace=self.trace)
+
+    def add(self, kind: str, name: str, seconds: float, count: int = 1) -> None:
+        """Record *seconds* spent in *name* processing *count* items."""
+        key = (kind, name)
+        if key not in self.entries:
+            self.entries[key] = ProfileEntry(kind, name)
+        entry = self.entries[key]
+        entry.seconds += seconds
+        entry.count += count
+
+    def merge(self, other: Profiler) -> None:
+        """Add the data of *other*, e.g. from a worker process."""
+        for entry in other.entries.values():
+            self.add(entry.kind, entry.name, entry.seconds, entry.count)
+        if self.trace:
+            self.events.extend(other.events)
+
+    @contextmanager
+    def phase(self, name: str, **args: Any) -> Iterator[Measurement]:
+        """Time the phase *name* while in context, counting the items of the
+        yielded measurement, one by default.
+
+        *args* are recorded with the trace event of the phase.
+        """
+        measurement = Measurement()
+        start = perf_counter()
+        try:
+            yield measurement
+        finally:
+            seconds = perf_counter() - start
+            self.add(PHASE, name, seconds, measurement.count)
+            if self.trace:
+                self.events.append(trace_event(PHASE, name, start, seconds, args))
+
+    def iter_timed(
+        self,
+        kind: str,
+        name: str,
+        issues: Iterable[Issue],
+        count: int = 1,
+        **args: Any,
+    ) -> Generator[Issue]:
+        """Yield *issues*, timing how long it takes to get them, but not how
+        long the caller takes to process them.
+
+        Phases are traced as a single event that starts when the first issue
+        is requested, lasting the time it took to get all issues.
+        """
+        seconds = 0.0
+        first_start = None
+        iterator = iter(issues)
+        try:
+            while True:
+                start = perf_counter()
+                if first_start is None:
+                    first_start = start
+                try:
+                    issue = next(iterator)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += perf_counter() - start
+                yield issue
+        finally:
+            self.add(kind, name, seconds, count)
+            if self.trace and kind == PHASE and first_start is not None:
+                self.events.append(trace_event(kind, name, first_start, seconds, args))
+
+    def wrap(self, finder: Callable[[Any], Any]) -> Callable[..., Any]:
+        """Return a version of *finder*, a node finder or post-visit hook,
+        that records how long each call takes."""
+        name = getattr(finder, "__qualname__", type(finder).__qualname__)
+        add = self.add
+
+        def timed(node: Any) -> list[Issue]:
+            start = perf_counter()
+            issues = list(finder(node) or ())
+            add(FINDER, name, perf_counter() - start)
+            return issues
+
+        return timed
+
+    def sorted_entries(self) -> list[ProfileEntry]:
+        return sorted(self.entries.values(), key=lambda entry: -entry.seconds)
+
+    def write_table(self, stream: TextIO) -> None:
+        """Write a table with the profile entries, slowest first."""
+        rows = [("kind", "name", "seconds", "count")]
+        rows.extend(
+            (entry.kind, entry.name, f"{entry.seconds:.4f}", str(entry.count))
+            for entry in self.sorted_entries()
+        )
+        widths = [max(len(row[index]) for row in rows) for index in range(4)]
+        stream.writelines(
+            f"{kind:<{widths[0]}}  {name:<{widths[1]}}  "
+            f"{seconds:>{widths[2]}}  {count:>{widths[3]}}\n"
+            for kind, name, seconds, count in rows
+        )
+
+    def write_trace(self, stream: TextIO) -> None:
+        """Write the recorded trace events as trace event JSON, naming the
+        track of each process."""
+        main_pid = os.getpid()
+        pids = sorted({event["pid"] for event in self.events} - {main_pid})
+        names = {main_pid: "scrapy-lint"}
+        names.update({pid: f"worker {index}" for index, pid in enumerate(pids, 1)})
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}}
+            for pid, name in names.items()
+        ]
+        json.dump({"traceEvents": [*metadata, *self.events]}, stream)
+        stream.write("\n")
+
+    def write_json(self, stream: TextIO) -> None:
+        """Write the profile entries as a JSON array, slowest first."""
+        json.dump([asdict(entry) for entry in self.sorted_entries()], stream, indent=2)
+        stream.write("\n")
+
+
+class ProfiledModuleIssueFinder:
+    """Module issue finder that records how long *finder* takes to check
+    each statement."""
+
+    def __init__(self, finder: Any, profiler: Profiler):
+        self.finder = finder
+        self.profiler = profiler
+        self.name = type(finder).__qualname__
+
+    def visit_statement(self, node: Any, *, top_level: bool) -> Iterable[Issue]:
+        issues = self.finder.visit_statement(node, top_level=top_level)
+        return self.profiler.iter_timed(FINDER, self.name, issues)
+
+    def finish(self) -> Iterable[Issue]:
+        return self.profiler.iter_timed(FINDER, self.name, self.finder.finish(), 0)
@@ -5,15 +5,21 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from packaging.version import Version
+
+from scrapy_lint.issues import (
+    DEPRECATED_SETTING,
+    REMOVED_SETTING,
+    SETTING_NEEDS_UPGRADE,
+)
 from scrapy_lint.versions import (
+    UNKNOWN_FUTURE_VERSION,
     UNKNOWN_UNSUPPORTED_VERSION,
     UnknownFutureVersion,
     UnknownUnsupportedVersion,
 )
 
 if TYPE_CHECKING:
-    from packaging.version import Version
-
     from scrapy_lint.context import Project
 
 
@@ -190,14 +196,102 @@ class Setting:
         return SETTINGS[f"{self.name}_BASE"]
 
     def get_default_value(self, project: Project) -> Any:
+        assert self.name
+        return project.resolved_settings.default_values[self.name]
+
+    def resolve_default_value(self, requirements: dict[str, Version]) -> Any:
         if self.default_value is UNKNOWN_SETTING_VALUE:
             return UNKNOWN_SETTING_VALUE
         assert isinstance(self.default_value, VersionedValue)
         versioned_value = self.default_value
-        if self.package not in project.frozen_requirements:
+        if self.package not in requirements:
             return versioned_value.all_time_value
-        version = project.frozen_requirements[self.package]
-        return versioned_value[version]
+        return versioned_value[requirements[self.package]]
+
+    def resolve_support(self, project: Project) -> bool:
+        """Return whether the setting is available in the project
+        requirements."""
+        if not project.packages:
+            return True
+        if self.package not in project.frozen_requirements or (
+            not self.versioning.added_in and not self.versioning.deprecated_in
+        ):
+            return self.package in project.packages
+        deprecated_in = self.versioning.deprecated_in
+        if isinstance(deprecated_in, UnknownUnsupportedVersion):
+            deprecated_in = self.lowest_supported_version
+        package_version = project.frozen_requirements[self.package]
+        return (
+            not self.versioning.added_in or package_version >= self.versioning.added_in
+        ) and (not deprecated_in or package_version < deprecated_in)
+
+    def resolve_versioning_issue(
+        self, version: Version
+    ) -> tuple[tuple[int, str], str] | None:
+        """Return the ID and detail of the issue to report about the use of
+        the setting with *version* of its package, if any."""
+        package = self.package
+        added_in = self.versioning.added_in
+        deprecated_in = self.versioning.deprecated_in
+        removed_in = self.versioning.removed_in
+        if added_in and version < added_in:
+            return SETTING_NEEDS_UPGRADE, f"added in {package} {added_in}"
+        if not deprecated_in:
+            return None
+        if isinstance(deprecated_in, UnknownUnsupportedVersion):
+            deprecated_in = self.lowest_supported_version
+            if version < deprecated_in:
+                return None
+            detail = f"deprecated in {package} {deprecated_in} or lower"
+        else:
+            if version < deprecated_in:
+                return None
+            detail = f"deprecated in {package} {deprecated_in}"
+        if removed_in and version >= removed_in:
+            detail += f", removed in {removed_in}"
+            issue_id = REMOVED_SETTING
+        else:
+            issue_id = DEPRECATED_SETTING
+        if self.versioning.sunset_guidance:
+            detail += f"; {self.versioning.sunset_guidance}"
+        return issue_id, detail
+
+    def resolve_change(self, requirements: dict[str, Version]) -> str | None:
+        """Return a description of the upcoming change of the default value
+        of the setting, if it changes in a version of its package later than
+        the one in *requirements*."""
+        if isinstance(self.default_value, UnknownSettingValue):
+            return None
+        history = self.default_value.history
+        if not history:
+            return None
+        assert len(history) == MAX_DEFAULT_VALUE_HISTORY
+        assert UNKNOWN_UNSUPPORTED_VERSION in history
+        old_value = history[UNKNOWN_UNSUPPORTED_VERSION]
+        if UNKNOWN_FUTURE_VERSION in history:
+            new_value = history[UNKNOWN_FUTURE_VERSION]
+            return (
+                f"{self.name} changes from {old_value!r} to {new_value!r} in a "
+                f"future version of {self.package}"
+            )
+        if self.package not in requirements:
+            return None
+        change_version, new_value = next(iter(history.items()))  # pylint: disable=stop-iteration-return
+        assert isinstance(change_version, Version)
+        if requirements[self.package] >= change_version:
+            return None
+        return (
+            f"{self.name} changes from {old_value!r} to {new_value!r} in "
+            f"{self.package} {change_version}"
+        )
+
+    @property
+    def lowest_supported_version(self) -> Version:
+        from scrapy_lint.data.packages import PACKAGES  # noqa: PLC0415
+
+        version = PACKAGES[self.package].lowest_supported_version
+        assert version
+        return version
 
     def parse(self, value: Any) -> Any:
         if self.type == SettingType.BOOL:
@@ -216,3 +310,60 @@ class Setting:
         } and isinstance(value, str):
             return json.loads(value)
         return value
+
+
+@dataclass
+class ResolvedSettings:
+    """Setting data resolved for the requirements of a project.
+
+    Built once per project, so that setting checks look up data instead of
+    resolving package versions on every use.
+    """
+
+    # Default value of each setting.
+    default_values: dict[str, Any]
+    # Whether each setting is available in the project requirements.
+    supported: dict[str, bool]
+    # Issue ID and detail to report about the use of settings that require an
+    # upgrade, or are deprecated or removed, in the frozen package version.
+    versioning_issues: dict[str, tuple[tuple[int, str], str]]
+    # Description of the upcoming default value change of non-base settings
+    # whose default value changes in a later or future version.
+    changes: dict[str, str]
+    # Settings that each add-on, by import path, sets.
+    addon_settings: dict[str, set[str]]
+
+    @classmethod
+    def from_project(cls, project: Project) -> ResolvedSettings:
+        from scrapy_lint.data.addons import ADDONS  # noqa: PLC0415
+        from scrapy_lint.data.settings import SETTINGS  # noqa: PLC0415
+
+        requirements = project.frozen_requirements
+        versioning_issues = {}
+        changes = {}
+        for name, setting in SETTINGS.items():
+            if setting.package in requirements:
+                issue = setting.resolve_versioning_issue(requirements[setting.package])
+                if issue is not None:
+                    versioning_issues[name] = issue
+            if name.endswith("_BASE"):
+                continue
+            change = setting.resolve_change(requirements)
+            if change is not None:
+                changes[name] = change
+        return cls(
+            default_values={
+                name: setting.resolve_default_value(requirements)
+                for name, setting in SETTINGS.items()
+            },
+            supported={
+                name: setting.resolve_support(project)
+                for name, setting in SETTINGS.items()
+            },
+            versioning_issues=versioning_issues,
+            changes=changes,
+            addon_settings={
+                import_path: addon.get_settings(project)
+                for import_path, addon in ADDONS.items()
+            },
+        )
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import sys
+import time
+from itertools import chain
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from scrapy_lint.baseline import FingerprintState, issue_fingerprint
+from scrapy_lint.context import FileState, file_state
+from scrapy_lint.errors import InputFileError
+from scrapy_lint.linter import Linter, MonorepoLinter
+
+if TYPE_CHECKING:
+    from argparse import Namespace
+    from collections.abc import Iterable
+
+    from scrapy_lint.issues import Issue
+
+# Seconds between checks for file changes.
+POLL_INTERVAL = 0.5
+
+
+def sort_key(issue: Issue) -> tuple[str, int, int, int]:
+    return str(issue.file), issue.line, issue.column, issue.code
+
+
+class Watcher:
+    """Lints files again whenever they change, and reports the issues that
+    appear and disappear.
+
+    Files are polled for changes by modification time and size. A change to
+    a file lints that file again. A change to a project input, e.g.
+    ``scrapy.cfg`` or the requirements file, reloads the project data and
+    lints all files again. Files are discovered
+    again on every poll, so that new files are linted and the issues of
+    removed files disappear.
+
+    Issues are matched between runs by their baseline fingerprint, so that
+    issues moved by changes to other lines are not reported again.
+    """
+
+    def __init__(self, args: Namespace, output: TextIO):
+        self.args = args
+        self.output = output
+        self.linter = Linter.from_args(args)
+        self.states: dict[Path, FileState] = {}
+        self.issues: dict[Path, dict[str, Issue]] = {}
+
+    def find_files(self) -> set[Path]:
+        """Return the absolute paths of the files to lint."""
+        found: Iterable[Path]
+        if isinstance(self.linter, Linter):
+            found = Linter.resolve_files(self.linter.project, self.args.paths)
+        else:
+            project_files = MonorepoLinter.find_project_files(
+                self.args.paths, Path.cwd()
+            )
+            found = chain.from_iterable(project_files.values())
+        return {file.resolve() for file in found}
+
+    def project_inputs(self) -> set[Path]:
+        inputs: set[Path] = set()
+        for linter in self.linter.project_linters():
+            inputs.update(linter.project.input_files())
+        return inputs
+
+    def start(self) -> None:
+        """Lint all files and report their issues."""
+        self.states = self.file_states(self.find_files())
+        self.update(None, diff=False)
+
+    def poll(self) -> bool:
+        """Lint the files affected by changes since the last poll, report
+        which issues appeared and disappeared, and return whether any file
+        changed."""
+        files = self.find_files()
+        states = self.file_states(files)
+        changed = {
+            path
+            for path in states.keys() | self.states.keys()
+            if states.get(path) != self.states.get(path)
+        }
+        if not changed:
+            return False
+        self.states = states
+        project_changed = bool(changed & self.project_inputs())
+        if project_changed or files != {f for _, f in self.linter.linted_files()}:
+            setting_checker = None
+            if not project_changed and isinstance(self.linter, Linter):
+                setting_checker = self.linter.setting_checker
+            try:
+                self.linter = Linter.from_args(self.args, setting_checker)
+            except InputFileError as e:
+                print(e, file=sys.stderr)
+                return True
+        self.update(None if project_changed else changed)
+        return True
+
+    def file_states(self, files: set[Path]) -> dict[Path, FileState]:
+        return {path: file_state(path) for path in files | self.project_inputs()}
+
+    def update(self, changed: set[Path] | None, *, diff: bool = True) -> None:
+        """Lint the files affected by *changed* files, or all files if
+        ``None``, and report their issues, only those that appeared or
+        disappeared if *diff* is ``True``."""
+        linted = {file for _, file in self.linter.linted_files(changed)}
+        try:
+            new_issues = self.lint(changed, linted)
+        except (InputFileError, OSError) as e:
+            # Keep the issues of the last successful run until the next
+            # change.
+            print(e, file=sys.stderr)
+            return
+        appeared: list[Issue] = []
+        disappeared: list[Issue] = []
+        # Files not linted again that may have been removed.
+        stale = set(self.issues) if changed is None else changed
+        for file in linted | stale:
+            old = self.issues.pop(file, {})
+            new = new_issues.get(file, {})
+            appeared.extend(new[key] for key in new.keys() - old.keys())
+            disappeared.extend(old[key] for key in old.keys() - new.keys())
+            if new:
+                self.issues[file] = new
+        self.report(disappeared, appeared, diff=diff)
+
+    def lint(
+        self, changed: set[Path] | None, linted: set[Path]
+    ) -> dict[Path, dict[str, Issue]]:
+        """Return the issues of the *linted* files, i.e. those affected by
+        *changed* files, by file and baseline fingerprint."""
+        issues: dict[Path, dict[str, Issue]] = {file: {} for file in linted}
+        states: dict[Path, FingerprintState] = {}
+        for issue in self.linter.lint(changed):
+            assert issue.file is not None
+            file = (Path.cwd() / issue.file).resolve()
+            if file not in states:
+                states[file] = FingerprintState(file)
+            issues[file][issue_fingerprint(issue, states[file])] = issue
+        return issues
+
+    def report(
+        self, disappeared: list[Issue], appeared: list[Issue], *, diff: bool
+    ) -> None:
+        """Write the *disappeared* and *appeared* issues, with a ``-`` or
+        ``+`` prefix if *diff* is ``True``, and the issue count."""
+        prefixes = ("- ", "+ ") if diff else ("", "")
+        for prefix, issues in zip(prefixes, (disappeared, appeared)):
+            for issue in sorted(issues, key=sort_key):
+                self.output.write(f"{prefix}{issue}\n")
+        self.output.flush()
+        count = sum(len(issues) for issues in self.issues.values())
+        print(f"{count} issues, watching for changes", file=sys.stderr)
+
+
+def watch(args: Namespace, interval: float = POLL_INTERVAL) -> None:
+    """Lint files with *args* until interrupted, polling for file changes
+    every *interval* seconds."""
+    watcher = Watcher(args, sys.stdout)
+    watcher.start()
+    try:
+        while True:
+            time.sleep(interval)
+            watcher.poll()
+    except KeyboardInterrupt:
+        pass
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from scrapy_lint import lint
+from scrapy_lint import lint, main
 
 from . import ExpectedIssue, File, iter_issues, project
 
@@ -28,3 +28,15 @@ def check_project(
     with project(files, options):
         issues = (ExpectedIssue.from_issue(issue) for issue in lint(args))
         assert sort_issues(expected) == sort_issues(issues)
+
+
+def run(capsys, args: Sequence[str] = ()) -> tuple[str, str, int]:
+    """Run the command-line interface with *args*, and return its standard
+    output, its standard error and its exit code."""
+    code = 0
+    try:
+        main(list(args))
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else 1
+    out, err = capsys.readouterr()
+    return out, err, code
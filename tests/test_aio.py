@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint.aio import alint, alint_linter
+from scrapy_lint.cache import CACHE_DIR_NAME
+from scrapy_lint.data.settings import SETTINGS
+from scrapy_lint.linter import BaseLinter, Linter, LintOptions, MonorepoLinter
+
+from . import File, project
+
+FILES = [
+    File("[settings]\ndefault = settings\n", "scrapy.cfg"),
+    File("USER_AGENT = 'Jane'\n", "settings.py"),
+    File("scrapy==2.13.3\n", "requirements.txt"),
+    *(File(f"settings['FOO{i}']\nsettings['BAR{i}']\n", f"{i}.py") for i in range(8)),
+]
+
+
+async def collect(issues) -> list[str]:
+    return [str(issue) async for issue in issues]
+
+
+def sync_lint(linter: BaseLinter) -> list[str]:
+    return [str(issue) for issue in linter.lint()]
+
+
+@pytest.mark.parametrize("max_in_flight", [None, 1, 3])
+def test_order(max_in_flight):
+    with project(FILES):
+        expected = sync_lint(Linter([Path()], cache=False))
+        with ThreadPoolExecutor(4) as executor:
+            issues = alint(
+                [Path()], executor=executor, max_in_flight=max_in_flight, cache=False
+            )
+            assert asyncio.run(collect(issues)) == expected
+
+
+def test_threads_unknown_settings():
+    """Threads share the setting checker of the linter, including its index
+    of setting names to suggest."""
+    names = sorted(SETTINGS, key=len)[-20:]
+    files = [
+        File("".join(f"settings['{name}_{i}']\n" for name in names), f"{i}.py")
+        for i in range(10)
+    ]
+    switch_interval = sys.getswitchinterval()
+    # Switch threads often, so that races show up.
+    sys.setswitchinterval(1e-6)
+    try:
+        with project(files):
+            expected = sync_lint(Linter([Path()], cache=False))
+            with ThreadPoolExecutor(8) as executor:
+                issues = alint(
+                    [Path()], executor=executor, max_in_flight=8, cache=False
+                )
+                assert asyncio.run(collect(issues)) == expected
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
+def test_process_pool():
+    with project(FILES):
+        expected = sync_lint(Linter([Path()], cache=False))
+        with ProcessPoolExecutor(2) as executor:
+            issues = alint([Path()], executor=executor, cache=False)
+            assert asyncio.run(collect(issues)) == expected
+
+
+def test_monorepo():
+    files = [
+        File("[settings]\ndefault = a.settings\n", "a/scrapy.cfg"),
+        File('[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', "a/pyproject.toml"),
+        File("settings['FOO']\n", "a/a/spider.py"),
+        File("settings['FOO']\n", "script.py"),
+    ]
+    with project(files):
+        expected = sync_lint(MonorepoLinter([Path()], cache=False))
+        issues = alint_linter(MonorepoLinter([Path()], cache=False))
+        assert asyncio.run(collect(issues)) == expected
+
+
+def test_cache():
+    with project(FILES) as directory:
+        expected = asyncio.run(collect(alint([Path()])))
+        assert (Path(directory) / CACHE_DIR_NAME).exists()
+        assert asyncio.run(collect(alint([Path()]))) == expected
+
+
+def test_baseline():
+    with project(FILES):
+        issues = alint(
+            [Path()], options=LintOptions(baseline_output=Path("baseline.txt"))
+        )
+        assert not asyncio.run(collect(issues))
+        baseline = Path("baseline.txt").read_text(encoding="utf-8")
+        assert len(baseline.splitlines()) > len(FILES)
+        Path("0.py").write_text("settings['BAZ']\n", encoding="utf-8")
+        issues = alint([Path()], options=LintOptions(baseline=Path("baseline.txt")))
+        assert asyncio.run(collect(issues)) == ["0.py:1:9: SCP27 unknown setting"]
+
+
+def test_cancel():
+    """Closing the generator early cancels the files not yet started, and
+    writes no cache."""
+
+    async def first_issue() -> str:
+        issues = alint([Path()], executor=executor, max_in_flight=2)
+        issue = await issues.__anext__()
+        await issues.aclose()
+        return str(issue)
+
+    with project(FILES) as directory, ThreadPoolExecutor(1) as executor:
+        expected = sync_lint(Linter([Path()], cache=False))[0]
+        assert asyncio.run(first_issue()) == expected
+        assert not (Path(directory) / CACHE_DIR_NAME).exists()
+
+
+def test_task_cancel():
+    async def cancel() -> None:
+        task = asyncio.create_task(collect(alint([Path()], max_in_flight=1)))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with project(FILES) as directory:
+        asyncio.run(cancel())
+        assert not (Path(directory) / CACHE_DIR_NAME).exists()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint import main
+
+from . import File, project
+from .helpers import run
+
+
+def test_baseline(capsys):
+    files = [
+        File("settings['FOO']\nsettings['FOO']\n", "a.py"),
+        File("settings['BAR']\n", "b.py"),
+        File("stack: scrapy:2.13\nrequirements: {}\n", "scrapinghub.yml"),
+    ]
+    with project(files):
+        assert run(capsys, ["--write-baseline", "baseline.txt"]) == ("", "", 0)
+        baseline = Path("baseline.txt").read_text(encoding="utf-8").splitlines()
+        assert len(baseline) == 5
+        assert baseline == sorted(baseline)
+        assert run(capsys, ["--baseline", "baseline.txt"]) == ("", "", 0)
+
+        # Line shifts, whitespace changes and cached issues are matched.
+        Path("a.py").write_text(
+            "\nsettings[ 'FOO' ]\nsettings['FOO']\n", encoding="utf-8"
+        )
+        Path("b.py").write_text("# b\n\nsettings['BAR']\n", encoding="utf-8")
+        assert run(capsys, ["--baseline", "baseline.txt"]) == ("", "", 0)
+        assert run(capsys, ["--baseline", "baseline.txt"]) == ("", "", 0)
+
+        # New issues are reported, including new occurrences of known ones.
+        Path("a.py").write_text(
+            "settings['FOO']\nsettings['BAZ']\n" * 2, encoding="utf-8"
+        )
+        Path("b.py").write_text("settings['BAR']\nsettings['BAR']\n", encoding="utf-8")
+        out, err, code = run(capsys, ["--baseline", "baseline.txt"])
+    assert out == (
+        "a.py:2:9: SCP27 unknown setting\n"
+        "a.py:4:9: SCP27 unknown setting\n"
+        "b.py:2:9: SCP27 unknown setting\n"
+    )
+    assert not err
+    assert code == 1
+
+
+@pytest.mark.parametrize(
+    ("files", "error"),
+    [
+        ([], "No such file or directory"),
+        (
+            [File(b"\xff", "baseline.txt")],
+            "'utf-8' codec can't decode byte 0xff in position 0: invalid start byte",
+        ),
+    ],
+)
+def test_invalid_baseline(capsys, files, error):
+    with project([File("", "a.py"), *files]):
+        out, err, code = run(capsys, ["--baseline", "baseline.txt"])
+    assert not out
+    assert err == f"baseline.txt: Error: {error}\n"
+    assert code == 2
+
+
+def test_write_baseline_error(capsys):
+    files = [File("settings['FOO']", "a.py"), File(")", "b.py")]
+    with project(files):
+        out, err, code = run(capsys, ["--write-baseline", "baseline.txt"])
+        assert not Path("baseline.txt").exists()
+    assert not out
+    assert err == "b.py: Error: unmatched ')' (b.py, line 1)\n"
+    assert code == 2
+
+
+def test_exclusive_options(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--baseline", "a", "--write-baseline", "b"])
+    assert "not allowed with argument" in capsys.readouterr().err
+    assert excinfo.value.code == 2
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import ast
+import importlib.metadata
+import json
+import os
+import time
+from importlib.metadata import PackageNotFoundError
+from pathlib import Path
+
+from scrapy_lint import cache
+from scrapy_lint.cache import CACHE_DIR_NAME, IssueCache
+from scrapy_lint.context import Project
+
+from . import File, project
+from .helpers import run
+
+
+def cache_files(directory: str) -> list[Path]:
+    return sorted((Path(directory) / CACHE_DIR_NAME).glob("*.json"))
+
+
+def test_warm_run(capsys, monkeypatch):
+    files = [
+        File("settings['FOO']", "a.py"),
+        File("settings['BAR']", "b.py"),
+    ]
+    with project(files) as directory:
+        cold_out, _, _ = run(capsys)
+        assert len(cache_files(directory)) == 1
+        assert (Path(directory) / CACHE_DIR_NAME / ".gitignore").exists()
+
+        def parse(*args, **kwargs):
+            raise AssertionError
+
+        monkeypatch.setattr(ast, "parse", parse)
+        warm_out, _, _ = run(capsys)
+    assert cold_out == warm_out
+    assert warm_out == (
+        "a.py:1:9: SCP27 unknown setting\nb.py:1:9: SCP27 unknown setting\n"
+    )
+
+
+def test_changed_file(capsys):
+    with project(File("settings['FOO']", "a.py")):
+        run(capsys)
+        Path("a.py").write_text("settings['BAR']\nsettings['BAZ']", encoding="utf-8")
+        out, _, _ = run(capsys)
+    assert out == "a.py:1:9: SCP27 unknown setting\na.py:2:9: SCP27 unknown setting\n"
+
+
+def test_changed_options(capsys):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        run(capsys)
+        Path("pyproject.toml").write_text(
+            '[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', encoding="utf-8"
+        )
+        out, _, _ = run(capsys)
+        assert len(cache_files(directory)) == 2
+    assert not out
+
+
+def test_changed_requirements(capsys):
+    with project(File("settings.getdict('ADDONS')", "a.py")):
+        assert run(capsys, ["a.py"]) == ("", "", 0)
+        Path("requirements.txt").write_text("scrapy==2.0.1\n", encoding="utf-8")
+        out, _, _ = run(capsys, ["a.py"])
+    assert out == ("a.py:1:17: SCP29 setting needs upgrade: added in scrapy 2.10.0\n")
+
+
+def test_no_cache(capsys):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        run(capsys, ["--no-cache"])
+        assert not (Path(directory) / CACHE_DIR_NAME).exists()
+
+
+def test_input_error_not_cached(capsys):
+    with project(File(")", "a.py")) as directory:
+        for _ in range(2):
+            _, _, code = run(capsys)
+            assert code == 2
+        assert not (Path(directory) / CACHE_DIR_NAME).exists()
+
+
+def test_invalid_cache_file(capsys):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        run(capsys)
+        (cache_file,) = cache_files(directory)
+        cache_file.write_text("…", encoding="utf-8")
+        out, _, _ = run(capsys)
+        assert json.loads(cache_file.read_text(encoding="utf-8"))
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
+
+
+def test_unknown_version(capsys, monkeypatch):
+    def version(name):
+        raise PackageNotFoundError(name)
+
+    monkeypatch.setattr(importlib.metadata, "version", version)
+    with project(File("settings['FOO']", "a.py")) as directory:
+        out, _, _ = run(capsys)
+        assert not (Path(directory) / CACHE_DIR_NAME).exists()
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
+
+
+def test_touch(capsys, monkeypatch):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        run(capsys)
+        (cache_file,) = cache_files(directory)
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        ((key, (last_used, issues)),) = data.items()
+        cache_file.write_text(
+            json.dumps({key: [last_used - 2 * 86400, issues]}), encoding="utf-8"
+        )
+        monkeypatch.setattr(cache, "CACHE_TOUCH_INTERVAL", 86400)
+        run(capsys)
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert data[key][0] > last_used - 86400
+
+
+def test_age_eviction(capsys):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        cache_dir = Path(directory) / CACHE_DIR_NAME
+        cache_dir.mkdir()
+        old_file = cache_dir / "old.json"
+        old_file.write_text("{}", encoding="utf-8")
+        old_time = time.time() - cache.MAX_CACHE_AGE - 1
+        os.utime(old_file, (old_time, old_time))
+        recent_file = cache_dir / "recent.json"
+        recent_file.write_text("{}", encoding="utf-8")
+        project_cache = IssueCache.from_project(Project(Path(directory).resolve()), ())
+        assert project_cache is not None
+        project_cache.entries["old"] = (old_time, [])
+        project_cache.set("new", [])
+        project_cache.save()
+        data = json.loads(project_cache.file.read_text(encoding="utf-8"))
+        assert not old_file.exists()
+        assert recent_file.exists()
+    assert list(data) == ["new"]
+    capsys.readouterr()
+
+
+def test_size_eviction(monkeypatch):
+    monkeypatch.setattr(cache, "MAX_CACHE_SIZE", 40)
+    with project() as directory:
+        cache_dir = Path(directory) / CACHE_DIR_NAME
+        cache_dir.mkdir()
+        other_file = cache_dir / "other.json"
+        other_file.write_text("{}" + " " * 8, encoding="utf-8")
+        project_cache = IssueCache.from_project(Project(Path(directory).resolve()), ())
+        assert project_cache is not None
+        project_cache.entries["old"] = (time.time() - 1, [])
+        project_cache.set("new", [])
+        project_cache.save()
+        data = json.loads(project_cache.file.read_text(encoding="utf-8"))
+        assert not other_file.exists()
+    assert list(data) == ["new"]
+
+
+def test_unwritable_cache(capsys):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        (Path(directory) / CACHE_DIR_NAME).write_text("", encoding="utf-8")
+        for _ in range(2):
+            assert run(capsys)[0] == "a.py:1:9: SCP27 unknown setting\n"
+
+
+def test_dangling_cache_file(capsys):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        cache_dir = Path(directory) / CACHE_DIR_NAME
+        cache_dir.mkdir()
+        dangling_file = cache_dir / "dangling.json"
+        dangling_file.symlink_to(cache_dir / "missing.json")
+        assert run(capsys)[0] == "a.py:1:9: SCP27 unknown setting\n"
+        assert dangling_file.is_symlink()
+        assert len(cache_files(directory)) == 2
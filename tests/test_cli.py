@@ -1,6 +1,27 @@
+import pickle
+import weakref
+from pathlib import Path
+
 import pytest
 
+import scrapy_lint.finders
+import scrapy_lint.issues
 from scrapy_lint import main
+from scrapy_lint.errors import InputFileError
+from scrapy_lint.finders.settings import (
+    SettingChecker,
+    SettingIssueFinder,
+    SettingsModuleSettingsProcessor,
+)
+from scrapy_lint.issues import _FINDER_CODES
+from scrapy_lint.linter import (
+    ALL_CODES,
+    Linter,
+    LintOptions,
+    NodeDispatcher,
+    _init_worker,
+    _lint_file_in_worker,
+)
 
 from . import File, project
 
@@ -65,6 +86,118 @@ def test_file_rule_ignore(capsys):
     assert not err
 
 
+SELECT_FILES = [
+    File("[settings]\ndefault = settings\n", "scrapy.cfg"),
+    File("", "settings.py"),
+    File(
+        "settings['FOO']\nsettings.getint('LOG_LEVEL', 'a')\nurljoin(response.url)",
+        "a.py",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        (
+            ["--select", "SCP03,SCP27"],
+            [
+                "a.py:1:9: SCP27 unknown setting",
+                "a.py:3:0: SCP03 improper response URL join",
+            ],
+        ),
+        (
+            ["--select", "SCP03", "--select", "SCP27", "--ignore", "SCP27"],
+            ["a.py:3:0: SCP03 improper response URL join"],
+        ),
+        (
+            ["--ignore", "SCP03, SCP08,SCP09,SCP10,SCP32,SCP34"],
+            ["a.py:1:9: SCP27 unknown setting"],
+        ),
+        (["--select", "SCP08"], ["settings.py:1:0: SCP08 no project USER_AGENT"]),
+    ],
+)
+def test_select(capsys, args, expected):
+    with project(SELECT_FILES), pytest.raises(SystemExit) as excinfo:
+        main(args)
+    out, err = capsys.readouterr()
+    assert out.splitlines() == expected
+    assert not err
+    assert excinfo.value.code == 1
+
+
+def test_select_cache(capsys):
+    with project(SELECT_FILES):
+        with pytest.raises(SystemExit):
+            main(["--select", "SCP03"])
+        capsys.readouterr()
+        with pytest.raises(SystemExit):
+            main(["--ignore", "SCP08,SCP09,SCP10,SCP32,SCP34"])
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == [
+        "a.py:1:9: SCP27 unknown setting",
+        "a.py:3:0: SCP03 improper response URL join",
+    ]
+
+
+@pytest.mark.parametrize("code", ["27", "SCP", "SCP2x"])
+def test_invalid_select(capsys, code):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--select", f"SCP01,{code}"])
+    assert f"invalid rule code: '{code}'" in capsys.readouterr().err
+    assert excinfo.value.code == 2
+
+
+def test_skipped_checks(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(SettingChecker, "suggest_names", fail)
+    monkeypatch.setattr(
+        SettingsModuleSettingsProcessor, "validate_missing_changing_settings", fail
+    )
+    monkeypatch.setattr(SettingsModuleSettingsProcessor, "process_addons", fail)
+    files = [
+        *SELECT_FILES,
+        File("ADDONS = {'scrapy_poet.Addon': 300}", "settings.py"),
+        File("scrapy==2.13.3\n", "requirements.txt"),
+    ]
+    options = {"per-file-ignores": {"settings.py": ["SCP34"]}}
+    with project(files, options):
+        lint_options = LintOptions(select=ALL_CODES, ignore=[27])
+        linter = Linter([Path()], jobs=1, options=lint_options)
+        issues = {(str(issue.file), issue.code) for issue in linter.lint()}
+    assert ("a.py", 27) not in issues
+    assert ("a.py", 3) in issues
+    assert ("settings.py", 8) in issues
+
+
+def test_skipped_finders():
+    assert [rule.create for rule in NodeDispatcher(frozenset({36})).rules] == [
+        SettingIssueFinder
+    ]
+    assert NodeDispatcher(frozenset({44})).rules == []
+    assert NodeDispatcher().rules == NodeDispatcher(ALL_CODES).rules
+
+
+def test_all_codes():
+    ids = [
+        value for value in vars(scrapy_lint.issues).values() if isinstance(value, tuple)
+    ]
+    assert {code for code, _ in ids} == ALL_CODES
+
+
+def test_finder_codes():
+    """Issues are attributed to issue finders that exist."""
+    modules = [
+        module
+        for name, module in vars(scrapy_lint.finders).items()
+        if not name.startswith("_")
+    ]
+    for finder in _FINDER_CODES:
+        assert any(hasattr(module, finder) for module in modules), finder
+
+
 def test_syntax_error(capsys):
     with project(File(")", "a.py")), pytest.raises(SystemExit) as excinfo:
         main([])
@@ -105,3 +238,111 @@ def test_invalid_pyproject_encoding(capsys):
         "in position 0: invalid start byte\n"
     )
     assert excinfo.value.code == 2
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_jobs(capsys, monkeypatch, jobs):
+    monkeypatch.setattr("scrapy_lint.linter.MIN_FILES_PER_JOB", 1)
+    files = [
+        File("settings['FOO']", "b.py"),
+        File("settings['BAR']\nsettings['BAZ']", "a.py"),
+        File("", "c.py"),
+        File("settings['QUX']", "d/e.py"),
+    ]
+    with project(files), pytest.raises(SystemExit) as excinfo:
+        main(["--jobs", jobs])
+    out, err = capsys.readouterr()
+    assert out == (
+        "a.py:1:9: SCP27 unknown setting\n"
+        "a.py:2:9: SCP27 unknown setting\n"
+        "b.py:1:9: SCP27 unknown setting\n"
+        "d/e.py:1:9: SCP27 unknown setting\n"
+    )
+    assert not err
+    assert excinfo.value.code == 1
+
+
+def test_jobs_syntax_error(capsys, monkeypatch):
+    monkeypatch.setattr("scrapy_lint.linter.MIN_FILES_PER_JOB", 1)
+    files = [
+        File("settings['FOO']", "a.py"),
+        File(")", "b.py"),
+    ]
+    with project(files), pytest.raises(SystemExit) as excinfo:
+        main(["--jobs", "2"])
+    out, err = capsys.readouterr()
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
+    assert err == "b.py: Error: unmatched ')' (b.py, line 1)\n"
+    assert excinfo.value.code == 2
+
+
+@pytest.mark.parametrize(
+    ("files", "jobs", "expected"),
+    [
+        (3, 8, None),
+        (4, 8, 2),
+        (9, 8, 4),
+        (9, 3, 3),
+    ],
+)
+def test_jobs_per_file(monkeypatch, files, jobs, expected):
+    """Worker processes lint at least MIN_FILES_PER_JOB files each, and are
+    not started for fewer files than 2 processes need."""
+    used_jobs = []
+
+    def lint_in_parallel(self, files, jobs):
+        used_jobs.append(jobs)
+        return (self.lint_file(file) for file in files)
+
+    monkeypatch.setattr("scrapy_lint.linter.MIN_FILES_PER_JOB", 2)
+    monkeypatch.setattr(Linter, "lint_in_parallel", lint_in_parallel)
+    with project([File("settings['FOO']\n", f"{i}.py") for i in range(files)]):
+        issues = list(Linter([Path()], jobs=jobs, cache=False).lint())
+    assert len(issues) == files
+    assert used_jobs == ([] if expected is None else [expected])
+
+
+def test_worker():
+    """Linters and input file errors can be sent to and from worker processes
+    started with the spawn method, used by default on some platforms."""
+    with project(File("settings['FOO']", "a.py")):
+        file = Path("a.py").resolve()
+        linter = Linter([Path()])
+        assert list(linter.lint_file(file))
+        linter = pickle.loads(pickle.dumps(linter))
+        assert linter.cache is None
+        _init_worker(linter)
+        issues, profiler = _lint_file_in_worker(file)
+        assert profiler is None
+        error = pickle.loads(pickle.dumps(InputFileError("foo", file)))
+        assert str(error) == "a.py: Error: foo"
+    assert [(issue.code, issue.line, issue.column) for issue in issues] == [(27, 1, 9)]
+
+
+def test_lazy_lint(monkeypatch):
+    """Issues are yielded as they are found, and the parts of a syntax tree
+    already walked are freed before the walk ends."""
+    trees = []
+    parse = Linter.parse_python_source
+
+    def recording_parse(source, file):
+        tree = parse(source, file)
+        trees.append([weakref.ref(node) for node in (tree, *tree.body)])
+        return tree
+
+    monkeypatch.setattr(Linter, "parse_python_source", staticmethod(recording_parse))
+    files = [
+        File("settings['FOO']\nsettings['BAR']\n", "a.py"),
+        File("settings['FOO']\n", "b.py"),
+    ]
+    with project(files):
+        issues = Linter([Path("a.py"), Path("b.py")], jobs=1).lint()
+        assert next(issues).line == 1
+        assert len(trees) == 1
+        module, first, second = trees[0]
+        assert module() is None
+        assert second() is not None
+        assert next(issues).line == 2
+        assert first() is None
+        assert [str(issue.file) for issue in issues] == ["b.py"]
+    assert all(ref() is None for refs in trees for ref in refs)
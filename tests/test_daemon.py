@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Thread
+
+import pytest
+
+from scrapy_lint import get_parser, main
+from scrapy_lint.daemon import LintServer, default_socket_path, serve
+from scrapy_lint.errors import DaemonError
+
+from . import File, project
+from .helpers import run
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="no Unix socket support"
+)
+
+
+@contextmanager
+def daemon(socket_path: Path):
+    server = LintServer(socket_path, get_parser)
+    thread = Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01})
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
+
+
+def client_args(socket_path: Path, *args: str) -> list[str]:
+    return ["--daemon", "--socket", str(socket_path), *args]
+
+
+def test_issues(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    files = [
+        File("settings['FOO']", "a.py"),
+        File("settings['BAR']", "b/c.py"),
+    ]
+    with daemon(socket_path) as server, project(files):
+        out, err, code = run(capsys, client_args(socket_path))
+        assert len(server.projects) == 1
+    assert out == (
+        "a.py:1:9: SCP27 unknown setting\nb/c.py:1:9: SCP27 unknown setting\n"
+    )
+    assert not err
+    assert code == 1
+
+
+def test_no_issues(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    with daemon(socket_path), project(File("", "a.py")):
+        assert run(capsys, client_args(socket_path)) == ("", "", 0)
+
+
+def test_project_cache(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    files = [File("settings['FOO']", "a.py"), File("", "requirements.txt")]
+    with daemon(socket_path) as server, project(files):
+        run(capsys, client_args(socket_path))
+        setting_checker = server.get_setting_checker(Path.cwd())
+        run(capsys, client_args(socket_path))
+        assert server.get_setting_checker(Path.cwd()) is setting_checker
+        Path("pyproject.toml").write_text(
+            '[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', encoding="utf-8"
+        )
+        out, _, _ = run(capsys, client_args(socket_path, "a.py"))
+        assert server.get_setting_checker(Path.cwd()) is not setting_checker
+    assert not out
+
+
+def test_input_error(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    with daemon(socket_path), project(File(")", "a.py")):
+        out, err, code = run(capsys, client_args(socket_path))
+    assert not out
+    assert err == "a.py: Error: unmatched ')' (a.py, line 1)\n"
+    assert code == 2
+
+
+def test_invalid_arguments(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    with daemon(socket_path), project():
+        responses = _request(socket_path, ["--jobs", "foo"])
+    assert responses[-1] == b'{"error": "invalid arguments: --jobs foo"}\n'
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("read_request", [True, False])
+def test_closed_connection(capsys, tmp_path, read_request):
+    socket_path = tmp_path / "s.sock"
+    with socket.socket(socket.AF_UNIX) as server:
+        server.bind(str(socket_path))
+        server.listen()
+
+        def close():
+            connection, _ = server.accept()
+            with connection, connection.makefile("rb") as f:
+                if read_request:
+                    f.readline()
+                else:  # Closing with unread data resets the connection.
+                    while not connection.recv(1, socket.MSG_PEEK):
+                        pass
+
+        thread = Thread(target=close)
+        thread.start()
+        with project():
+            out, err, code = run(capsys, client_args(socket_path))
+        thread.join()
+    assert not out
+    assert err == "the daemon closed the connection unexpectedly\n"
+    assert code == 2
+
+
+def test_no_daemon(capsys, tmp_path):
+    with project(File("settings['FOO']", "a.py")):
+        out, err, code = run(capsys, client_args(tmp_path / "s.sock"))
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
+    assert not err
+    assert code == 1
+
+
+def test_serve(tmp_path, monkeypatch):
+    socket_path = tmp_path / "s.sock"
+    socket_path.write_text("", encoding="utf-8")  # Stale socket file.
+
+    def serve_forever(_):
+        assert socket_path.exists()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(LintServer, "serve_forever", serve_forever)
+    serve(socket_path, get_parser)
+    assert not socket_path.exists()
+
+
+def test_serve_sigterm(tmp_path, monkeypatch):
+    socket_path = tmp_path / "s.sock"
+    monkeypatch.setattr(
+        LintServer, "serve_forever", lambda _: os.kill(os.getpid(), signal.SIGTERM)
+    )
+    old_handler = signal.getsignal(signal.SIGTERM)
+    try:
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--start-daemon", "--socket", str(socket_path)])
+    finally:
+        signal.signal(signal.SIGTERM, old_handler)
+    assert excinfo.value.code == 0
+    assert not socket_path.exists()
+
+
+def test_serve_interrupt_cli(tmp_path, monkeypatch):
+    def serve_forever(_):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(LintServer, "serve_forever", serve_forever)
+    main(["--start-daemon", "--socket", str(tmp_path / "s.sock")])
+
+
+def test_serve_default_socket(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+    def serve_forever(_):
+        assert (tmp_path / "scrapy-lint.sock").exists()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(LintServer, "serve_forever", serve_forever)
+    main(["--start-daemon"])
+
+
+def test_serve_arguments(capsys):
+    _, err, code = run(capsys, ["--start-daemon", "a.py"])
+    assert "--start-daemon can only be combined with --socket" in err
+    assert code == 2
+
+
+def test_daemon_directory(capsys):
+    """A directory named daemon is linted."""
+    with project(File("settings['FOO']", "daemon/a.py")):
+        out, _, _ = run(capsys, ["daemon"])
+    assert out == "daemon/a.py:1:9: SCP27 unknown setting\n"
+
+
+def test_probe(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    with daemon(socket_path), project(File("settings['FOO']", "a.py")):
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(str(socket_path))
+        # Requests are handled in order, so the probe has been handled.
+        out, _, _ = run(capsys, client_args(socket_path))
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
+
+
+def test_serve_cli(capsys, tmp_path):
+    socket_path = tmp_path / "s.sock"
+    with daemon(socket_path):
+        _, err, code = run(capsys, ["--start-daemon", "--socket", str(socket_path)])
+    assert err == f"a daemon is already listening on {socket_path}\n"
+    assert code == 2
+
+
+def test_default_socket_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == Path("/run/user/1000/scrapy-lint.sock")
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    directory = tmp_path / f"scrapy-lint-{os.getuid()}"
+    assert default_socket_path() == directory / "daemon.sock"
+    assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+    assert default_socket_path() == directory / "daemon.sock"
+
+
+def test_default_socket_path_shared(capsys, tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    directory = tmp_path / f"scrapy-lint-{os.getuid()}"
+    directory.mkdir(mode=0o777)
+    directory.chmod(0o777)
+    message = f"{directory} is not a private directory of the current user"
+    with pytest.raises(DaemonError, match=message):
+        default_socket_path()
+    with project(File("settings['FOO']", "a.py")):
+        out, err, code = run(capsys, ["--daemon"])
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
+    assert err == f"{message}\n"
+    assert code == 1
+
+
+def test_default_socket_path_file(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    directory = tmp_path / f"scrapy-lint-{os.getuid()}"
+    directory.write_text("", encoding="utf-8")
+    with pytest.raises(DaemonError, match="File exists"):
+        default_socket_path()
+
+
+def test_linter_attribute():
+    import scrapy_lint  # noqa: PLC0415
+    from scrapy_lint.linter import Linter  # noqa: PLC0415
+
+    assert scrapy_lint.Linter is Linter
+    assert not hasattr(scrapy_lint, "Foo")
+
+
+def _request(socket_path: Path, args: list[str]) -> list[bytes]:
+    with socket.socket(socket.AF_UNIX) as client:
+        client.connect(str(socket_path))
+        request = {"cwd": str(Path.cwd()), "args": args}
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as f:
+            return f.readlines()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint import main
+from scrapy_lint.files import iter_python_files
+
+from . import File, project
+
+
+def python_files(path: str = ".") -> list[str]:
+    root = Path.cwd()
+    return sorted(
+        str(file.resolve().relative_to(root))
+        for file in iter_python_files(Path(path), root)
+    )
+
+
+def test_no_ignores():
+    files = [
+        File("", "a.py"),
+        File("", "b/c.py"),
+        File("", "b/.d/e.py"),
+        File("", "f.txt"),
+    ]
+    with project(files):
+        assert python_files() == ["a.py", "b/.d/e.py", "b/c.py"]
+
+
+def test_gitignore():
+    files = [
+        File("", "a.py"),
+        File("", "b.py"),
+        File("", "venv/c.py"),
+        File("", "d/venv/e.py"),
+        File("", "d/f.py"),
+        File("/a.py\nvenv/\n", ".gitignore"),
+    ]
+    with project(files):
+        assert python_files() == ["b.py", "d/f.py"]
+
+
+def test_nested_gitignore():
+    files = [
+        File("", "a.py"),
+        File("", "b/a.py"),
+        File("", "b/c/a.py"),
+        File("", "b/d.py"),
+        File("/a.py\n", "b/.gitignore"),
+        File("*.py\n!d.py\n", "e/.gitignore"),
+        File("", "e/d.py"),
+        File("", "e/f.py"),
+    ]
+    with project(files):
+        assert python_files() == ["a.py", "b/c/a.py", "b/d.py", "e/d.py"]
+
+
+def test_nested_gitignore_negation():
+    files = [
+        File("", "a.py"),
+        File("", "b/a.py"),
+        File("", "b/c.py"),
+        File("", "b/d/a.py"),
+        File("a.py\nc.py\n", ".gitignore"),
+        File("!a.py\n", "b/.gitignore"),
+        File("a.py\n", "b/d/.gitignore"),
+    ]
+    with project(files):
+        assert python_files() == ["b/a.py"]
+
+
+def test_git_info_exclude():
+    files = [
+        File("", "a.py"),
+        File("", "b.py"),
+        File("", ".git/c.py"),
+        File("a.py\n", ".git/info/exclude"),
+    ]
+    with project(files):
+        assert python_files() == ["b.py"]
+
+
+def test_git_root_above_project():
+    files = [
+        File("", "project/a.py"),
+        File("", "project/b.py"),
+        File("", "project/c/d.py"),
+        File("project/a.py\n", ".git/info/exclude"),
+        File("c/\n", ".gitignore"),
+    ]
+    with project(files) as directory:
+        root = Path(directory).resolve()
+        found = iter_python_files(root / "project", root / "project")
+        assert sorted(str(file.relative_to(root)) for file in found) == [
+            "project/b.py",
+        ]
+
+
+def test_subdirectory():
+    files = [
+        File("", "a/b/c.py"),
+        File("", "a/b/d.py"),
+        File("", "a/e/f.py"),
+        File("c.py\n", "a/.gitignore"),
+        File("e/\n", ".gitignore"),
+    ]
+    with project(files):
+        assert python_files("a/b") == ["a/b/d.py"]
+        assert python_files("a/e") == []
+
+
+def test_outside_project():
+    files = [
+        File("", "a/b.py"),
+        File("", "a/c.py"),
+        File("b.py\n", "a/.gitignore"),
+    ]
+    with project(files) as directory:
+        root = Path(directory).resolve()
+        found = iter_python_files(root / "a", root / "project")
+        assert sorted(str(file.relative_to(root)) for file in found) == ["a/c.py"]
+
+
+def test_pruning(monkeypatch):
+    files = [
+        File("", "a.py"),
+        File("", ".venv/lib/b.py"),
+        File(".venv/\n", ".gitignore"),
+    ]
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path).name)
+        return scandir(path)
+
+    with project(files):
+        monkeypatch.setattr(os, "scandir", recording_scandir)
+        assert python_files() == ["a.py"]
+        monkeypatch.undo()
+    assert ".venv" not in scanned
+    assert "lib" not in scanned
+
+
+def test_unreadable_directory(monkeypatch):
+    files = [File("", "a.py"), File("", "b/c.py")]
+    scandir = os.scandir
+
+    def failing_scandir(path):
+        if Path(path).name == "b":
+            raise PermissionError
+        return scandir(path)
+
+    with project(files):
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        assert python_files() == ["a.py"]
+        monkeypatch.undo()
+
+
+def test_unreadable_gitignore():
+    files = [
+        File("", "a.py"),
+        File(b"\xff", ".gitignore"),
+    ]
+    with project(files):
+        assert python_files() == ["a.py"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="no symlink support")
+def test_directory_symlink():
+    with project(File("", "a/b.py")):
+        Path("c").symlink_to("a", target_is_directory=True)
+        assert python_files() == ["a/b.py"]
+
+
+def test_cli(capsys):
+    files = [
+        File("settings['FOO']", "a.py"),
+        File("settings['FOO']", "b/c.py"),
+        File("c.py\n", "b/.gitignore"),
+    ]
+    with project(files), pytest.raises(SystemExit):
+        main([])
+    out, _ = capsys.readouterr()
+    assert out == "a.py:1:9: SCP27 unknown setting\n"
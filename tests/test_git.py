@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from . import File, project
+from .helpers import run
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git missing")
+
+SETTINGS_MODULE_ISSUES = (
+    "myproject/settings.py:1:0: SCP08 no project USER_AGENT\n"
+    "myproject/settings.py:1:0: SCP09 robots.txt ignored by default\n"
+    "myproject/settings.py:1:0: SCP10 incomplete project throttling\n"
+    "myproject/settings.py:1:0: SCP34 missing changing setting: "
+    "FEED_EXPORT_ENCODING changes from None to 'utf-8' in a future version of "
+    "scrapy\n"
+)
+FILES = [
+    File("[settings]\ndefault = myproject.settings\n", "scrapy.cfg"),
+    File("", "myproject/__init__.py"),
+    File("", "myproject/settings.py"),
+    File("settings['FOO']", "myproject/spiders/a.py"),
+    File("settings['BAR']", "myproject/spiders/b.py"),
+]
+
+
+def git(*args: str) -> None:
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.name=a",
+            "-c",
+            "user.email=a@example.com",
+            "-c",
+            "commit.gpgsign=false",
+            *args,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+def commit_all() -> None:
+    git("init", "-q")
+    git("add", "-A")
+    git("commit", "-q", "-m", "Initial commit")
+
+
+def test_since_unchanged(capsys):
+    with project(FILES):
+        commit_all()
+        assert run(capsys, ["--no-cache", "--since", "HEAD"]) == ("", "", 0)
+
+
+def test_since_changed_file(capsys):
+    with project(FILES):
+        commit_all()
+        Path("myproject/spiders/b.py").write_text("settings['BAZ']", encoding="utf-8")
+        out, _, _ = run(capsys, ["--no-cache", "--since", "HEAD"])
+    assert out == "myproject/spiders/b.py:1:9: SCP27 unknown setting\n"
+
+
+def test_since_untracked_file(capsys):
+    with project(FILES):
+        commit_all()
+        Path("myproject/spiders/c.py").write_text("settings['BAZ']", encoding="utf-8")
+        out, _, _ = run(capsys, ["--no-cache", "--since", "HEAD"])
+    assert out == "myproject/spiders/c.py:1:9: SCP27 unknown setting\n"
+
+
+def test_since_changed_requirements(capsys):
+    with project(FILES):
+        commit_all()
+        Path("requirements.txt").write_text("scrapy==2.13.3\n", encoding="utf-8")
+        out, _, _ = run(capsys, ["--no-cache", "--since", "HEAD"])
+    assert out == (
+        f"{SETTINGS_MODULE_ISSUES}"
+        "myproject/spiders/a.py:1:9: SCP27 unknown setting\n"
+        "myproject/spiders/b.py:1:9: SCP27 unknown setting\n"
+        "requirements.txt:1:0: SCP13 incomplete requirements freeze\n"
+    )
+
+
+def test_since_downgraded_requirements(capsys):
+    """Issues of Python files that depend on the requirements are reported
+    when only the requirements change."""
+    files = [
+        *FILES,
+        File("settings.getdict('ADDONS')", "myproject/spiders/c.py"),
+        File("scrapy==2.13.3\n", "requirements.txt"),
+    ]
+    with project(files):
+        commit_all()
+        Path("requirements.txt").write_text("scrapy==2.0.1\n", encoding="utf-8")
+        out, _, _ = run(capsys, ["--no-cache", "--since", "HEAD"])
+    assert (
+        "myproject/spiders/c.py:1:17: SCP29 setting needs upgrade: added in "
+        "scrapy 2.10.0\n"
+    ) in out
+
+
+def test_since_changed_pyproject(capsys):
+    with project(FILES):
+        commit_all()
+        Path("pyproject.toml").write_text("[tool.scrapy-lint]\n", encoding="utf-8")
+        out, _, _ = run(capsys, ["--no-cache", "--since", "HEAD"])
+    assert out == (
+        f"{SETTINGS_MODULE_ISSUES}"
+        "myproject/spiders/a.py:1:9: SCP27 unknown setting\n"
+        "myproject/spiders/b.py:1:9: SCP27 unknown setting\n"
+    )
+
+
+def test_diff(capsys):
+    with project(FILES):
+        commit_all()
+        Path("myproject/spiders/a.py").write_text("settings['BAZ']", encoding="utf-8")
+        Path("myproject/spiders/b.py").write_text("settings['BAZ']", encoding="utf-8")
+        Path("myproject/spiders/c.py").write_text("settings['BAZ']", encoding="utf-8")
+        git("add", "myproject/spiders/b.py")
+        out, _, _ = run(capsys, ["--no-cache", "--diff"])
+    assert out == "myproject/spiders/b.py:1:9: SCP27 unknown setting\n"
+
+
+def test_not_a_repository(capsys):
+    with project(FILES):
+        _, err, _ = run(capsys, ["--no-cache", "--since", "HEAD"])
+    assert "error: fatal: not a git repository" in err
+
+
+def test_unknown_ref(capsys):
+    with project(FILES):
+        commit_all()
+        _, err, _ = run(capsys, ["--no-cache", "--since", "foo"])
+    assert "error: fatal: bad revision 'foo'" in err
+
+
+def test_no_git(capsys, monkeypatch):
+    monkeypatch.setenv("PATH", "")
+    with project(FILES):
+        _, err, _ = run(capsys, ["--no-cache", "--diff"])
+    assert err.endswith("error: git is not installed\n")
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules only needed by some subsystems: YAML parsing of scrapinghub.yml,
+# requirement parsing, directory walking, worker processes, git, cache keys
+# and SARIF output.
+LAZY_MODULES = (
+    "concurrent.futures.process",
+    "importlib.metadata",
+    "packaging.requirements",
+    "pathspec",
+    "ruamel.yaml",
+    "subprocess",
+)
+
+# Cumulative import time of scrapy_lint.linter in microseconds. It is 100 to
+# 130 ms without bytecode caching on a typical machine, so that importing a
+# slow lazy dependency, e.g. pathspec, fails, while load on the machine does
+# not.
+IMPORT_TIME_BUDGET = 200_000
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of *module* and of
+    each module that importing it imports, measured with ``-X importtime``
+    in a new interpreter.
+
+    Modules that a bare interpreter imports, e.g. those of coverage
+    measurement started from the environment, are not included.
+    """
+    bare_modules = run_with_import_times("pass")
+    return {
+        name: cumulative
+        for name, cumulative in run_with_import_times(f"import {module}").items()
+        if name not in bare_modules
+    }
+
+
+def run_with_import_times(code: str) -> dict[str, int]:
+    # Do not start coverage measurement in the new interpreter.
+    env = {
+        name: value
+        for name, value in os.environ.items()
+        if not name.startswith(("COV_CORE_", "COVERAGE_"))
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["scrapy_lint", "scrapy_lint.linter"])
+def test_lazy_imports(module):
+    imported = import_times(module)
+    assert not [
+        name
+        for name in imported
+        if any(name == lazy or name.startswith(f"{lazy}.") for lazy in LAZY_MODULES)
+    ]
+
+
+def test_import_time_budget():
+    best = min(
+        import_times("scrapy_lint.linter")["scrapy_lint.linter"] for _ in range(5)
+    )
+    assert best < IMPORT_TIME_BUDGET
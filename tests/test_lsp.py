@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from io import BytesIO
+from pathlib import Path
+from threading import Thread
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from scrapy_lint import main
+from scrapy_lint.lsp import LanguageServer, read_message, write_message
+
+from . import File, project
+
+SCP27 = {
+    "range": {
+        "start": {"line": 0, "character": 9},
+        "end": {"line": 0, "character": 9},
+    },
+    "severity": 2,
+    "code": "SCP27",
+    "source": "scrapy-lint",
+    "message": "unknown setting",
+}
+
+
+def uri(path: str) -> str:
+    return (Path.cwd() / path).resolve().as_uri()
+
+
+def request(method: str, params: dict[str, Any] | None = None, id_: int = 0):
+    return {"id": id_, "method": method, "params": params or {}}
+
+
+def notification(method: str, params: dict[str, Any]):
+    return {"method": method, "params": params}
+
+
+def open_(path: str, text: str):
+    document = {"uri": uri(path), "languageId": "python", "version": 1, "text": text}
+    return notification("textDocument/didOpen", {"textDocument": document})
+
+
+def change(path: str, text: str):
+    return notification(
+        "textDocument/didChange",
+        {
+            "textDocument": {"uri": uri(path), "version": 2},
+            "contentChanges": [{"text": text}],
+        },
+    )
+
+
+def save(path: str):
+    return {"textDocument": {"uri": uri(path)}}
+
+
+def read_all(output: BytesIO) -> list[dict[str, Any]]:
+    output.seek(0)
+    messages = []
+    while (message := read_message(output)) is not None:
+        messages.append(message)
+    return messages
+
+
+def run(*messages: dict[str, Any]) -> list[dict[str, Any]]:
+    stream = BytesIO()
+    write_message(stream, request("initialize", {"rootUri": Path.cwd().as_uri()}))
+    for message in messages:
+        write_message(stream, message)
+    stream.seek(0)
+    output = BytesIO()
+    LanguageServer(output, debounce_delay=0).run(stream)
+    responses = read_all(output)
+    initialize = next(response for response in responses if response.get("id") == 0)
+    assert initialize["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+    responses.remove(initialize)
+    return responses
+
+
+def diagnostics(responses: list[dict[str, Any]]) -> list[tuple[str, list]]:
+    return [
+        (Path(response["params"]["uri"]).name, response["params"]["diagnostics"])
+        for response in responses
+        if response.get("method") == "textDocument/publishDiagnostics"
+    ]
+
+
+def test_open():
+    with project(File("", "a.py")):
+        responses = run(open_("a.py", "settings['FOO']"))
+    assert diagnostics(responses) == [("a.py", [SCP27])]
+
+
+def test_unsaved_changes():
+    with project(File("settings['FOO']", "a.py")):
+        responses = run(open_("a.py", ""), change("a.py", "settings['FOO']"))
+    assert diagnostics(responses) == [("a.py", []), ("a.py", [SCP27])]
+
+
+def test_debounce():
+    with project(File("", "a.py")):
+        stream = BytesIO()
+        write_message(stream, request("initialize"))
+        write_message(stream, open_("a.py", ""))
+        for text in ("s", "settings['FOO']"):
+            write_message(stream, change("a.py", text))
+        stream.seek(0)
+        output = BytesIO()
+        LanguageServer(output, debounce_delay=60).run(stream)
+        responses = read_all(output)
+    assert len(responses) == 3
+    assert diagnostics(responses) == [("a.py", []), ("a.py", [SCP27])]
+
+
+def test_debounce_timeout():
+    with project(File("", "a.py")):
+        read_fd, write_fd = os.pipe()
+        output = BytesIO()
+        server = LanguageServer(output, debounce_delay=0.01)
+        with os.fdopen(read_fd, "rb") as stream, os.fdopen(write_fd, "wb") as input_:
+            thread = Thread(target=server.run, args=(stream,))
+            thread.start()
+            write_message(input_, request("initialize"))
+            write_message(input_, open_("a.py", ""))
+            write_message(input_, change("a.py", "settings['FOO']"))
+            deadline = time.monotonic() + 10
+            while len(output.getvalue().split(b"Content-Length")) < 4:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            write_message(input_, notification("exit", {}))
+            thread.join()
+        responses = read_all(output)
+    assert diagnostics(responses) == [("a.py", []), ("a.py", [SCP27])]
+
+
+def test_detail_and_ignores():
+    files = [
+        File('[tool.scrapy-lint]\nignore = ["SCP27"]\n', "pyproject.toml"),
+        File("", "a.py"),
+    ]
+    with project(files):
+        responses = run(
+            open_("a.py", "settings['FOO']\nsettings.get('LOG_LEVEL', 'DEBUG')")
+        )
+    assert diagnostics(responses) == [("a.py", [])]
+
+
+def test_syntax_error():
+    with project(File("", "a.py")):
+        responses = run(
+            open_("a.py", "settings['FOO']"),
+            change("a.py", "settings['FOO'"),
+        )
+    assert diagnostics(responses) == [("a.py", [SCP27])]
+
+
+def test_other_files():
+    with project([File("", "a.txt"), File("", "scrapinghub.yml")]):
+        responses = run(
+            open_("a.txt", "settings['FOO']"),
+            open_("scrapinghub.yml", "stack: scrapy:2.13\nrequirements: {}"),
+        )
+    assert [
+        (name, [diagnostic["code"] for diagnostic in file_diagnostics])
+        for name, file_diagnostics in diagnostics(responses)
+    ] == [("a.txt", []), ("scrapinghub.yml", ["SCP20", "SCP23"])]
+
+
+def test_close():
+    with project(File("", "a.py")):
+        responses = run(
+            open_("a.py", "settings['FOO']"),
+            notification("textDocument/didClose", save("a.py")),
+        )
+    assert diagnostics(responses) == [("a.py", [SCP27]), ("a.py", [])]
+
+
+def test_unknown_method():
+    with project():
+        responses = run(request("foo", id_=1), notification("bar", {}))
+    assert responses == [
+        {"jsonrpc": "2.0", "id": 1, "error": {"code": -32601, "message": "unknown foo"}}
+    ]
+
+
+def test_exit():
+    with project(File("", "a.py")):
+        responses = run(
+            request("shutdown", id_=1),
+            notification("exit", {}),
+            open_("a.py", "settings['FOO']"),
+        )
+    assert responses == [{"jsonrpc": "2.0", "id": 1, "result": None}]
+
+
+def test_project_input_change():
+    files = [
+        File('[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', "pyproject.toml"),
+        File("", "a.py"),
+        File("", "b.py"),
+    ]
+    with project(files):
+        output = BytesIO()
+        server = LanguageServer(output, debounce_delay=0)
+        server.initialize({"rootPath": str(Path.cwd())})
+        server.did_open(open_("a.py", "settings['FOO']")["params"])
+        server.did_save(save("b.py"))
+        server.lint_pending()
+        Path("pyproject.toml").write_text("", encoding="utf-8")
+        server.did_change_watched_files({"changes": [{"uri": uri("pyproject.toml")}]})
+        server.lint_pending()
+        responses = read_all(output)
+    assert len(responses) == 2
+    assert diagnostics(responses) == [("a.py", []), ("a.py", [SCP27])]
+
+
+def test_requirements_change():
+    files = [
+        File("[settings]\ndefault = settings\n", "scrapy.cfg"),
+        File("", "settings.py"),
+        File("", "a.py"),
+    ]
+    with project(files):
+        output = BytesIO()
+        server = LanguageServer(output, debounce_delay=0)
+        server.initialize({"rootUri": Path.cwd().as_uri()})
+        server.did_open(open_("a.py", "")["params"])
+        server.did_open(open_("settings.py", "")["params"])
+        server.lint_pending()
+        Path("requirements.txt").write_text("scrapy==2.13.3\n", encoding="utf-8")
+        server.did_save(save("requirements.txt"))
+        server.lint_pending()
+        responses = read_all(output)
+    assert [name for name, _ in diagnostics(responses)] == [
+        "a.py",
+        "settings.py",
+        "a.py",
+        "settings.py",
+    ]
+
+
+def test_invalid_project():
+    with project(File("[tool.scrapy-lint", "pyproject.toml")):
+        responses = run(
+            open_("a.py", "settings['FOO']"),
+            notification("textDocument/didSave", save("pyproject.toml")),
+        )
+    assert [response["method"] for response in responses] == [
+        "window/showMessage",
+        "window/showMessage",
+    ]
+    assert responses[0]["params"]["type"] == 1
+
+
+def test_cli(monkeypatch):
+    with project(File("", "a.py")):
+        stdin = BytesIO()
+        write_message(stdin, request("initialize"))
+        write_message(stdin, open_("a.py", "settings['FOO']"))
+        stdin.seek(0)
+        stdout = BytesIO()
+        monkeypatch.setattr("sys.stdin", SimpleNamespace(buffer=stdin))
+        monkeypatch.setattr("sys.stdout", SimpleNamespace(buffer=stdout))
+        main(["--lsp"])
+    stdout.seek(0)
+    read_message(stdout)
+    message = read_message(stdout)
+    assert message is not None
+    assert message["params"]["diagnostics"] == [SCP27]
+
+
+def test_cli_arguments(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--lsp", "a.py"])
+    assert "--lsp cannot be combined with other arguments" in capsys.readouterr().err
+    assert excinfo.value.code == 2
+
+
+def test_lsp_directory(capsys):
+    """A directory named lsp is linted."""
+    with project(File("settings['FOO']", "lsp/a.py")), pytest.raises(SystemExit):
+        main(["lsp"])
+    assert capsys.readouterr().out == "lsp/a.py:1:9: SCP27 unknown setting\n"
+
+
+def test_content_length_headers():
+    body = json.dumps({"method": "foo"}).encode()
+    stream = BytesIO(
+        b"Content-Type: application/vscode-jsonrpc; charset=utf-8\r\n"
+        + f"content-length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    assert read_message(stream) == {"method": "foo"}
+    assert read_message(stream) is None
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint.cache import CACHE_DIR_NAME
+from scrapy_lint.linter import MonorepoLinter
+
+from . import File, project
+from .helpers import run
+
+FILES = [
+    File("[settings]\ndefault = a.settings\n", "a/scrapy.cfg"),
+    File('[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', "a/pyproject.toml"),
+    File("settings['FOO']\n", "a/a/spider.py"),
+    File("[settings]\ndefault = b.settings\n", "b/scrapy.cfg"),
+    File("settings['FOO']\n", "b/b/spider.py"),
+    File("scrapy==2.13.3\n", "b/requirements.txt"),
+    File("requirements:\n  file: requirements.txt\n", "b/scrapinghub.yml"),
+    File("settings['FOO']\nsettings['BAR']\n", "scripts/script.py"),
+]
+EXPECTED = (
+    "b/b/spider.py:1:9: SCP27 unknown setting\n"
+    "b/requirements.txt:1:0: SCP13 incomplete requirements freeze\n"
+    "b/scrapinghub.yml:1:0: SCP18 no root stack\n"
+    "scripts/script.py:1:9: SCP27 unknown setting\n"
+    "scripts/script.py:2:9: SCP27 unknown setting\n"
+)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_monorepo(capsys, monkeypatch, jobs):
+    """Each file is linted with the data of its nearest project, e.g. its
+    known settings, and files outside projects with that of the current
+    working directory."""
+    monkeypatch.setattr("scrapy_lint.linter.MIN_FILES_PER_JOB", 1)
+    with project(FILES):
+        assert run(capsys, ["--monorepo", "--jobs", str(jobs), "--no-cache"]) == (
+            EXPECTED,
+            "",
+            1,
+        )
+
+
+def test_paths(capsys):
+    with project(FILES):
+        out, _, _ = run(capsys, ["--monorepo", "b/b/spider.py", "scripts"])
+    assert out == (
+        "b/b/spider.py:1:9: SCP27 unknown setting\n"
+        "scripts/script.py:1:9: SCP27 unknown setting\n"
+        "scripts/script.py:2:9: SCP27 unknown setting\n"
+    )
+
+
+def test_cache(capsys):
+    with project(FILES) as directory:
+        assert run(capsys, ["--monorepo"]) == (EXPECTED, "", 1)
+        for root in ("a", "b", "."):
+            assert (Path(directory) / root / CACHE_DIR_NAME).exists()
+        assert run(capsys, ["--monorepo"]) == (EXPECTED, "", 1)
+
+
+def test_baseline(capsys):
+    with project(FILES):
+        run(capsys, ["--monorepo", "--write-baseline", "baseline.txt"])
+        baseline = Path("baseline.txt").read_text(encoding="utf-8")
+        assert len(baseline.splitlines()) == EXPECTED.count("\n")
+        Path("a/a/spider.py").write_text("settings['BAR']\n", encoding="utf-8")
+        out, _, _ = run(capsys, ["--monorepo", "--baseline", "baseline.txt"])
+    assert out == "a/a/spider.py:1:9: SCP27 unknown setting\n"
+
+
+def test_pickle():
+    """Project linters share their rule data, also in worker processes."""
+    with project(FILES):
+        linter = pickle.loads(pickle.dumps(MonorepoLinter([Path()])))
+    a, b, default = linter.project_linters()
+    assert a.node_dispatchers is b.node_dispatchers is default.node_dispatchers
+    assert a.node_dispatchers is linter.node_dispatchers
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+from itertools import islice
+from typing import Any
+
+import pytest
+
+from scrapy_lint import main
+from scrapy_lint.linter import Linter
+
+from . import File, project
+from .helpers import run
+
+FILES = [
+    File("settings['FOO']\nsettings.getbool('RETRY_TIMES')", "a.py"),
+    File("settings['BAR']", "b c.py"),
+]
+ISSUES = [
+    {
+        "code": "SCP27",
+        "summary": "unknown setting",
+        "detail": None,
+        "file": "a.py",
+        "line": 1,
+        "column": 9,
+    },
+    {
+        "code": "SCP32",
+        "summary": "wrong setting method",
+        "detail": "use getint()",
+        "file": "a.py",
+        "line": 2,
+        "column": 9,
+    },
+    {
+        "code": "SCP27",
+        "summary": "unknown setting",
+        "detail": None,
+        "file": "b c.py",
+        "line": 1,
+        "column": 9,
+    },
+]
+
+
+def test_jsonl(capsys):
+    with project(FILES):
+        out, err, code = run(capsys, ["--format", "jsonl"])
+    assert [json.loads(line) for line in out.splitlines()] == ISSUES
+    assert not err
+    assert code == 1
+
+
+def test_json(capsys):
+    with project(FILES):
+        out, err, code = run(capsys, ["--format", "json"])
+    assert json.loads(out) == ISSUES
+    assert not err
+    assert code == 1
+
+
+def test_json_no_issues(capsys):
+    with project(File("", "a.py")):
+        main(["--format", "json"])
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def sarif_results(log: dict[str, Any]) -> list[tuple[str, str, str, int, int]]:
+    (sarif_run,) = log["runs"]
+    rules = sarif_run["tool"]["driver"]["rules"]
+    results = []
+    for result in sarif_run["results"]:
+        assert rules[result["ruleIndex"]]["id"] == result["ruleId"]
+        (location,) = result["locations"]
+        location = location["physicalLocation"]
+        results.append(
+            (
+                result["ruleId"],
+                result["message"]["text"],
+                location["artifactLocation"]["uri"],
+                location["region"]["startLine"],
+                location["region"]["startColumn"],
+            )
+        )
+    return results
+
+
+def test_sarif(capsys):
+    with project(FILES):
+        out, err, code = run(capsys, ["--format", "sarif"])
+    log = json.loads(out)
+    assert log["version"] == "2.1.0"
+    driver = log["runs"][0]["tool"]["driver"]
+    assert driver["name"] == "scrapy-lint"
+    assert {
+        "id": "SCP27",
+        "shortDescription": {"text": "unknown setting"},
+        "helpUri": "https://scrapy-lint.readthedocs.io/en/latest/rules/scp27.html",
+    } in driver["rules"]
+    assert sarif_results(log) == [
+        ("SCP27", "unknown setting", "a.py", 1, 10),
+        ("SCP32", "wrong setting method: use getint()", "a.py", 2, 10),
+        ("SCP27", "unknown setting", "b%20c.py", 1, 10),
+    ]
+    assert log["runs"][0]["invocations"] == [
+        {"executionSuccessful": True, "toolExecutionNotifications": []}
+    ]
+    assert not err
+    assert code == 1
+
+
+@pytest.mark.parametrize("format_", ["jsonl", "json", "sarif"])
+def test_input_file_error(capsys, format_):
+    files = [File("settings['FOO']", "a.py"), File(")", "b.py")]
+    with project(files):
+        out, err, code = run(capsys, ["--format", format_])
+    assert err == "b.py: Error: unmatched ')' (b.py, line 1)\n"
+    assert code == 2
+    if format_ == "jsonl":
+        assert [json.loads(line)["file"] for line in out.splitlines()] == ["a.py"]
+        return
+    output = json.loads(out)
+    if format_ == "json":
+        assert [issue["file"] for issue in output] == ["a.py"]
+        return
+    assert [result[2] for result in sarif_results(output)] == ["a.py"]
+    assert output["runs"][0]["invocations"] == [
+        {
+            "executionSuccessful": False,
+            "toolExecutionNotifications": [
+                {"level": "error", "message": {"text": err[:-1]}}
+            ],
+        }
+    ]
+
+
+@pytest.mark.parametrize("format_", ["json", "sarif"])
+def test_interrupted(capsys, monkeypatch, format_):
+    lint = Linter.lint
+
+    def interrupted_lint(self):
+        yield from islice(lint(self), 1)
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(Linter, "lint", interrupted_lint)
+    with project(FILES), pytest.raises(KeyboardInterrupt):
+        main(["--format", format_])
+    output = json.loads(capsys.readouterr().out)
+    if format_ == "json":
+        assert output == ISSUES[:1]
+        return
+    assert len(sarif_results(output)) == 1
+    (invocation,) = output["runs"][0]["invocations"]
+    assert not invocation["executionSuccessful"]
+
+
+def test_invalid_format(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--format", "xml"])
+    assert "invalid choice: 'xml'" in capsys.readouterr().err
+    assert excinfo.value.code == 2
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from functools import cached_property
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint import main
+from scrapy_lint.context import Project
+from scrapy_lint.linter import (
+    Linter,
+    PythonIssueFinder,
+    _init_worker,
+    _lint_file_in_worker,
+)
+from scrapy_lint.profiling import Profiler
+
+from . import File, project
+
+FILES = [
+    File("[settings]\ndefault = settings\n", "scrapy.cfg"),
+    File("scrapy==2.13.3\n", "requirements.txt"),
+    File(
+        "stack: scrapy:2.13\nrequirements:\n  file: requirements.txt\n",
+        "scrapinghub.yml",
+    ),
+    File("BOT_NAME = 'a'\n", "settings.py"),
+    File("settings['FOO']\nresponse.urljoin('a')\n", "a.py"),
+]
+
+
+def test_profile(capsys):
+    with project(FILES):
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--profile", "--profile-json", "profile.json", "--daemon"])
+        entries = json.loads(Path("profile.json").read_text(encoding="utf-8"))
+    out, err = capsys.readouterr()
+    assert "a.py:1:9: SCP27 unknown setting\n" in out
+    assert excinfo.value.code == 1
+    counts = {(entry["kind"], entry["name"]): entry["count"] for entry in entries}
+    project_phases = {name for kind, name in counts if name.startswith("project.")}
+    assert {
+        "project.frozen_requirements",
+        "project.scrapy_cloud_config",
+        "project.scrapy_lint_options",
+    } <= project_phases
+    assert {
+        key: count for key, count in counts.items() if key[1] not in project_phases
+    } == {
+        ("phase", "project"): 1,
+        ("phase", "discovery"): 4,
+        ("phase", "read"): 4,
+        ("phase", "lint"): 4,
+        ("phase", "parse"): 2,
+        ("phase", "walk"): 19,
+        ("finder", "SettingModuleIssueFinder"): 1,
+        ("finder", "SettingIssueFinder"): 3,
+        ("finder", "find_get_first_by_index_issues"): 1,
+        ("finder", "LambdaCallbackIssueFinder"): 2,
+        ("finder", "OldSelectorIssueFinder"): 1,
+        ("finder", "RequestIssueFinder"): 1,
+        ("finder", "UnreachableDomainIssueFinder"): 1,
+        ("finder", "UrlInAllowedDomainsIssueFinder"): 1,
+        ("finder", "find_extract_then_index_issues"): 1,
+        ("finder", "find_url_join_issues"): 1,
+        ("finder", "ZyteCloudConfigIssueFinder"): 1,
+        ("finder", "RequirementsIssueFinder"): 1,
+    }
+    seconds = [entry["seconds"] for entry in entries]
+    assert seconds == sorted(seconds, reverse=True)
+    lines = err.splitlines()
+    assert lines[0].split() == ["kind", "name", "seconds", "count"]
+    assert len(lines) == len(entries) + 1
+    assert {tuple(line.split()[:2]) for line in lines[1:]} == set(counts)
+
+
+def test_project_phases():
+    """Each project phase only times the computation of its own property,
+    not of those it uses."""
+    computed = []
+    with project(FILES):
+        project_ = Project(Path.cwd())
+
+        @contextmanager
+        def measure(name):
+            before = set(vars(project_))
+            yield
+            computed.append((name, set(vars(project_)) - before))
+
+        project_.load(measure)
+    assert computed == [(name, {name}) for name, _ in computed]
+    assert {name for name, _ in computed} == {
+        name
+        for name in dir(Project)
+        if isinstance(getattr(Project, name), cached_property)
+    }
+
+
+def test_post_visit():
+    profiler = Profiler()
+    with project(File("def f():\n    settings['FOO']\n", "a.py")):
+        issues = list(Linter([Path("a.py")], profiler=profiler).lint())
+    assert [issue.code for issue in issues] == [27]
+    entry = profiler.entries["finder", "SettingIssueFinder.post_visit"]
+    assert entry.count == 1
+
+
+def test_worker():
+    profiler = Profiler(trace=True)
+    with project([File("", "a.py"), File("", "b.txt")]):
+        linter = Linter(profiler=profiler)
+        with linter.profile("foo"):
+            pass
+        _init_worker(linter)
+        issues, worker_profiler = _lint_file_in_worker(Path("b.txt").resolve())
+        assert not issues
+        assert worker_profiler is not None
+        assert worker_profiler.entries == {}
+        _, worker_profiler = _lint_file_in_worker(Path("a.py").resolve())
+    assert worker_profiler is not None
+    assert {name for _, name in worker_profiler.entries} == {
+        "read",
+        "lint",
+        "parse",
+        "walk",
+    }
+    assert len(worker_profiler.events) == 4
+    assert ("phase", "foo") in profiler.entries
+
+
+def test_profiler_settings():
+    with project(File("", "a.py")):
+        linter = Linter(profiler=Profiler())
+    assert linter.cache is None
+
+
+def test_no_profiler():
+    with project(File("", "a.py")):
+        linter = Linter()
+        finder = PythonIssueFinder(linter.setting_checker)
+    assert linter.profiler is None
+    assert all(
+        getattr(finder, "__qualname__", "") != "Profiler.wrap.<locals>.timed"
+        for finders in finder.finders.values()
+        for finder in finders
+    )
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_trace(capsys, monkeypatch, jobs):
+    monkeypatch.setattr("scrapy_lint.linter.MIN_FILES_PER_JOB", 1)
+    files = [*FILES, File("settings['BAR']\n", "b.py")]
+    with project(files):
+        with pytest.raises(SystemExit):
+            main(["--trace", "trace.json", "--jobs", jobs])
+        trace = json.loads(Path("trace.json").read_text(encoding="utf-8"))
+    assert not capsys.readouterr().err
+    events = trace["traceEvents"]
+    processes = {
+        event["pid"]: event["args"]["name"] for event in events if event["ph"] == "M"
+    }
+    spans = [event for event in events if event["ph"] == "X"]
+    assert {span["pid"] for span in spans} == set(processes)
+    main_pid = next(pid for pid, name in processes.items() if name == "scrapy-lint")
+    file_spans = {
+        (span["name"], span["args"]["file"]) for span in spans if "file" in span["args"]
+    }
+    assert file_spans == {
+        *(
+            ("read", path)
+            for path in ("a.py", "b.py", "requirements.txt", "settings.py")
+        ),
+        *(
+            ("lint", path)
+            for path in ("a.py", "b.py", "requirements.txt", "settings.py")
+        ),
+        *(("parse", path) for path in ("a.py", "b.py", "settings.py")),
+        *(("walk", path) for path in ("a.py", "b.py", "settings.py")),
+        ("read", "scrapinghub.yml"),
+        ("lint", "scrapinghub.yml"),
+    }
+    names = {span["name"] for span in spans if span["pid"] == main_pid}
+    assert {"project", "project.frozen_requirements", "discovery"} <= names
+    if jobs == "1":
+        assert set(processes) == {main_pid}
+    else:
+        assert len(processes) > 1
+        assert "parse" not in names
+    assert {span["cat"] for span in spans} == {"phase"}
+    assert all(span["dur"] >= 0 for span in spans)
+    project_spans = [span for span in spans if span["name"].startswith("project.")]
+    assert [span["name"] for span in project_spans] == [
+        f"project.{name}" for name in Project.LOAD_ORDER
+    ]
+    assert all(span["dur"] > 0 for span in project_spans)
+    # Project phases do not nest.
+    for previous, span in zip(project_spans, project_spans[1:]):
+        assert previous["ts"] + previous["dur"] <= span["ts"]
@@ -1,6 +1,10 @@
 from collections.abc import Sequence
+from pathlib import Path
 
-from . import NO_ISSUE, ExpectedIssue, File, cases, iter_issues
+from scrapy_lint.context import RequirementsDocument, YAMLDocument
+from scrapy_lint.linter import Linter
+
+from . import NO_ISSUE, ExpectedIssue, File, cases, iter_issues, project
 from .helpers import check_project
 
 
@@ -524,3 +528,38 @@ CASES = [
 @cases(CASES)
 def test(files, expected, options):
     check_project(files, expected, options)
+
+
+def test_parsed_once(monkeypatch):
+    """scrapinghub.yml and the requirements file are parsed once, for both
+    the project data and their own checks, unless linted with a different
+    content."""
+    parsed = []
+    for document_class in (YAMLDocument, RequirementsDocument):
+        parse = document_class.parse
+
+        def recording_parse(text, parse=parse):
+            parsed.append(text)
+            return parse(text)
+
+        monkeypatch.setattr(document_class, "parse", staticmethod(recording_parse))
+    config = f"stack: {LATEST_KNOWN_STACK}\nrequirements:\n  file: requirements.txt\n"
+    files = [
+        File(config, "scrapinghub.yml"),
+        File("", "scrapy.cfg"),
+        File("scrapy==2.11.2\n", "requirements.txt"),
+    ]
+    with project(files):
+        linter = Linter([Path()], jobs=1, cache=False)
+        assert list(linter.lint())
+        assert sorted(parsed) == sorted([config, "scrapy==2.11.2\n"])
+        list(linter.lint_source("stack: scrapy:2.13\n", "scrapinghub.yml"))
+        list(linter.lint_source("scrapy==2.13.3\n", "requirements.txt"))
+    assert parsed[-2:] == ["stack: scrapy:2.13\n", "scrapy==2.13.3\n"]
+
+
+def test_undecodable():
+    with project([File(b"\xff", "scrapinghub.yml"), File("", "scrapy.cfg")]):
+        linter = Linter([Path()], jobs=1, cache=False)
+        assert linter.project.scrapy_cloud_document is None
+        assert linter.project.scrapy_cloud_config is None
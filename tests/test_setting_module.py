@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import ast
+from collections import Counter
 from collections.abc import Sequence
 from inspect import cleandoc
+from pathlib import Path
 
+from scrapy_lint.finders.settings import SettingModuleIssueFinder
+from scrapy_lint.issues import UNKNOWN_SETTING, codes_of
+from scrapy_lint.linter import PYTHON_RULES, Linter, NodeDispatcher, PythonRule
 from tests.helpers import check_project
 from tests.settings import default_issues
 
-from . import NO_ISSUE, Cases, ExpectedIssue, File, cases, iter_issues
+from . import NO_ISSUE, Cases, ExpectedIssue, File, cases, iter_issues, project
 
 FALSE_BOOLS = ("False", "'false'", "0")
 TRUE_BOOLS = ("True", "'true'", "1")
@@ -633,6 +638,31 @@ CASES: Cases = (
             """,
         )
     ),
+    # Settings defined in the body of compound statements other than class and
+    # function definitions must be taken into account.
+    *(
+        (
+            [
+                File("[settings]\na=a", path="scrapy.cfg"),
+                File(cleandoc(code), path=PATH),
+            ],
+            (*default_issues(PATH, exclude=8),),
+            {},
+        )
+        for code in (
+            """
+            if True:
+                USER_AGENT = 'a@example.com'
+            """,
+            """
+            for _ in ():
+                pass
+            else:
+                with open(__file__):
+                    USER_AGENT = 'a@example.com'
+            """,
+        )
+    ),
     # Settings defined in any branch of a try-except block must be taken into
     # account.
     (
@@ -678,3 +708,82 @@ def test(
     options,
 ):
     check_project(files, expected, options)
+
+
+def test_single_walk(monkeypatch):
+    visits: Counter[ast.AST] = Counter()
+
+    def count(node):
+        visits[node] += 1
+        return ()
+
+    node_types = tuple(
+        cls
+        for cls in vars(ast).values()
+        if isinstance(cls, type) and issubclass(cls, ast.AST)
+    )
+    counting_rule = PythonRule(lambda *_: count, codes_of(UNKNOWN_SETTING), node_types)
+
+    def node_dispatcher(_self, codes):
+        return NodeDispatcher(codes, (*PYTHON_RULES, counting_rule))
+
+    built = []
+    init = SettingModuleIssueFinder.__init__
+
+    def recording_init(self, *args, **kwargs):
+        built.append(self)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(Linter, "node_dispatcher", node_dispatcher)
+    monkeypatch.setattr(SettingModuleIssueFinder, "__init__", recording_init)
+    code = "if True:\n    USER_AGENT = 'a'\n    settings.get('FOO')\n"
+    files = [
+        File("[settings]\na=a", path="scrapy.cfg"),
+        File(code, path=PATH),
+        File(code, path="b.py"),
+    ]
+    with project(files):
+        issues = list(Linter([Path(PATH), Path("b.py")], jobs=1, cache=False).lint())
+    assert {str(issue.file) for issue in issues} == {PATH, "b.py"}
+    assert len(built) == 1
+    # Modules and expression contexts are not dispatched.
+    expected = [
+        type(node)
+        for node in ast.walk(ast.parse(code))
+        if not isinstance(node, (ast.expr_context, ast.Module))
+    ]
+    visited = [type(node) for node, count in visits.items() for _ in range(count)]
+    assert Counter(visited) == Counter(expected * 2)
+
+
+def test_issue_order():
+    """Issues of setting module rules come before other issues."""
+    files = [
+        File("[settings]\ndefault = a\n", path="scrapy.cfg"),
+        File("settings.get('BAR')\nFOO = 1\n", path=PATH),
+    ]
+    with project(files):
+        issues = list(Linter([Path(PATH)], jobs=1, cache=False).lint())
+    lines = [str(issue) for issue in issues]
+    assert lines[0] == "a.py:2:0: SCP27 unknown setting"
+    assert lines[-2:] == [
+        "a.py:1:13: SCP27 unknown setting",
+        "a.py:1:9: SCP40 unneeded setting get",
+    ]
+
+
+def test_body_level_issue_order():
+    """Issues of the module body, e.g. redefined settings, come before those
+    of the statements of the module."""
+    files = [
+        File("[settings]\ndefault = a\n", path="scrapy.cfg"),
+        File("FOO = 1\nFOO = 2\n", path=PATH),
+    ]
+    with project(files):
+        issues = list(Linter([Path(PATH)], jobs=1, cache=False).lint())
+    lines = [str(issue) for issue in issues]
+    assert lines[:3] == [
+        "a.py:2:0: SCP07 redefined setting: seen first at line 1",
+        "a.py:1:0: SCP27 unknown setting",
+        "a.py:2:0: SCP27 unknown setting",
+    ]
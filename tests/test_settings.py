@@ -1,7 +1,19 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from pathlib import Path
 
+import pytest
+
+from scrapy_lint.context import Context, InMemoryProject
+from scrapy_lint.data.settings import (
+    MAX_AUTOMATIC_SUGGESTIONS,
+    MIN_AUTOMATIC_SUGGESTION_SCORE,
+    SETTINGS,
+)
+from scrapy_lint.finders.settings import SettingChecker, SettingNameIndex
 from scrapy_lint.finders.settings.types import TYPE_CHECKERS
 from scrapy_lint.settings import SettingType
 from tests.helpers import check_project
@@ -17,6 +29,53 @@ def test_type_checkers():
         )
 
 
+def brute_force_suggestions(checker: SettingChecker, unknown_name: str) -> list[str]:
+    matches = []
+    for candidate in checker.additional_known_settings | set(SETTINGS):
+        if (
+            candidate.endswith("_BASE") and not unknown_name.endswith("_BASE")
+        ) or not checker.is_supported_setting(candidate):
+            continue
+        ratio = SequenceMatcher(None, unknown_name, candidate).ratio()
+        if ratio >= MIN_AUTOMATIC_SUGGESTION_SCORE:
+            matches.append((candidate, ratio))
+    matches.sort(key=lambda x: (-x[1], x[0]))
+    return [m[0] for m in matches[:MAX_AUTOMATIC_SUGGESTIONS]]
+
+
+@pytest.mark.parametrize(
+    "files",
+    [
+        {},
+        {"requirements.txt": "scrapy==2.0.1\n"},
+        {"requirements.txt": "scrapy==2.13.3\nscrapy-zyte-api==0.30.0\n"},
+    ],
+)
+def test_suggestion_index(files):
+    project = InMemoryProject(
+        Path("/project"),
+        files=files,
+        options={"known-settings": ["MY_SETTING", "MY_OTHER_SETTING_BASE"]},
+    )
+    checker = SettingChecker(Context(project))
+    names = ["", "A", "MY_SETING", "MY_OTHER_SETTING", "DOWNLOADER_MIDDLEWARES_BAS"]
+    for name in sorted(SETTINGS)[::50]:
+        names += [name[1:], name[:-1], name.lower(), f"{name}S", f"X{name}_BASE"]
+    for name in names:
+        assert checker.suggest_names(name) == brute_force_suggestions(checker, name)
+    assert checker.suggest_names(names[-1]) is checker.suggest_names(names[-1])
+
+
+def test_suggestion_index_threads():
+    """An index can be shared by threads."""
+    index = SettingNameIndex(SETTINGS)
+    names = [f"{name}S" for name in sorted(SETTINGS)[::8]] * 4
+    min_ratios = [MIN_AUTOMATIC_SUGGESTION_SCORE] * len(names)
+    expected = list(map(index.matches, names, min_ratios))
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(index.matches, names, min_ratios)) == expected
+
+
 CASES: Cases = (
     # Python file checks
     *(
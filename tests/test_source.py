@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from scrapy_lint.context import InMemoryProject
+from scrapy_lint.errors import InputFileError
+from scrapy_lint.linter import Linter
+
+from . import File, project
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+ROOT = Path("/project")
+
+
+def lint_source(
+    source: str | bytes,
+    path: str,
+    files: Mapping[str, str | bytes] | None = None,
+    options: dict | None = None,
+) -> list[str]:
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected disk access")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for name in ("exists", "is_file", "open", "read_bytes", "read_text", "resolve"):
+            monkeypatch.setattr(Path, name, fail)
+        monkeypatch.setattr(os, "chdir", fail)
+        in_memory = InMemoryProject(ROOT, files=dict(files or {}), options=options)
+        linter = Linter(project=in_memory)
+        return [str(issue) for issue in linter.lint_source(source, path)]
+
+
+def test_python():
+    assert lint_source("settings['FOO']", "a/b.py") == [
+        "a/b.py:1:9: SCP27 unknown setting"
+    ]
+
+
+def test_bytes():
+    assert lint_source(b"settings['FOO']", "/project/a.py") == [
+        "a.py:1:9: SCP27 unknown setting"
+    ]
+
+
+def test_options():
+    source = "settings['FOO']\nsettings['BAR']\nsettings['BAZ']"
+    options = {"known-settings": ["FOO"], "per-file-ignores": {"a.py": ["SCP27"]}}
+    assert lint_source(source, "b.py", options=options) == [
+        "b.py:2:9: SCP27 unknown setting",
+        "b.py:3:9: SCP27 unknown setting",
+    ]
+    assert not lint_source(source, "a.py", options=options)
+
+
+def test_pyproject():
+    pyproject = '[tool.scrapy-lint]\nignore = ["SCP27"]\n'
+    files = {"pyproject.toml": pyproject}
+    assert not lint_source("settings['FOO']", "a.py", files=files)
+
+
+def test_requirements():
+    files = {"requirements.txt": "scrapy==2.0.1\n"}
+    assert lint_source("settings.getdict('ADDONS')", "a.py", files=files) == [
+        "a.py:1:17: SCP29 setting needs upgrade: added in scrapy 2.10.0"
+    ]
+
+
+def test_requirements_file_option():
+    files: dict[str, str | bytes] = {
+        "reqs/prod.txt": b"scrapy==2.0.1\n",
+        "requirements.txt": "",
+    }
+    options = {"requirements_file": "reqs/prod.txt"}
+    assert lint_source(
+        "settings.getdict('ADDONS')", "a.py", files=files, options=options
+    ) == ["a.py:1:17: SCP29 setting needs upgrade: added in scrapy 2.10.0"]
+    assert lint_source(b"\xff", "reqs/prod.txt", files=files, options=options) == []
+
+
+def test_setting_module():
+    files = {
+        "scrapy.cfg": "[settings]\ndefault = myproject.settings\n",
+        "myproject/settings.py": "",
+    }
+    issues = lint_source("", "myproject/settings.py", files=files)
+    assert "myproject/settings.py:1:0: SCP08 no project USER_AGENT" in issues
+    assert not lint_source("", "myproject/spiders.py", files=files)
+
+
+def test_scrapinghub():
+    files = {
+        "scrapinghub.yml": "requirements:\n  file: requirements.txt\n",
+        "requirements.txt": "",
+    }
+    assert lint_source(files["scrapinghub.yml"], "scrapinghub.yml", files) == [
+        "scrapinghub.yml:1:0: SCP18 no root stack",
+    ]
+    assert lint_source("", "requirements.txt", files=files) == [
+        "requirements.txt:1:0: SCP13 incomplete requirements freeze",
+    ]
+
+
+def test_other_file():
+    assert not lint_source("settings['FOO']", "a.txt")
+
+
+@pytest.mark.parametrize(
+    ("source", "message"),
+    [
+        (")", "/project/a.py: Error: unmatched ')' (a.py, line 1)"),
+        (b"\xff", "'utf-8' codec can't decode byte 0xff in position 0"),
+    ],
+)
+def test_input_error(source, message):
+    with pytest.raises(InputFileError) as excinfo:
+        lint_source(source, "a.py")
+    assert message in str(excinfo.value)
+
+
+def test_unsaved_file():
+    with project([File("settings['FOO']", "a.py")]):
+        linter = Linter()
+        assert not list(linter.lint_source("", "a.py"))
+        issues = linter.lint_source("settings['BAR']", "b.py")
+        assert [str(issue) for issue in issues] == ["b.py:1:9: SCP27 unknown setting"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint.cache import CACHE_DIR_NAME
+
+from . import File, project
+from .helpers import run
+
+FILES = [
+    File("[settings]\ndefault = myproject.settings\n", "scrapy.cfg"),
+    File("", "myproject/settings.py"),
+]
+
+
+def set_stdin(monkeypatch, source: bytes) -> None:
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(source)))
+
+
+def test_stdin(capsys, monkeypatch):
+    with project(File("settings['FOO']", "a.py")) as directory:
+        set_stdin(monkeypatch, b"settings['BAR']")
+        out, err, _ = run(capsys, ["-"])
+        assert not (Path(directory) / CACHE_DIR_NAME).exists()
+    assert out == "stdin.py:1:9: SCP27 unknown setting\n"
+    assert not err
+
+
+def test_stdin_filename(capsys, monkeypatch):
+    """The virtual path determines whether the source is a setting module
+    and which rules are ignored."""
+    args = ["-", "--stdin-filename", "myproject/settings.py"]
+    with project(FILES):
+        set_stdin(monkeypatch, b"")
+        out, _, _ = run(capsys, args)
+    assert "myproject/settings.py:1:0: SCP08 no project USER_AGENT\n" in out
+    options = {"per-file-ignores": {"myproject/settings.py": ["SCP08"]}}
+    with project(FILES, options):
+        set_stdin(monkeypatch, b"")
+        out, _, _ = run(capsys, args)
+    assert "SCP08" not in out
+
+
+def test_baseline(capsys, monkeypatch):
+    with project(File("settings['FOO']", "a.py")):
+        run(capsys, ["--write-baseline", "baseline.txt"])
+        args = ["-", "--stdin-filename", "a.py", "--baseline", "baseline.txt"]
+        set_stdin(monkeypatch, b"settings['FOO']\nsettings['BAR']")
+        out, _, _ = run(capsys, args)
+    assert out == "a.py:2:9: SCP27 unknown setting\n"
+
+
+def test_monorepo(capsys, monkeypatch):
+    files = [
+        File("[settings]\ndefault = a.settings\n", "a/scrapy.cfg"),
+        File('[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', "a/pyproject.toml"),
+    ]
+    args = ["--monorepo", "-", "--stdin-filename", "a/a/spider.py"]
+    with project(files):
+        set_stdin(monkeypatch, b"settings['FOO']\nsettings['BAR']")
+        out, _, _ = run(capsys, args)
+    assert out == "a/a/spider.py:2:9: SCP27 unknown setting\n"
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["-", "a.py"], "- cannot be combined with other FILES"),
+        (
+            ["-", "--write-baseline", "baseline.txt"],
+            "--write-baseline cannot be used with standard input",
+        ),
+    ],
+)
+def test_invalid_args(capsys, monkeypatch, args, message):
+    with project():
+        set_stdin(monkeypatch, b"")
+        _, err, _ = run(capsys, args)
+    assert message in err
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import io
+import time
+from pathlib import Path
+
+import pytest
+
+from scrapy_lint import get_parser, main
+from scrapy_lint.watch import Watcher
+
+from . import File, project
+
+
+def start_watcher(args: list[str] | None = None) -> tuple[Watcher, io.StringIO]:
+    output = io.StringIO()
+    watcher = Watcher(get_parser().parse_args(["--watch", *(args or [])]), output)
+    watcher.start()
+    return watcher, output
+
+
+def read(output: io.StringIO) -> list[str]:
+    lines = output.getvalue().splitlines()
+    output.seek(0)
+    output.truncate()
+    return lines
+
+
+def test_python_file(capsys):
+    files = [File("settings['FOO']\n", "a.py"), File("settings['BAR']\n", "b.py")]
+    with project(files):
+        watcher, output = start_watcher()
+        assert read(output) == [
+            "a.py:1:9: SCP27 unknown setting",
+            "b.py:1:9: SCP27 unknown setting",
+        ]
+        assert not watcher.poll()
+        Path("a.py").write_text(
+            "settings['LOG_LEVEL']\nsettings['BAZ']\n", encoding="utf-8"
+        )
+        assert watcher.poll()
+        assert read(output) == [
+            "- a.py:1:9: SCP27 unknown setting",
+            "+ a.py:2:9: SCP27 unknown setting",
+        ]
+    assert capsys.readouterr().err.splitlines()[-1] == "2 issues, watching for changes"
+
+
+def test_moved_issue():
+    """Issues moved by changes to other lines are not reported again."""
+    with project(File("settings['FOO']\n", "a.py")):
+        watcher, output = start_watcher()
+        read(output)
+        Path("a.py").write_text("\n\nsettings['FOO']\n", encoding="utf-8")
+        assert watcher.poll()
+        assert not read(output)
+
+
+def test_new_and_removed_files():
+    with project(File("settings['FOO']\n", "a.py")):
+        watcher, output = start_watcher()
+        read(output)
+        Path("b.py").write_text("settings['BAR']\n", encoding="utf-8")
+        Path("a.py").unlink()
+        assert watcher.poll()
+        assert read(output) == [
+            "- a.py:1:9: SCP27 unknown setting",
+            "+ b.py:1:9: SCP27 unknown setting",
+        ]
+
+
+def test_project_input():
+    """Changes to project inputs reload the project data, and lint files
+    that depend on it again."""
+    files = [
+        File("[settings]\ndefault = settings\n", "scrapy.cfg"),
+        File("USER_AGENT = 'Jane'\n", "settings.py"),
+        File("settings['FOO']\n", "a.py"),
+        File("settings['BAR']\n", "b.py"),
+        File("scrapy==2.13.3\n", "requirements.txt"),
+    ]
+    with project(files):
+        watcher, output = start_watcher()
+        assert "a.py:1:9: SCP27 unknown setting" in read(output)
+        Path("pyproject.toml").write_text(
+            '[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', encoding="utf-8"
+        )
+        assert watcher.poll()
+        assert read(output) == ["- a.py:1:9: SCP27 unknown setting"]
+
+
+def test_requirements():
+    """Changes to the requirements report the issues of all files again."""
+    files = [
+        File("settings.getdict('ADDONS')\n", "a.py"),
+        File("scrapy==2.13.3\n", "requirements.txt"),
+    ]
+    with project(files):
+        watcher, output = start_watcher()
+        read(output)
+        Path("requirements.txt").write_text("scrapy==2.0.1\n", encoding="utf-8")
+        assert watcher.poll()
+        assert "+ a.py:1:17: SCP29 setting needs upgrade: added in scrapy 2.10.0" in (
+            read(output)
+        )
+        Path("requirements.txt").write_text("scrapy==2.13.3\n", encoding="utf-8")
+        Path("a.py").unlink()
+        assert watcher.poll()
+        assert "- a.py:1:17: SCP29 setting needs upgrade: added in scrapy 2.10.0" in (
+            read(output)
+        )
+
+
+def test_monorepo():
+    files = [
+        File("[settings]\ndefault = a.settings\n", "a/scrapy.cfg"),
+        File("settings['FOO']\n", "a/a/spider.py"),
+        File("settings['FOO']\n", "script.py"),
+    ]
+    with project(files):
+        watcher, output = start_watcher(["--monorepo"])
+        read(output)
+        Path("a/pyproject.toml").write_text(
+            '[tool.scrapy-lint]\nknown-settings = ["FOO"]\n', encoding="utf-8"
+        )
+        assert watcher.poll()
+        assert read(output) == ["- a/a/spider.py:1:9: SCP27 unknown setting"]
+
+
+def test_input_error(capsys):
+    """Issues are kept until an unparsable file is fixed."""
+    with project(File("settings['FOO']\n", "a.py")):
+        watcher, output = start_watcher()
+        read(output)
+        Path("a.py").write_text("settings['FOO'\n", encoding="utf-8")
+        assert watcher.poll()
+        assert not read(output)
+        assert "a.py: Error:" in capsys.readouterr().err
+        Path("a.py").write_text("settings['FOO']\nsettings['BAR']\n", encoding="utf-8")
+        assert watcher.poll()
+        assert read(output) == ["+ a.py:2:9: SCP27 unknown setting"]
+        Path("pyproject.toml").write_text("[", encoding="utf-8")
+        assert watcher.poll()
+        assert "pyproject.toml: Error:" in capsys.readouterr().err
+
+
+def test_main(capsys, monkeypatch):
+    calls = []
+
+    def sleep(seconds):
+        calls.append(seconds)
+        if len(calls) > 1:
+            raise KeyboardInterrupt
+        Path("a.py").write_text("", encoding="utf-8")
+
+    monkeypatch.setattr(time, "sleep", sleep)
+    with project(File("settings['FOO']\n", "a.py")):
+        main(["--watch", "--no-cache"])
+    out, _ = capsys.readouterr()
+    assert out.splitlines() == [
+        "a.py:1:9: SCP27 unknown setting",
+        "- a.py:1:9: SCP27 unknown setting",
+    ]
+
+
+def test_main_error(capsys):
+    with project(File("[", "pyproject.toml")), pytest.raises(SystemExit) as excinfo:
+        main(["--watch"])
+    assert excinfo.value.code == 2
+    assert "pyproject.toml: Error:" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["-"], "--watch cannot be used with standard input or --write-baseline"),
+        (
+            ["--write-baseline", "a.txt"],
+            "--watch cannot be used with standard input or --write-baseline",
+        ),
+        (["--format", "json"], "--watch only supports the text format"),
+        (["--diff"], "not allowed with argument"),
+    ],
+)
+def test_invalid_args(capsys, args, message):
+    with project(), pytest.raises(SystemExit):
+        main(["--watch", *args])
+    assert message in capsys.readouterr().err